@@ -15,6 +15,7 @@ sys.path.insert(0, 'src')
 
 import os
 import json
+from collections import namedtuple
 from pathlib import Path
 from datetime import datetime
 import numpy as np
@@ -22,7 +23,7 @@ import numpy as np
 from translation import ErrorInjector
 from evaluation import HuggingFaceEmbedding, EvaluationEngine
 from analysis import GraphGenerator, StatisticsCalculator, ResultExporter
-from turing_machine import TuringMachine
+from turing_machine import TuringMachine, load_tm_config
 
 print("=" * 80)
 print("COMPREHENSIVE EXPERIMENT SUITE")
@@ -40,6 +41,14 @@ experiment_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 experiment_dir = f'results/experiments/exp_{experiment_timestamp}'
 os.makedirs(experiment_dir, exist_ok=True)
 
+# Lightweight record types for the per-case result streams
+TMRecord = namedtuple('TMRecord', 'machine input output steps halted')
+ErrorInjectionRecord = namedtuple(
+    'ErrorInjectionRecord',
+    'sentence_id original corrupted error_rate_requested error_rate_actual '
+    'words_changed chars_changed'
+)
+
 print(f"Experiment timestamp: {experiment_timestamp}")
 print(f"Output directory: {experiment_dir}")
 print()
@@ -55,24 +64,26 @@ print()
 
 tm_results = []
 
+# Preload every machine definition once; TMs are built from the parsed configs
+machine_configs = {
+    path.stem: load_tm_config(str(path))
+    for path in sorted(Path('machines').glob('*.json'))
+}
+
 # Test 1: Unary Increment
 print("Test 1.1: Unary Increment")
 print("-" * 80)
 try:
-    tm = TuringMachine.from_config_file('machines/unary_increment.json')
+    tm = TuringMachine(machine_configs['unary_increment'])
 
     test_cases = ["1", "11", "111", "1111", "11111"]
     for tape_input in test_cases:
         tm.load_tape(tape_input)
         result = tm.run(max_steps=1000)
 
-        tm_results.append({
-            'machine': 'unary_increment',
-            'input': tape_input,
-            'output': result.final_tape,
-            'steps': result.steps_taken,
-            'halted': result.halted
-        })
+        tm_results.append(TMRecord(
+            'unary_increment', tape_input, result.final_tape, result.steps_taken, result.halted
+        ))
 
         print(f"  Input: {tape_input:5s} → Output: {result.final_tape:6s} (Steps: {result.steps_taken})")
 
@@ -86,20 +97,16 @@ print()
 print("Test 1.2: Binary Increment")
 print("-" * 80)
 try:
-    tm = TuringMachine.from_config_file('machines/binary_increment.json')
+    tm = TuringMachine(machine_configs['binary_increment'])
 
     test_cases = ["0", "1", "10", "11", "101", "111", "1111"]
     for tape_input in test_cases:
         tm.load_tape(tape_input)
         result = tm.run(max_steps=1000)
 
-        tm_results.append({
-            'machine': 'binary_increment',
-            'input': tape_input,
-            'output': result.final_tape,
-            'steps': result.steps_taken,
-            'halted': result.halted
-        })
+        tm_results.append(TMRecord(
+            'binary_increment', tape_input, result.final_tape, result.steps_taken, result.halted
+        ))
 
         # Convert to decimal for verification
         try:
@@ -118,7 +125,7 @@ print()
 # Save TM results
 tm_output = f"{experiment_dir}/turing_machine_results.json"
 with open(tm_output, 'w') as f:
-    json.dump(tm_results, f, indent=2)
+    json.dump([r._asdict() for r in tm_results], f, indent=2)
 print(f"✅ Turing Machine results saved: {tm_output}")
 print()
 
@@ -133,14 +140,13 @@ print()
 
 # Load sample sentences
 sentences_file = 'data/input/sample_sentences.txt'
-sample_sentences = []
 
 print(f"Loading sentences from: {sentences_file}")
-with open(sentences_file, 'r') as f:
-    for line in f:
-        line = line.strip()
-        if line and not line.startswith('#') and len(line.split()) >= 15:
-            sample_sentences.append(line)
+# Read the whole file at once and filter in a single pass
+sample_sentences = [
+    line for line in map(str.strip, Path(sentences_file).read_text(encoding='utf-8').splitlines())
+    if line and not line.startswith('#') and len(line.split()) >= 15
+]
 
 print(f"Loaded {len(sample_sentences)} valid sentences (≥15 words each)")
 print()
@@ -162,15 +168,10 @@ for idx, sentence in enumerate(test_sentences, 1):
         corrupted = injector.inject_errors(sentence, error_rate)
         stats = injector.get_error_statistics(sentence, corrupted)
 
-        error_injection_results.append({
-            'sentence_id': idx,
-            'original': sentence,
-            'corrupted': corrupted,
-            'error_rate_requested': error_rate,
-            'error_rate_actual': stats['actual_error_rate'],
-            'words_changed': stats['words_changed'],
-            'chars_changed': stats['chars_changed']
-        })
+        error_injection_results.append(ErrorInjectionRecord(
+            idx, sentence, corrupted, error_rate,
+            stats['actual_error_rate'], stats['words_changed'], stats['chars_changed']
+        ))
 
         if error_rate in [0.0, 0.3, 0.5]:  # Show samples
             print(f"  Rate {error_rate*100:3.0f}%: {corrupted[:60]}...")
@@ -178,7 +179,7 @@ for idx, sentence in enumerate(test_sentences, 1):
 print()
 error_output = f"{experiment_dir}/error_injection_results.json"
 with open(error_output, 'w') as f:
-    json.dump(error_injection_results, f, indent=2)
+    json.dump([r._asdict() for r in error_injection_results], f, indent=2)
 print(f"✅ Error injection results saved: {error_output}")
 print()
 
@@ -243,9 +244,13 @@ semantic_results = []
 print("Evaluating semantic drift across scenarios...")
 print("-" * 80)
 
-for scenario in simulated_scenarios:
-    result = engine.evaluate(base_sentence, scenario['text'], error_rate=scenario['error_rate'])
+scenario_results = engine.evaluate_batch(
+    [base_sentence] * len(simulated_scenarios),
+    [scenario['text'] for scenario in simulated_scenarios],
+    [scenario['error_rate'] for scenario in simulated_scenarios],
+)
 
+for scenario, result in zip(simulated_scenarios, scenario_results):
     semantic_results.append({
         'scenario': scenario['name'],
         'error_rate': scenario['error_rate'],
@@ -274,38 +279,57 @@ print("-" * 80)
 large_scale_results = []
 error_rates_detailed = np.linspace(0.0, 0.5, 11)  # 0%, 5%, 10%, ..., 50%
 
+
+# Simulated translation degradation, one transform per error-rate bucket
+# (in a real scenario, translations would go through Claude CLI)
+def _simulate_minor(text):
+    return text  # Minor changes
+
+
+def _simulate_moderate(text):
+    return text.replace('the', 'a').replace('and', '&')  # Replace some words
+
+
+def _simulate_significant(text):
+    words = text.split()
+    return ' '.join(words[:len(words)//2])  # Truncate
+
+
+simulated_transforms = [_simulate_minor, _simulate_moderate, _simulate_significant]
+rate_buckets = np.digitize(error_rates_detailed, [0.2, 0.4])
+
 for sent_idx, original_sentence in enumerate(sample_sentences[:10], 1):  # First 10 sentences
     print(f"\nProcessing sentence {sent_idx}/10...")
+    word_count = len(original_sentence.split())
 
-    for error_rate in error_rates_detailed:
+    corrupted_texts = []
+    simulated_translations = []
+    for error_rate, bucket in zip(error_rates_detailed, rate_buckets):
         # Inject errors
         injector = ErrorInjector(seed=42 + sent_idx * 1000 + int(error_rate * 1000))
         corrupted = injector.inject_errors(original_sentence, error_rate)
 
-        # Simulate translation (in real scenario, would go through Claude CLI)
-        # For this demo, we'll simulate degradation proportional to error rate
-        if error_rate < 0.2:
-            simulated_translation = corrupted  # Minor changes
-        elif error_rate < 0.4:
-            # Moderate changes - replace some words
-            simulated_translation = corrupted.replace('the', 'a').replace('and', '&')
-        else:
-            # Significant changes
-            words = corrupted.split()
-            simulated_translation = ' '.join(words[:len(words)//2])  # Truncate
-
-        # Evaluate
-        result = engine.evaluate(original_sentence, simulated_translation, error_rate=error_rate)
+        # Simulate degradation proportional to error rate
+        corrupted_texts.append(corrupted)
+        simulated_translations.append(simulated_transforms[bucket](corrupted))
+
+    # Evaluate all error rates for this sentence in one embedding batch
+    batch_results = engine.evaluate_batch(
+        [original_sentence] * len(simulated_translations),
+        simulated_translations,
+        list(error_rates_detailed),
+    )
 
+    for error_rate, corrupted, result in zip(error_rates_detailed, corrupted_texts, batch_results):
         large_scale_results.append({
             'sentence_id': sent_idx,
             'original': original_sentence,
             'error_rate': float(error_rate),
             'corrupted': corrupted,
-            'translation': simulated_translation,
+            'translation': result.final_text,
             'cosine_distance': float(result.cosine_distance),
             'euclidean_distance': float(result.euclidean_distance),
-            'word_count': len(original_sentence.split())
+            'word_count': word_count
         })
 
 print()
@@ -7,7 +7,6 @@ Provides tools for analyzing translation results:
 - Result export (CSV, JSON)
 """
 
-from .graph_generator import GraphGenerator
 from .statistics import StatisticsCalculator
 from .exporter import ResultExporter
 
@@ -16,3 +15,12 @@ __all__ = [
     "StatisticsCalculator",
     "ResultExporter",
 ]
+
+
+def __getattr__(name):
+    # GraphGenerator pulls in matplotlib, so only import it when requested
+    if name == "GraphGenerator":
+        from .graph_generator import GraphGenerator
+
+        return GraphGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,18 @@
 """
 Result Exporter
 
-Exports analysis results to various formats (CSV, JSON).
+Exports analysis results to various formats (CSV, JSON, NPZ).
 """
 
 import csv
+import hashlib
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
+import numpy as np
+
 
 class ResultExporter:
     """
@@ -29,7 +32,8 @@ class ResultExporter:
             output_path: Path to save the CSV file
 
         Raises:
-            ValueError: If data list is empty
+            ValueError: If data list is empty, or a record has fields the
+                        first record lacks
             IOError: If file cannot be written
         """
         if not data:
@@ -42,11 +46,25 @@ class ResultExporter:
         # Get all keys from first item (assuming consistent structure)
         fieldnames = list(data[0].keys())
 
+        # Pre-build row tuples so the writer doesn't do a dict lookup per cell;
+        # fields missing from the header are rejected (as DictWriter does)
+        # rather than silently dropped
+        known = set(fieldnames)
+        rows = []
+        for record in data:
+            extra = record.keys() - known
+            if extra:
+                raise ValueError(
+                    "Record contains fields not in fieldnames: "
+                    + ", ".join(sorted(map(repr, extra)))
+                )
+            rows.append(tuple(record.get(key, "") for key in fieldnames))
+
         try:
             with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(rows)
         except Exception as e:
             raise IOError(f"Failed to write CSV file: {str(e)}") from e
 
@@ -166,6 +184,87 @@ class ResultExporter:
 
         return formatted
 
+    @staticmethod
+    def export_embeddings_npz(
+        texts: List[str], embeddings: np.ndarray, output_path: str
+    ) -> None:
+        """
+        Export embedding vectors to a compressed NPZ file.
+
+        Embeddings are stored as float16 in a binary archive, with a small
+        JSON sidecar (``<output_path>.index.json``) mapping a text hash to
+        its row in the embedding matrix.
+
+        Args:
+            texts: Texts the embeddings were generated from
+            embeddings: Embedding matrix of shape (len(texts), dim)
+            output_path: Path to save the NPZ file
+
+        Raises:
+            ValueError: If inputs are empty or lengths do not match
+            IOError: If files cannot be written
+        """
+        if not texts:
+            raise ValueError("Cannot export empty embeddings")
+
+        embeddings = np.asarray(embeddings)
+        if embeddings.ndim != 2 or embeddings.shape[0] != len(texts):
+            raise ValueError(
+                f"Embeddings must have shape ({len(texts)}, dim), "
+                f"got {embeddings.shape}"
+            )
+
+        # Ensure output directory exists
+        output_path = _npz_path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        index = {_text_hash(text): row for row, text in enumerate(texts)}
+
+        try:
+            np.savez_compressed(output_path, embs=embeddings.astype(np.float16))
+            with open(_index_path(output_path), "w", encoding="utf-8") as f:
+                json.dump(index, f)
+        except Exception as e:
+            raise IOError(f"Failed to write embeddings file: {str(e)}") from e
+
+    @staticmethod
+    def load_embeddings_npz(input_path: str) -> Tuple[Dict[str, int], np.ndarray]:
+        """
+        Load embeddings written by export_embeddings_npz.
+
+        Args:
+            input_path: Path to the NPZ file (".npz" is appended if missing,
+                as on export)
+
+        Returns:
+            Tuple of (index mapping text hash to row, embedding matrix)
+
+        Raises:
+            FileNotFoundError: If the NPZ file or its index is missing
+        """
+        input_path = _npz_path(input_path)
+
+        with open(_index_path(input_path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+
+        with np.load(input_path) as archive:
+            embeddings = archive["embs"]
+
+        return index, embeddings
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """
+        Get the key used to look up a text in an embedding index.
+
+        Args:
+            text: Text to hash
+
+        Returns:
+            Truncated SHA-256 hex digest
+        """
+        return _text_hash(text)
+
     @staticmethod
     def export_summary_statistics(
         stats: Dict[str, Any], output_path: str
@@ -202,3 +301,21 @@ class ResultExporter:
                 json.dump(export_data, f, indent=2)
         except Exception as e:
             raise IOError(f"Failed to write statistics file: {str(e)}") from e
+
+
+def _text_hash(text: str) -> str:
+    """Hash text into a short, stable embedding index key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _npz_path(path: str) -> Path:
+    """Get an NPZ path with the suffix np.savez_compressed would append."""
+    path = Path(path)
+    if path.suffix != ".npz":
+        path = path.with_name(path.name + ".npz")
+    return path
+
+
+def _index_path(npz_path: Path) -> Path:
+    """Get the JSON index sidecar path for an NPZ file."""
+    return npz_path.with_name(npz_path.name + ".index.json")
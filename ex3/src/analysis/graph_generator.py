@@ -6,10 +6,28 @@ Creates visualizations for analysis results, including:
 - Trend lines and statistical overlays
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib import rcParams
+from matplotlib import style as mpl_style
+from matplotlib.figure import Figure
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Sequence, Tuple, Union
+
+# Plot data may be passed as plain lists or NumPy arrays
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+# Styling shared by every plot (applied in GraphGenerator.__init__)
+PLOT_RC_PARAMS = {
+    "axes.labelsize": 12,
+    "axes.labelweight": "bold",
+    "axes.titlesize": 14,
+    "axes.titleweight": "bold",
+    "figure.titlesize": 14,
+    "figure.titleweight": "bold",
+    "legend.framealpha": 0.9,
+    "axes.grid": True,
+    "grid.alpha": 0.3,
+}
 
 
 class GraphGenerator:
@@ -28,15 +46,39 @@ class GraphGenerator:
             style: Matplotlib style to use for plots
         """
         try:
-            plt.style.use(style)
+            mpl_style.use(style)
         except:
             # Fallback to default if style not available
-            plt.style.use("default")
+            mpl_style.use("default")
+
+        # Shared text/grid styling, set once instead of per setter call
+        rcParams.update(PLOT_RC_PARAMS)
+
+        # Single figure reused (cleared) across plots to avoid repeated
+        # figure construction/teardown; created lazily on first use
+        self._fig: Optional[Figure] = None
+
+    def _get_figure(self, figsize: Tuple[float, float]) -> Figure:
+        """
+        Get the shared figure, cleared and resized for a new plot.
+
+        Args:
+            figsize: Figure size in inches (width, height)
+
+        Returns:
+            Empty figure ready for new axes
+        """
+        if self._fig is None:
+            self._fig = Figure(figsize=figsize)
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(figsize)
+        return self._fig
 
     def generate_scatter_plot(
         self,
-        error_rates: List[float],
-        distances: List[float],
+        error_rates: ArrayLike,
+        distances: ArrayLike,
         output_path: str,
         title: str = "Semantic Drift vs. Error Rate",
         xlabel: str = "Spelling Error Rate",
@@ -50,7 +92,7 @@ class GraphGenerator:
         Args:
             error_rates: List of error rates (x-axis)
             distances: List of corresponding distances (y-axis)
-            output_path: Path to save the plot (PNG)
+            output_path: Path to save the plot (PNG or SVG)
             title: Plot title
             xlabel: X-axis label
             ylabel: Y-axis label
@@ -66,57 +108,61 @@ class GraphGenerator:
                 f"got {len(error_rates)} and {len(distances)}"
             )
 
-        if not error_rates:
+        if len(error_rates) == 0:
             raise ValueError("Cannot create plot with empty data")
 
+        # Convert once and compute the data bounds used by trend and limits
+        x_arr = np.asarray(error_rates, dtype=np.float64)
+        y_arr = np.asarray(distances, dtype=np.float64)
+        er_min, er_max = float(x_arr.min()), float(x_arr.max())
+        d_min, d_max = float(y_arr.min()), float(y_arr.max())
+
         # Create figure and axis
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = self._get_figure((10, 6))
+        ax = fig.add_subplot()
 
         # Create scatter plot
-        ax.scatter(error_rates, distances, alpha=0.6, s=50, c="blue", label="Data points")
+        ax.scatter(x_arr, y_arr, alpha=0.6, s=50, c="blue", label="Data points")
 
-        # Add trend line if requested
-        if show_trend and len(error_rates) > 1:
-            z = np.polyfit(error_rates, distances, 1)
-            p = np.poly1d(z)
-            x_trend = np.linspace(min(error_rates), max(error_rates), 100)
+        # Add trend line if requested (a straight line only needs its endpoints)
+        if show_trend and len(x_arr) > 1:
+            (slope, intercept), = _fit_lines(x_arr, y_arr)
+            trend_label = f"Trend: y={slope:.4f}x+{intercept:.4f}"
             ax.plot(
-                x_trend,
-                p(x_trend),
+                [er_min, er_max],
+                [slope * er_min + intercept, slope * er_max + intercept],
                 "r--",
                 alpha=0.8,
                 linewidth=2,
-                label=f"Trend: y={z[0]:.4f}x+{z[1]:.4f}",
+                label=trend_label,
             )
 
         # Styling
-        ax.set_xlabel(xlabel, fontsize=12, fontweight="bold")
-        ax.set_ylabel(ylabel, fontsize=12, fontweight="bold")
-        ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
-        ax.legend(loc="best", framealpha=0.9)
-        ax.grid(True, alpha=0.3)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title, pad=20)
+        ax.legend(loc="best")
 
         # Format axes
-        ax.set_xlim(-0.02, max(error_rates) + 0.02)
-        ax.set_ylim(min(0, min(distances) - 0.02), max(distances) + 0.02)
+        ax.set_xlim(-0.02, er_max + 0.02)
+        ax.set_ylim(min(0, d_min - 0.02), d_max + 0.02)
 
         # Tight layout
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save figure
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=dpi, bbox_inches="tight")
-        plt.close()
+        _save_figure(fig, output_path, dpi)
 
     def generate_multi_metric_plot(
         self,
-        error_rates: List[float],
-        cosine_distances: List[float],
-        euclidean_distances: List[float],
+        error_rates: ArrayLike,
+        cosine_distances: ArrayLike,
+        euclidean_distances: ArrayLike,
         output_path: str,
         title: str = "Semantic Drift Analysis (Multiple Metrics)",
         dpi: int = 300,
+        trend_cos: Optional[Tuple[float, float]] = None,
+        trend_euc: Optional[Tuple[float, float]] = None,
     ) -> None:
         """
         Generate a plot comparing multiple distance metrics.
@@ -125,9 +171,11 @@ class GraphGenerator:
             error_rates: List of error rates (x-axis)
             cosine_distances: List of cosine distances
             euclidean_distances: List of Euclidean distances
-            output_path: Path to save the plot (PNG)
+            output_path: Path to save the plot (PNG or SVG)
             title: Plot title
             dpi: Resolution in dots per inch
+            trend_cos: Optional precomputed (slope, intercept) for cosine
+            trend_euc: Optional precomputed (slope, intercept) for Euclidean
 
         Raises:
             ValueError: If data lists have different lengths or are empty
@@ -137,51 +185,58 @@ class GraphGenerator:
         ):
             raise ValueError("All data lists must have the same length")
 
-        if not error_rates:
+        if len(error_rates) == 0:
             raise ValueError("Cannot create plot with empty data")
 
         # Create figure with subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig = self._get_figure((16, 6))
+        ax1, ax2 = fig.subplots(1, 2)
+
+        # Trend lines are straight, so only their endpoints are evaluated
+        x_trend = [min(error_rates), max(error_rates)]
+
+        # Fit any missing trends together against one shared design matrix
+        if len(error_rates) > 1 and (trend_cos is None or trend_euc is None):
+            fitted_cos, fitted_euc = _fit_lines(
+                error_rates, cosine_distances, euclidean_distances
+            )
+            trend_cos = fitted_cos if trend_cos is None else trend_cos
+            trend_euc = fitted_euc if trend_euc is None else trend_euc
 
         # Cosine distance plot
         ax1.scatter(error_rates, cosine_distances, alpha=0.6, s=50, c="blue")
         if len(error_rates) > 1:
-            z1 = np.polyfit(error_rates, cosine_distances, 1)
-            p1 = np.poly1d(z1)
-            x_trend = np.linspace(min(error_rates), max(error_rates), 100)
-            ax1.plot(x_trend, p1(x_trend), "r--", alpha=0.8, linewidth=2)
-        ax1.set_xlabel("Spelling Error Rate", fontsize=12, fontweight="bold")
-        ax1.set_ylabel("Cosine Distance", fontsize=12, fontweight="bold")
-        ax1.set_title("Cosine Distance", fontsize=13, fontweight="bold")
-        ax1.grid(True, alpha=0.3)
+            z1 = trend_cos
+            ax1.plot(
+                x_trend, [z1[0] * x + z1[1] for x in x_trend], "r--", alpha=0.8, linewidth=2
+            )
+        ax1.set_xlabel("Spelling Error Rate")
+        ax1.set_ylabel("Cosine Distance")
+        ax1.set_title("Cosine Distance", fontsize=13)
 
         # Euclidean distance plot
         ax2.scatter(error_rates, euclidean_distances, alpha=0.6, s=50, c="green")
         if len(error_rates) > 1:
-            z2 = np.polyfit(error_rates, euclidean_distances, 1)
-            p2 = np.poly1d(z2)
-            x_trend = np.linspace(min(error_rates), max(error_rates), 100)
-            ax2.plot(x_trend, p2(x_trend), "r--", alpha=0.8, linewidth=2)
-        ax2.set_xlabel("Spelling Error Rate", fontsize=12, fontweight="bold")
-        ax2.set_ylabel("Euclidean Distance", fontsize=12, fontweight="bold")
-        ax2.set_title("Euclidean Distance", fontsize=13, fontweight="bold")
-        ax2.grid(True, alpha=0.3)
-
-        # Overall title
-        fig.suptitle(title, fontsize=14, fontweight="bold", y=1.02)
+            z2 = trend_euc
+            ax2.plot(
+                x_trend, [z2[0] * x + z2[1] for x in x_trend], "r--", alpha=0.8, linewidth=2
+            )
+        ax2.set_xlabel("Spelling Error Rate")
+        ax2.set_ylabel("Euclidean Distance")
+        ax2.set_title("Euclidean Distance", fontsize=13)
 
-        # Tight layout
-        plt.tight_layout()
+        # Overall title (kept inside the canvas; savefig does not re-fit bounds)
+        fig.suptitle(title)
+
+        # Tight layout, reserving the top strip for the suptitle
+        fig.tight_layout(rect=(0, 0, 1, 0.95))
 
         # Save figure
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=dpi, bbox_inches="tight")
-        plt.close()
+        _save_figure(fig, output_path, dpi)
 
     def generate_histogram(
         self,
-        distances: List[float],
+        distances: ArrayLike,
         output_path: str,
         title: str = "Distribution of Semantic Distances",
         xlabel: str = "Cosine Distance",
@@ -193,7 +248,7 @@ class GraphGenerator:
 
         Args:
             distances: List of distances
-            output_path: Path to save the plot (PNG)
+            output_path: Path to save the plot (PNG or SVG)
             title: Plot title
             xlabel: X-axis label
             bins: Number of histogram bins
@@ -202,11 +257,12 @@ class GraphGenerator:
         Raises:
             ValueError: If distances list is empty
         """
-        if not distances:
+        if len(distances) == 0:
             raise ValueError("Cannot create histogram with empty data")
 
         # Create figure and axis
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = self._get_figure((10, 6))
+        ax = fig.add_subplot()
 
         # Create histogram
         n, bins, patches = ax.hist(
@@ -224,17 +280,64 @@ class GraphGenerator:
         )
 
         # Styling
-        ax.set_xlabel(xlabel, fontsize=12, fontweight="bold")
-        ax.set_ylabel("Frequency", fontsize=12, fontweight="bold")
-        ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
-        ax.legend(loc="best", framealpha=0.9)
-        ax.grid(True, alpha=0.3, axis="y")
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel("Frequency")
+        ax.set_title(title, pad=20)
+        ax.legend(loc="best")
+        ax.grid(False, axis="x")
 
         # Tight layout
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save figure
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=dpi, bbox_inches="tight")
-        plt.close()
+        _save_figure(fig, output_path, dpi)
+
+
+def _fit_lines(x: ArrayLike, *ys: ArrayLike) -> np.ndarray:
+    """
+    Fit least-squares lines y = slope * x + intercept for several y series.
+
+    All series share the same x, so the (N, 2) design matrix is built once
+    and solved in a single np.linalg.lstsq call with one column per series.
+
+    Args:
+        x: Independent variable
+        *ys: One or more dependent variables, each the same length as x
+
+    Returns:
+        Array of shape (len(ys), 2) with rows of (slope, intercept)
+    """
+    x_arr = np.asarray(x, dtype=np.float64)
+    design = np.column_stack([x_arr, np.ones_like(x_arr)])
+    targets = np.column_stack([np.asarray(y, dtype=np.float64) for y in ys])
+    solution, _, _, _ = np.linalg.lstsq(design, targets, rcond=None)
+    return solution.T
+
+
+# zlib level for PNG output; plots are mostly flat color, so lighter
+# compression is much faster at a negligible file-size cost
+PNG_COMPRESS_LEVEL = 3
+
+
+def _save_figure(fig: Figure, output_path: str, dpi: int) -> None:
+    """
+    Save a figure, creating parent directories as needed.
+
+    Args:
+        fig: Figure to save
+        output_path: Path to save the plot
+        dpi: Resolution in dots per inch
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    suffix = output_path.suffix.lower()
+    if suffix == ".png":
+        fig.savefig(
+            output_path, dpi=dpi, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL}
+        )
+    elif suffix == ".svg":
+        # Vector output: resolution does not apply
+        fig.savefig(output_path)
+    else:
+        fig.savefig(output_path, dpi=dpi)
@@ -5,9 +5,19 @@ Provides statistical analysis for translation results.
 """
 
 import numpy as np
-from typing import List, Tuple
+from typing import Sequence, Tuple, Union
 from dataclasses import dataclass
 
+# Inputs may be passed as plain lists or NumPy arrays
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+
+# Two-sided z critical values for common confidence levels
+Z_VALUES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+
+# Sample size from which the normal approximation replaces the t-distribution
+LARGE_SAMPLE_SIZE = 30
+
 
 @dataclass
 class TrendResult:
@@ -35,7 +45,7 @@ class StatisticsCalculator:
     """
 
     @staticmethod
-    def calculate_correlation(x: List[float], y: List[float]) -> float:
+    def calculate_correlation(x: ArrayLike, y: ArrayLike) -> float:
         """
         Calculate Pearson correlation coefficient.
 
@@ -61,7 +71,7 @@ class StatisticsCalculator:
         return float(correlation)
 
     @staticmethod
-    def calculate_trend(x: List[float], y: List[float]) -> TrendResult:
+    def calculate_trend(x: ArrayLike, y: ArrayLike) -> TrendResult:
         """
         Calculate linear trend and statistics.
 
@@ -84,21 +94,24 @@ class StatisticsCalculator:
             raise ValueError("Need at least 2 data points for trend analysis")
 
         # Convert to numpy arrays
-        x_arr = np.array(x)
-        y_arr = np.array(y)
+        x_arr = np.asarray(x, dtype=np.float64)
+        y_arr = np.asarray(y, dtype=np.float64)
 
-        # Calculate linear regression
-        coefficients = np.polyfit(x_arr, y_arr, 1)
-        slope, intercept = coefficients
+        # Closed-form degree-1 least squares from centered sums; avoids the
+        # Vandermonde/SVD in np.polyfit and the separate np.corrcoef pass
+        dx = x_arr - x_arr.mean()
+        dy = y_arr - y_arr.mean()
+        sxx = dx @ dx
+        syy = dy @ dy
+        sxy = dx @ dy
 
-        # Calculate R-squared
-        y_pred = slope * x_arr + intercept
-        ss_res = np.sum((y_arr - y_pred) ** 2)
-        ss_tot = np.sum((y_arr - np.mean(y_arr)) ** 2)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0.0
+        slope = sxy / sxx if sxx != 0 else 0.0
+        intercept = y_arr.mean() - slope * x_arr.mean()
 
-        # Calculate correlation
-        correlation = np.corrcoef(x_arr, y_arr)[0, 1]
+        # For a least-squares line, R² is the squared Pearson correlation
+        denom = np.sqrt(sxx * syy)
+        correlation = sxy / denom if denom != 0 else np.nan
+        r_squared = correlation**2 if syy != 0 and sxx != 0 else 0.0
 
         return TrendResult(
             slope=float(slope),
@@ -108,7 +121,7 @@ class StatisticsCalculator:
         )
 
     @staticmethod
-    def calculate_summary_stats(data: List[float]) -> dict:
+    def calculate_summary_stats(data: ArrayLike) -> dict:
         """
         Calculate summary statistics for a dataset.
 
@@ -121,25 +134,27 @@ class StatisticsCalculator:
         Raises:
             ValueError: If data list is empty
         """
-        if not data:
+        if len(data) == 0:
             raise ValueError("Cannot calculate statistics for empty data")
 
-        data_arr = np.array(data)
+        # Sort once: min, max and all quantiles are read off the sorted array
+        sorted_arr = np.sort(np.asarray(data, dtype=np.float64))
+        mean = sorted_arr.mean()
 
         return {
-            "mean": float(np.mean(data_arr)),
-            "median": float(np.median(data_arr)),
-            "std": float(np.std(data_arr)),
-            "min": float(np.min(data_arr)),
-            "max": float(np.max(data_arr)),
-            "q25": float(np.percentile(data_arr, 25)),
-            "q75": float(np.percentile(data_arr, 75)),
+            "mean": float(mean),
+            "median": _sorted_quantile(sorted_arr, 0.50),
+            "std": float(np.sqrt(np.mean((sorted_arr - mean) ** 2))),
+            "min": float(sorted_arr[0]),
+            "max": float(sorted_arr[-1]),
+            "q25": _sorted_quantile(sorted_arr, 0.25),
+            "q75": _sorted_quantile(sorted_arr, 0.75),
             "count": len(data),
         }
 
     @staticmethod
     def calculate_confidence_interval(
-        data: List[float], confidence: float = 0.95
+        data: ArrayLike, confidence: float = 0.95
     ) -> Tuple[float, float]:
         """
         Calculate confidence interval for the mean.
@@ -154,7 +169,7 @@ class StatisticsCalculator:
         Raises:
             ValueError: If data list is empty or confidence is invalid
         """
-        if not data:
+        if len(data) == 0:
             raise ValueError("Cannot calculate confidence interval for empty data")
 
         if not 0 < confidence < 1:
@@ -164,11 +179,28 @@ class StatisticsCalculator:
         mean = np.mean(data_arr)
         std_err = np.std(data_arr, ddof=1) / np.sqrt(len(data_arr))
 
-        # Use t-distribution for small samples
-        from scipy import stats
+        if len(data_arr) >= LARGE_SAMPLE_SIZE and confidence in Z_VALUES:
+            # Normal approximation for large samples (avoids importing scipy)
+            critical_value = Z_VALUES[confidence]
+        else:
+            # Use t-distribution for small samples
+            from scipy import stats
 
-        df = len(data_arr) - 1
-        t_value = stats.t.ppf((1 + confidence) / 2, df)
+            df = len(data_arr) - 1
+            critical_value = stats.t.ppf((1 + confidence) / 2, df)
 
-        margin = t_value * std_err
+        margin = critical_value * std_err
         return float(mean - margin), float(mean + margin)
+
+
+def _sorted_quantile(sorted_arr: np.ndarray, q: float) -> float:
+    """
+    Linearly interpolated quantile of an already-sorted array.
+
+    Matches np.percentile's default ("linear") method without re-sorting.
+    """
+    position = q * (len(sorted_arr) - 1)
+    lower = int(np.floor(position))
+    upper = min(lower + 1, len(sorted_arr) - 1)
+    fraction = position - lower
+    return float(sorted_arr[lower] + (sorted_arr[upper] - sorted_arr[lower]) * fraction)
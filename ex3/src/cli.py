@@ -11,6 +11,8 @@ Provides CLI commands for:
 import os
 import sys
 import click
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -21,8 +23,8 @@ load_dotenv()
 from turing_machine import TuringMachine
 from translation import ErrorInjector
 from translation.claude_agent_runner import run_translation_pipeline
-from evaluation import HuggingFaceEmbedding, EvaluationEngine
-from analysis import GraphGenerator, StatisticsCalculator, ResultExporter
+from evaluation import get_embedding, EvaluationEngine
+from analysis import StatisticsCalculator, ResultExporter
 
 
 @click.group()
@@ -198,7 +200,7 @@ def translate_once_cmd(sentence, error_rate, seed, output):
         # Compute semantic distance using HuggingFace embeddings
         click.echo("\nComputing semantic distance (using HuggingFace embeddings)...")
         embedding_model = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-        embedding_provider = HuggingFaceEmbedding(model_name=embedding_model)
+        embedding_provider = get_embedding(embedding_model)
         eval_engine = EvaluationEngine(embedding_provider)
 
         eval_result = eval_engine.evaluate(
@@ -296,53 +298,64 @@ def translate_batch_cmd(sentence, min_error, max_error, steps, seed, output_dir)
 
         # Create embedding provider and evaluation engine (HuggingFace)
         embedding_model = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-        embedding_provider = HuggingFaceEmbedding(model_name=embedding_model)
+        embedding_provider = get_embedding(embedding_model)
         eval_engine = EvaluationEngine(embedding_provider)
 
         # Generate error rates
-        import numpy as np
-
         error_rates = np.linspace(min_error, max_error, steps).tolist()
 
-        # Batch processing
-        results = []
-        with click.progressbar(error_rates, label="Processing") as bar:
-            for error_rate in bar:
-                # Inject errors
-                text_to_translate = sentence
-                if error_rate > 0:
-                    injector = ErrorInjector(seed=seed + int(error_rate * 1000))
-                    text_to_translate = injector.inject_errors(sentence, error_rate)
-
-                # Run translation pipeline
-                translations = run_translation_pipeline(
-                    text_to_translate,
-                    agent_files,
-                    timeout=120,
-                )
-
-                translation_fr, translation_he, translation_en = translations
-
-                # Evaluate
-                eval_result = eval_engine.evaluate(
-                    sentence,
-                    translation_en,
-                    error_rate=error_rate,
-                )
-
-                results.append(
-                    {
-                        "original": sentence,
-                        "corrupted": text_to_translate,
-                        "error_rate": error_rate,
-                        "translation_fr": translation_fr,
-                        "translation_he": translation_he,
-                        "translation_en": translation_en,
-                        "cosine_distance": eval_result.cosine_distance,
-                        "euclidean_distance": eval_result.euclidean_distance,
-                        "word_count": word_count,
-                    }
-                )
+        # Inject errors up front with one injector, re-seeded per step
+        injector = ErrorInjector()
+        texts_to_translate = [
+            injector.inject_errors(sentence, error_rate, seed=seed + i)
+            for i, error_rate in enumerate(error_rates)
+        ]
+
+        # Run the translation pipelines concurrently; each one is I/O bound on
+        # the Claude CLI subprocesses, so threads overlap the waiting
+        translations = [None] * len(error_rates)
+        max_workers = max(1, min(len(error_rates), 8))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    run_translation_pipeline, text, agent_files, timeout=120
+                ): i
+                for i, text in enumerate(texts_to_translate)
+            }
+            # Redraw at most ~20 times regardless of the number of steps
+            with click.progressbar(
+                length=len(futures),
+                label="Processing",
+                width=40,
+                update_min_steps=max(1, len(futures) // 20),
+            ) as bar:
+                for future in as_completed(futures):
+                    translations[futures[future]] = future.result()
+                    bar.update(1)
+
+        # Evaluate all pairs in one batched embedding pass
+        eval_results = eval_engine.evaluate_batch(
+            [sentence] * len(error_rates),
+            [translation_en for _, _, translation_en in translations],
+            error_rates,
+        )
+
+        results = [None] * len(error_rates)
+        for i, error_rate in enumerate(error_rates):
+            translation_fr, translation_he, translation_en = translations[i]
+            eval_result = eval_results[i]
+
+            results[i] = {
+                "original": sentence,
+                "corrupted": texts_to_translate[i],
+                "error_rate": error_rate,
+                "translation_fr": translation_fr,
+                "translation_he": translation_he,
+                "translation_en": translation_en,
+                "cosine_distance": eval_result.cosine_distance,
+                "euclidean_distance": eval_result.euclidean_distance,
+                "word_count": word_count,
+            }
 
         # Export results
         csv_path = output_dir / "batch_results.csv"
@@ -381,12 +394,16 @@ def translate_batch_cmd(sentence, min_error, max_error, steps, seed, output_dir)
 )
 @click.option(
     "--output",
-    default="results/graphs/analysis.png",
+    default=None,
     type=click.Path(),
-    help="Path to save the graph (default: results/graphs/analysis.png)",
+    help="Path to save the graph, .svg or .png "
+    "(default: results/graphs/analysis.svg, or .png when --dpi is given)",
 )
 @click.option(
-    "--dpi", default=300, type=int, help="Graph resolution in DPI (default: 300)"
+    "--dpi",
+    default=None,
+    type=int,
+    help="Raster resolution in DPI for PNG output (default: 300)",
 )
 def analyze_cmd(input, output, dpi):
     """
@@ -401,6 +418,14 @@ def analyze_cmd(input, output, dpi):
     try:
         import json
 
+        # Vector output is much cheaper to write for small plots; only
+        # rasterize when a resolution is explicitly requested
+        if output is None:
+            suffix = ".svg" if dpi is None else ".png"
+            output = f"results/graphs/analysis{suffix}"
+        if dpi is None:
+            dpi = 300
+
         click.echo(f"Loading results from: {input}")
 
         # Load results
@@ -413,16 +438,24 @@ def analyze_cmd(input, output, dpi):
             click.echo("Error: No results found in input file", err=True)
             sys.exit(1)
 
-        # Extract data
-        error_rates = [r["error_rate"] for r in results]
-        cosine_distances = [r["cosine_distance"] for r in results]
-        euclidean_distances = [r["euclidean_distance"] for r in results]
+        # Extract data into arrays once; statistics and plotting take them as-is
+        n = len(results)
+        error_rates = np.fromiter(
+            (r["error_rate"] for r in results), dtype=np.float64, count=n
+        )
+        cosine_distances = np.fromiter(
+            (r["cosine_distance"] for r in results), dtype=np.float64, count=n
+        )
+        euclidean_distances = np.fromiter(
+            (r["euclidean_distance"] for r in results), dtype=np.float64, count=n
+        )
 
         click.echo(f"Loaded {len(results)} data points")
 
         # Calculate statistics
         stats_calc = StatisticsCalculator()
         trend = stats_calc.calculate_trend(error_rates, cosine_distances)
+        trend_euc = stats_calc.calculate_trend(error_rates, euclidean_distances)
 
         click.echo(f"\nStatistics:")
         click.echo(f"  Correlation: {trend.correlation:.4f}")
@@ -431,6 +464,9 @@ def analyze_cmd(input, output, dpi):
 
         # Generate graph
         click.echo(f"\nGenerating graph...")
+        # Deferred: matplotlib is only needed by this command
+        from analysis import GraphGenerator
+
         graph_gen = GraphGenerator()
 
         graph_gen.generate_scatter_plot(
@@ -447,13 +483,17 @@ def analyze_cmd(input, output, dpi):
         click.echo(f"✓ Graph saved to: {output}")
 
         # Also generate multi-metric plot
-        multi_output = Path(output).parent / "multi_metric_analysis.png"
+        multi_output = (
+            Path(output).parent / f"multi_metric_analysis{Path(output).suffix}"
+        )
         graph_gen.generate_multi_metric_plot(
             error_rates=error_rates,
             cosine_distances=cosine_distances,
             euclidean_distances=euclidean_distances,
             output_path=str(multi_output),
             dpi=dpi,
+            trend_cos=(trend.slope, trend.intercept),
+            trend_euc=(trend_euc.slope, trend_euc.intercept),
         )
 
         click.echo(f"✓ Multi-metric graph saved to: {multi_output}")
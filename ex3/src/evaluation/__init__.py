@@ -7,12 +7,13 @@ Provides semantic similarity evaluation using:
 - Batch evaluation capabilities
 """
 
-from .hf_embedding import HuggingFaceEmbedding
+from .hf_embedding import HuggingFaceEmbedding, get_embedding
 from .distance import DistanceCalculator
 from .engine import EvaluationEngine, EvaluationResult
 
 __all__ = [
     "HuggingFaceEmbedding",
+    "get_embedding",
     "DistanceCalculator",
     "EvaluationEngine",
     "EvaluationResult",
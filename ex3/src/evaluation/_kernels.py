@@ -0,0 +1,87 @@
+"""
+Distance Kernels
+
+Low-level reductions behind DistanceCalculator. Each kernel walks both
+vectors once; when Numba is installed they are JIT-compiled into fused
+SIMD loops, otherwise equivalent NumPy expressions are used. simsimd,
+when installed, provides the squared Euclidean kernel.
+"""
+
+import numpy as np
+from typing import Tuple
+
+# Optional JIT: fall back to NumPy when numba is not installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def cosine_terms(v1: np.ndarray, v2: np.ndarray) -> Tuple[float, float, float]:
+        """Return (<v1,v2>, ||v1||², ||v2||²) accumulated in one pass."""
+        dot = 0.0
+        sq1 = 0.0
+        sq2 = 0.0
+        for i in range(v1.shape[0]):
+            a = v1[i]
+            b = v2[i]
+            dot += a * b
+            sq1 += a * a
+            sq2 += b * b
+        return dot, sq1, sq2
+
+    @njit(cache=True, fastmath=True)
+    def squared_euclidean(v1: np.ndarray, v2: np.ndarray) -> float:
+        """Return ||v1 - v2||² without allocating the difference."""
+        total = 0.0
+        for i in range(v1.shape[0]):
+            d = v1[i] - v2[i]
+            total += d * d
+        return total
+
+    @njit(cache=True, fastmath=True)
+    def manhattan(v1: np.ndarray, v2: np.ndarray) -> float:
+        """Return sum(|v1 - v2|) without allocating the difference."""
+        total = 0.0
+        for i in range(v1.shape[0]):
+            total += abs(v1[i] - v2[i])
+        return total
+
+else:
+
+    def cosine_terms(v1: np.ndarray, v2: np.ndarray) -> Tuple[float, float, float]:
+        """Return (<v1,v2>, ||v1||², ||v2||²)."""
+        return float(np.dot(v1, v2)), float(np.dot(v1, v1)), float(np.dot(v2, v2))
+
+    def squared_euclidean(v1: np.ndarray, v2: np.ndarray) -> float:
+        """Return ||v1 - v2||² via the dot-product identity (no temporary)."""
+        dot, sq1, sq2 = cosine_terms(v1, v2)
+        return sq1 + sq2 - 2.0 * dot
+
+    def manhattan(v1: np.ndarray, v2: np.ndarray) -> float:
+        """Return sum(|v1 - v2|)."""
+        return float(np.sum(np.abs(v1 - v2)))
+
+
+# Optional SIMD library: when present it takes over the squared Euclidean
+# kernel for the dtypes it supports. Cosine stays on the kernels above,
+# which expose the norms needed to reject zero vectors exactly.
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+if simsimd is not None:
+    _SIMSIMD_DTYPES = (np.dtype("float64"), np.dtype("float32"), np.dtype("float16"))
+    _squared_euclidean_fallback = squared_euclidean
+
+    def squared_euclidean(v1: np.ndarray, v2: np.ndarray) -> float:
+        """Return ||v1 - v2||² via simsimd's runtime-dispatched SIMD kernel."""
+        if v1.dtype != v2.dtype or v1.dtype not in _SIMSIMD_DTYPES:
+            return _squared_euclidean_fallback(v1, v2)
+        return float(
+            simsimd.sqeuclidean(np.ascontiguousarray(v1), np.ascontiguousarray(v2))
+        )
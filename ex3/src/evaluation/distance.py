@@ -4,8 +4,15 @@ Distance Calculation Module
 Provides various distance metrics for comparing embedding vectors.
 """
 
+import math
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
+
+from . import _kernels
+
+# Rows per block in batch distance calculations (256 x 768 float64 rows of
+# both inputs is ~3 MB, small enough to stay in L2/L3 between passes)
+BATCH_BLOCK_ROWS = 256
 
 
 class DistanceCalculator:
@@ -39,33 +46,80 @@ class DistanceCalculator:
                 f"Vectors must have same shape, got {v1.shape} and {v2.shape}"
             )
 
-        # Normalize vectors
-        norm1 = np.linalg.norm(v1)
-        norm2 = np.linalg.norm(v2)
+        v1, v2 = _upcast(v1), _upcast(v2)
+
+        # Dot product and both squared norms in a single pass
+        dot, sq_norm1, sq_norm2 = _kernels.cosine_terms(v1, v2)
 
-        if norm1 == 0 or norm2 == 0:
+        if sq_norm1 == 0 or sq_norm2 == 0:
             raise ValueError("Cannot calculate cosine distance for zero vector")
 
         # Calculate cosine similarity
-        similarity = np.dot(v1, v2) / (norm1 * norm2)
+        similarity = dot / math.sqrt(sq_norm1 * sq_norm2)
 
         # Clamp to [-1, 1] to handle numerical errors
-        similarity = np.clip(similarity, -1.0, 1.0)
+        similarity = max(-1.0, min(1.0, similarity))
 
         # Return cosine distance (1 - similarity)
-        return float(1.0 - similarity)
+        return 1.0 - similarity
+
+    @staticmethod
+    def cosine_distance_normalized(v1: np.ndarray, v2: np.ndarray) -> float:
+        """
+        Calculate cosine distance between two unit-length vectors.
+
+        For L2-normalized inputs cosine similarity is just the dot product,
+        so no norms are computed. Use cosine_distance for arbitrary vectors.
+
+        Args:
+            v1: First vector (unit norm)
+            v2: Second vector (unit norm)
+
+        Returns:
+            Cosine distance
+
+        Raises:
+            ValueError: If vectors have different dimensions
+        """
+        if v1.shape != v2.shape:
+            raise ValueError(
+                f"Vectors must have same shape, got {v1.shape} and {v2.shape}"
+            )
+
+        v1, v2 = _upcast(v1), _upcast(v2)
+
+        # Clamp to [-1, 1] to handle numerical errors
+        similarity = float(np.dot(v1, v2))
+        return 1.0 - max(-1.0, min(1.0, similarity))
 
     @staticmethod
-    def euclidean_distance(v1: np.ndarray, v2: np.ndarray) -> float:
+    def euclidean_distance(
+        v1: np.ndarray,
+        v2: np.ndarray,
+        normalized: bool = False,
+        norm_sq1: Optional[float] = None,
+        norm_sq2: Optional[float] = None,
+    ) -> float:
         """
         Calculate Euclidean distance between two vectors.
 
         Also known as L2 distance.
         Range: [0, ∞)
 
+        Computed without allocating v1 - v2: a fused loop when Numba is
+        available, otherwise sqrt(||v1||² + ||v2||² - 2<v1,v2>) from dot
+        products. The latter loses some precision to cancellation for
+        near-identical vectors (on the order of sqrt(eps) relative to the
+        norms).
+
         Args:
             v1: First vector
             v2: Second vector
+            normalized: Whether both vectors have unit L2 norm, in which
+                case ||v1 - v2||² = 2 - 2<v1,v2>
+            norm_sq1: Optional precomputed ||v1||²
+            norm_sq2: Optional precomputed ||v2||²; when both norms are
+                given only <v1,v2> is computed
 
         Returns:
             Euclidean distance
@@ -78,7 +132,17 @@ class DistanceCalculator:
                 f"Vectors must have same shape, got {v1.shape} and {v2.shape}"
             )
 
-        return float(np.linalg.norm(v1 - v2))
+        v1, v2 = _upcast(v1), _upcast(v2)
+
+        if normalized:
+            squared = 2.0 - 2.0 * float(np.dot(v1, v2))
+        elif norm_sq1 is not None and norm_sq2 is not None:
+            squared = norm_sq1 + norm_sq2 - 2.0 * float(np.dot(v1, v2))
+        else:
+            squared = _kernels.squared_euclidean(v1, v2)
+
+        # Clamp rounding below zero
+        return math.sqrt(max(squared, 0.0))
 
     @staticmethod
     def manhattan_distance(v1: np.ndarray, v2: np.ndarray) -> float:
@@ -103,7 +167,9 @@ class DistanceCalculator:
                 f"Vectors must have same shape, got {v1.shape} and {v2.shape}"
             )
 
-        return float(np.sum(np.abs(v1 - v2)))
+        v1, v2 = _upcast(v1), _upcast(v2)
+
+        return float(_kernels.manhattan(v1, v2))
 
     @staticmethod
     def all_distances(
@@ -112,6 +178,10 @@ class DistanceCalculator:
         """
         Calculate all distance metrics at once.
 
+        Shapes are validated once, and cosine and Euclidean distance share
+        a single (<v1,v2>, ||v1||², ||v2||²) reduction via
+        ||v1 - v2||² = ||v1||² + ||v2||² - 2<v1,v2>.
+
         Args:
             v1: First vector
             v2: Second vector
@@ -122,11 +192,116 @@ class DistanceCalculator:
         Raises:
             ValueError: If vectors have different dimensions or are invalid
         """
-        cosine = DistanceCalculator.cosine_distance(v1, v2)
-        euclidean = DistanceCalculator.euclidean_distance(v1, v2)
-        manhattan = DistanceCalculator.manhattan_distance(v1, v2)
+        if v1.shape != v2.shape:
+            raise ValueError(
+                f"Vectors must have same shape, got {v1.shape} and {v2.shape}"
+            )
+
+        v1, v2 = _upcast(v1), _upcast(v2)
+
+        dot, sq_norm1, sq_norm2 = _kernels.cosine_terms(v1, v2)
+
+        if sq_norm1 == 0 or sq_norm2 == 0:
+            raise ValueError("Cannot calculate cosine distance for zero vector")
+
+        # Clamp to [-1, 1] to handle numerical errors
+        similarity = max(-1.0, min(1.0, dot / math.sqrt(sq_norm1 * sq_norm2)))
+
+        # Clamp rounding below zero
+        euclidean = math.sqrt(max(sq_norm1 + sq_norm2 - 2.0 * dot, 0.0))
+
+        manhattan = float(_kernels.manhattan(v1, v2))
+
+        return 1.0 - similarity, euclidean, manhattan
+
+    @staticmethod
+    def cosine_and_euclidean(v1: np.ndarray, v2: np.ndarray) -> Tuple[float, float]:
+        """
+        Calculate cosine and Euclidean distance in a single fused pass.
+
+        Both metrics are derived from the same three reductions
+        (<v1,v2>, ||v1||², ||v2||²) using the identity
+        ||v1 - v2||² = ||v1||² + ||v2||² - 2<v1,v2>,
+        so each vector is read once instead of once per metric.
+
+        Args:
+            v1: First vector
+            v2: Second vector
+
+        Returns:
+            Tuple of (cosine_distance, euclidean_distance)
+
+        Raises:
+            ValueError: If vectors have different dimensions or are zero vectors
+        """
+        if v1.shape != v2.shape:
+            raise ValueError(
+                f"Vectors must have same shape, got {v1.shape} and {v2.shape}"
+            )
+
+        cosine, euclidean = DistanceCalculator.batch_cosine_and_euclidean(
+            v1[np.newaxis], v2[np.newaxis]
+        )
+        return float(cosine[0]), float(euclidean[0])
+
+    @staticmethod
+    def batch_cosine_and_euclidean(
+        a: np.ndarray, b: np.ndarray, normalized: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate row-wise cosine and Euclidean distances for two matrices.
+
+        When the rows are known to be unit length, only the row-wise dot
+        products are needed: cosine distance is 1 - <a,b> and
+        ||a - b||² = 2 - 2<a,b>.
+
+        Args:
+            a: Matrix of shape (n, dim)
+            b: Matrix of shape (n, dim)
+            normalized: Whether all rows have unit L2 norm
+
+        Returns:
+            Tuple of (cosine_distances, euclidean_distances), each of shape (n,)
+
+        Raises:
+            ValueError: If matrices have different shapes or contain zero vectors
+        """
+        if a.shape != b.shape:
+            raise ValueError(
+                f"Matrices must have same shape, got {a.shape} and {b.shape}"
+            )
+
+        if normalized:
+            a, b = _upcast(a), _upcast(b)
+            dot = np.einsum("ij,ij->i", a, b)
+            cosine = 1.0 - np.clip(dot, -1.0, 1.0)
+            return cosine, np.sqrt(2.0 * cosine)
+
+        n = a.shape[0]
+        dot = np.empty(n)
+        sq_norm_a = np.empty(n)
+        sq_norm_b = np.empty(n)
+
+        # Three reductions read the same rows, so work block by block: each
+        # block (and its float64 copy) stays cache-resident across all three
+        for start in range(0, n, BATCH_BLOCK_ROWS):
+            rows = slice(start, start + BATCH_BLOCK_ROWS)
+            a_block = np.asarray(a[rows], dtype=np.float64)
+            b_block = np.asarray(b[rows], dtype=np.float64)
+            np.einsum("ij,ij->i", a_block, b_block, out=dot[rows])
+            np.einsum("ij,ij->i", a_block, a_block, out=sq_norm_a[rows])
+            np.einsum("ij,ij->i", b_block, b_block, out=sq_norm_b[rows])
+
+        if np.any(sq_norm_a == 0) or np.any(sq_norm_b == 0):
+            raise ValueError("Cannot calculate cosine distance for zero vector")
 
-        return cosine, euclidean, manhattan
+        # Clamp to [-1, 1] to handle numerical errors
+        similarity = np.clip(dot / np.sqrt(sq_norm_a * sq_norm_b), -1.0, 1.0)
+
+        # ||a - b||² = ||a||² + ||b||² - 2<a,b>; clamp rounding below zero
+        euclidean = np.sqrt(np.maximum(sq_norm_a + sq_norm_b - 2.0 * dot, 0.0))
+
+        return 1.0 - similarity, euclidean
 
     @staticmethod
     def cosine_similarity(v1: np.ndarray, v2: np.ndarray) -> float:
@@ -147,3 +322,8 @@ class DistanceCalculator:
         """
         distance = DistanceCalculator.cosine_distance(v1, v2)
         return 1.0 - distance
+
+
+def _upcast(v: np.ndarray) -> np.ndarray:
+    """Widen float16 inputs to float32 so reductions don't accumulate in fp16."""
+    return v.astype(np.float32) if v.dtype == np.float16 else v
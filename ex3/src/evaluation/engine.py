@@ -77,18 +77,25 @@ class EvaluationEngine:
             raise ValueError("Final text cannot be empty")
 
         try:
-            # Generate embeddings
-            original_embedding = self.embedding_provider.embed(original)
-            final_embedding = self.embedding_provider.embed(final)
-
-            # Calculate distances
-            cosine_dist = self.distance_calculator.cosine_distance(
-                original_embedding, final_embedding
-            )
-            euclidean_dist = self.distance_calculator.euclidean_distance(
-                original_embedding, final_embedding
+            # Generate both embeddings in a single encoder pass
+            original_embedding, final_embedding = self.embedding_provider.embed_batch(
+                [original, final]
             )
 
+            calculator = self.distance_calculator
+            if getattr(self.embedding_provider, "normalized", False):
+                # Unit vectors: cosine is one dot product, and
+                # ||a - b||² = 2 - 2<a,b> = 2 * cosine distance
+                cosine_dist = calculator.cosine_distance_normalized(
+                    original_embedding, final_embedding
+                )
+                euclidean_dist = float(np.sqrt(2.0 * cosine_dist))
+            else:
+                # Calculate both distances in one fused pass
+                cosine_dist, euclidean_dist = calculator.cosine_and_euclidean(
+                    original_embedding, final_embedding
+                )
+
             return EvaluationResult(
                 original_text=original,
                 final_text=final,
@@ -133,11 +140,24 @@ class EvaluationEngine:
             )
 
         try:
-            # Generate embeddings in batch for efficiency
-            original_embeddings = self.embedding_provider.embed_batch(original_texts)
-            final_embeddings = self.embedding_provider.embed_batch(final_texts)
+            # Generate all embeddings in a single encoder call for efficiency
+            embeddings = self.embedding_provider.embed_batch(
+                list(original_texts) + list(final_texts)
+            )
+            original_embeddings = embeddings[: len(original_texts)]
+            final_embeddings = embeddings[len(original_texts) :]
+
+            # Calculate distances for all pairs in one fused pass, vectorized
+            # across rows of the (N, D) matrices; per-result embeddings below
+            # are row views, not copies
+            cosine_dists, euclidean_dists = (
+                self.distance_calculator.batch_cosine_and_euclidean(
+                    np.asarray(original_embeddings, dtype=np.float32),
+                    np.asarray(final_embeddings, dtype=np.float32),
+                    normalized=getattr(self.embedding_provider, "normalized", False),
+                )
+            )
 
-            # Calculate distances for each pair
             results = []
             for i, (orig, final, orig_emb, final_emb, error_rate) in enumerate(
                 zip(
@@ -148,21 +168,14 @@ class EvaluationEngine:
                     error_rates,
                 )
             ):
-                cosine_dist = self.distance_calculator.cosine_distance(
-                    orig_emb, final_emb
-                )
-                euclidean_dist = self.distance_calculator.euclidean_distance(
-                    orig_emb, final_emb
-                )
-
                 results.append(
                     EvaluationResult(
                         original_text=orig,
                         final_text=final,
                         original_embedding=orig_emb,
                         final_embedding=final_emb,
-                        cosine_distance=cosine_dist,
-                        euclidean_distance=euclidean_dist,
+                        cosine_distance=float(cosine_dists[i]),
+                        euclidean_distance=float(euclidean_dists[i]),
                         error_rate=error_rate,
                     )
                 )
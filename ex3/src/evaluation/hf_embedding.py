@@ -6,7 +6,9 @@ No API key required.
 """
 
 import numpy as np
-from typing import List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 
 class HuggingFaceEmbedding:
@@ -17,7 +19,15 @@ class HuggingFaceEmbedding:
     Downloads models on first use and caches them locally.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        normalize: bool = True,
+        low_precision: bool = False,
+        cache_size: int = 4096,
+        backend: str = "torch",
+        device: Optional[str] = None,
+    ):
         """
         Initialize the HuggingFace embedding provider.
 
@@ -27,6 +37,17 @@ class HuggingFaceEmbedding:
                        Alternatives:
                        - "all-mpnet-base-v2" (768 dim, slower, better quality)
                        - "paraphrase-MiniLM-L3-v2" (384 dim, fastest)
+            normalize: Whether to L2-normalize embeddings at encode time, so
+                       cosine distance reduces to a single dot product
+            low_precision: Whether to return float16 embeddings, halving
+                       memory traffic; distances still accumulate in float32
+            cache_size: Maximum number of texts whose embeddings are kept in
+                       an LRU cache (0 disables caching)
+            backend: Inference backend: "torch" (default), or "onnx" /
+                       "openvino" for an exported, graph-optimized model
+                       (requires sentence-transformers>=3.2 and optimum)
+            device: Device to run the model on (e.g. "cpu", "cuda"); by
+                       default CUDA is used when available, with FP16 weights
         """
         try:
             from sentence_transformers import SentenceTransformer
@@ -37,7 +58,27 @@ class HuggingFaceEmbedding:
             )
 
         self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        if device is None:
+            device = _default_device()
+
+        if backend == "torch":
+            self.model = SentenceTransformer(model_name, device=device)
+            if device.startswith("cuda"):
+                # Half-precision weights: faster GPU matmuls, half the memory
+                self.model.half()
+        else:
+            # The model stays loaded on the instance, so the ONNX/OpenVINO
+            # session is built once and reused for every encode call
+            self.model = SentenceTransformer(
+                model_name, backend=backend, device=device
+            )
+        self._normalized = normalize
+        self._dtype = np.float16 if low_precision else np.float32
+
+        # LRU cache of text -> embedding; pipelines compare one original
+        # against many noisy variants, so the same texts recur often
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
         # Get embedding dimension
         self._dimension = self.model.get_sentence_embedding_dimension()
@@ -50,7 +91,7 @@ class HuggingFaceEmbedding:
             text: Text to embed
 
         Returns:
-            Embedding vector as numpy array
+            Embedding vector as numpy array (read-only when cached)
 
         Raises:
             ValueError: If text is empty
@@ -59,9 +100,17 @@ class HuggingFaceEmbedding:
         if not text or not text.strip():
             raise ValueError("Text to embed cannot be empty")
 
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
         try:
-            embedding = self.model.encode(text, convert_to_numpy=True)
-            return embedding.astype(np.float32)
+            embedding = self.model.encode(
+                text, convert_to_numpy=True, normalize_embeddings=self._normalized
+            )
+            embedding = embedding.astype(self._dtype)
+            self._cache_put(text, embedding)
+            return embedding
 
         except Exception as e:
             raise RuntimeError(f"Embedding generation failed: {str(e)}") from e
@@ -75,7 +124,40 @@ class HuggingFaceEmbedding:
         """
         return self._dimension
 
-    def embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+    def clear_cache(self) -> None:
+        """Drop all cached embeddings."""
+        self._cache.clear()
+
+    def _cache_get(self, text: str) -> Optional[np.ndarray]:
+        """Look up a cached embedding, marking it as recently used."""
+        embedding = self._cache.get(text)
+        if embedding is not None:
+            self._cache.move_to_end(text)
+        return embedding
+
+    def _cache_put(self, text: str, embedding: np.ndarray) -> None:
+        """Cache an embedding, evicting the least recently used beyond capacity."""
+        if self._cache_size <= 0:
+            return
+
+        # Cached arrays are shared between callers, so guard against mutation
+        embedding.flags.writeable = False
+        self._cache[text] = embedding
+        self._cache.move_to_end(text)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    @property
+    def normalized(self) -> bool:
+        """Whether embeddings are returned with unit L2 norm."""
+        return self._normalized
+
+    @property
+    def low_precision(self) -> bool:
+        """Whether embeddings are returned as float16."""
+        return self._dtype == np.float16
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for multiple texts efficiently.
 
@@ -83,7 +165,8 @@ class HuggingFaceEmbedding:
             texts: List of texts to embed
 
         Returns:
-            List of embedding vectors
+            C-contiguous matrix of shape (len(texts), dimension), one
+            embedding per row (float32, or float16 with low_precision)
 
         Raises:
             ValueError: If texts list is empty
@@ -92,11 +175,68 @@ class HuggingFaceEmbedding:
         if not texts:
             raise ValueError("Texts list cannot be empty")
 
+        # Resolve each distinct text from the cache; only misses are encoded
+        found: Dict[str, np.ndarray] = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache_get(text)
+            if cached is None:
+                missing.append(text)
+            else:
+                found[text] = cached
+
         try:
-            embeddings = self.model.encode(
-                texts, convert_to_numpy=True, show_progress_bar=False
-            )
-            return [emb.astype(np.float32) for emb in embeddings]
+            if missing:
+                encoded = self.model.encode(
+                    missing,
+                    convert_to_numpy=True,
+                    batch_size=64,
+                    show_progress_bar=False,
+                    normalize_embeddings=self._normalized,
+                )
+                # Cast the whole (M, D) matrix once rather than row by row
+                encoded = np.ascontiguousarray(encoded, dtype=self._dtype)
+
+                if self._cache_size > 0:
+                    for text, embedding in zip(missing, encoded):
+                        # Copy so a cached row doesn't pin the whole matrix
+                        self._cache_put(text, embedding.copy())
+
+                # Every text was a distinct miss: the encoder output already
+                # is the result, so skip re-assembling it
+                if len(missing) == len(texts):
+                    return encoded
+
+                found.update(zip(missing, encoded))
+
+            return np.stack([found[text] for text in texts])
 
         except Exception as e:
             raise RuntimeError(f"Batch embedding generation failed: {str(e)}") from e
+
+
+def _default_device() -> str:
+    """Pick CUDA when a GPU is available, otherwise CPU."""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+@lru_cache(maxsize=4)
+def get_embedding(model_name: str = "all-MiniLM-L6-v2") -> HuggingFaceEmbedding:
+    """
+    Get a shared HuggingFaceEmbedding for the given model.
+
+    Loaded models are cached per model name, so repeated calls in the
+    same process reuse the resident weights instead of reloading them.
+
+    Args:
+        model_name: Name of the sentence-transformer model
+
+    Returns:
+        HuggingFaceEmbedding instance for the model
+    """
+    return HuggingFaceEmbedding(model_name=model_name)
@@ -8,10 +8,26 @@ Provides multi-agent translation orchestration using:
 """
 
 from .error_injector import ErrorInjector
-from .claude_agent_runner import ClaudeAgentRunner, run_translation_pipeline
 
 __all__ = [
     "ErrorInjector",
     "ClaudeAgentRunner",
     "run_translation_pipeline",
+    "run_translation_pipeline_async",
 ]
+
+# Agent runner names are resolved on first access, so error injection alone
+# doesn't import subprocess/asyncio machinery
+_LAZY_RUNNER_NAMES = {
+    "ClaudeAgentRunner",
+    "run_translation_pipeline",
+    "run_translation_pipeline_async",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_RUNNER_NAMES:
+        from . import claude_agent_runner
+
+        return getattr(claude_agent_runner, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
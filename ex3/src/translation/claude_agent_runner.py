@@ -4,8 +4,10 @@ Claude CLI Agent Runner
 Executes translation agents defined in MD files via Claude CLI.
 """
 
+import asyncio
 import subprocess
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -28,6 +30,9 @@ class ClaudeAgentRunner:
         if not self.agent_file.exists():
             raise FileNotFoundError(f"Agent file not found: {agent_file}")
 
+        # Agent instructions are read once and reused for every run
+        self._agent_prompt = self.agent_file.read_text(encoding="utf-8")
+
     def run(self, text: str, timeout: int = 60) -> str:
         """
         Run the agent on the given text.
@@ -47,17 +52,15 @@ class ClaudeAgentRunner:
             raise ValueError("Text cannot be empty")
 
         try:
-            # Prepare prompt combining agent instructions and text
-            with open(self.agent_file, "r", encoding="utf-8") as f:
-                agent_prompt = f.read()
-
-            full_prompt = f"{agent_prompt}\n\n## Text to Translate:\n{text}"
+            full_prompt = self._build_prompt(text)
 
-            # Execute via Claude CLI
+            # Execute via Claude CLI, piping the prompt through stdin rather
+            # than argv (no argument-length limit, no extra argv copy)
             # Note: This assumes Claude CLI is available and configured
             # Adjust command based on actual Claude CLI interface
             result = subprocess.run(
-                ["claude", "--prompt", full_prompt],
+                ["claude", "-p"],
+                input=full_prompt,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -74,6 +77,83 @@ class ClaudeAgentRunner:
         except Exception as e:
             raise RuntimeError(f"Agent execution failed: {str(e)}") from e
 
+    async def run_async(self, text: str, timeout: int = 60) -> str:
+        """
+        Run the agent on the given text without blocking the event loop.
+
+        Same contract as run(); lets many CLI invocations be in flight at
+        once (e.g. via asyncio.gather) since each is latency-bound.
+
+        Args:
+            text: Text to process
+            timeout: Timeout in seconds (default: 60)
+
+        Returns:
+            Agent output (translated text)
+
+        Raises:
+            ValueError: If text is empty
+            RuntimeError: If agent execution fails
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        try:
+            full_prompt = self._build_prompt(text)
+
+            proc = await asyncio.create_subprocess_exec(
+                "claude",
+                "-p",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(full_prompt.encode("utf-8")), timeout
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            if proc.returncode != 0:
+                raise RuntimeError(
+                    f"Agent execution failed: {stderr.decode('utf-8', 'replace')}"
+                )
+
+            return stdout.decode("utf-8").strip()
+
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Agent execution timed out after {timeout} seconds")
+        except Exception as e:
+            raise RuntimeError(f"Agent execution failed: {str(e)}") from e
+
+    def _build_prompt(self, text: str) -> str:
+        """Combine agent instructions and the text to translate."""
+        return f"{self._agent_prompt}\n\n## Text to Translate:\n{text}"
+
+
+def _get_runner(agent_file: str) -> ClaudeAgentRunner:
+    """
+    Get a runner for an agent file, reusing one while the file is unchanged.
+
+    Raises:
+        FileNotFoundError: If the agent file doesn't exist
+    """
+    path = Path(agent_file)
+    if not path.exists():
+        raise FileNotFoundError(f"Agent file not found: {agent_file}")
+
+    path = path.resolve()
+    return _get_runner_cached(path, path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _get_runner_cached(path: Path, mtime_ns: int) -> ClaudeAgentRunner:
+    """Construct a runner; mtime_ns invalidates entries for edited files."""
+    return ClaudeAgentRunner(str(path))
+
 
 def run_translation_pipeline(
     text: str,
@@ -105,8 +185,50 @@ def run_translation_pipeline(
     current_text = text
 
     for agent_file in agent_files:
-        runner = ClaudeAgentRunner(agent_file)
+        runner = _get_runner(agent_file)
         current_text = runner.run(current_text, timeout=timeout)
         translations.append(current_text)
 
     return translations
+
+
+async def run_translation_pipeline_async(
+    text: str,
+    agent_files: list[str],
+    timeout: int = 60,
+) -> list[str]:
+    """
+    Run a translation pipeline through multiple agents asynchronously.
+
+    Agents within one pipeline still run in order (each consumes the
+    previous output); concurrency comes from running many pipelines at
+    once, e.g. ``asyncio.gather(*(run_translation_pipeline_async(t, files)
+    for t in texts))``.
+
+    Args:
+        text: Initial text to translate
+        agent_files: List of agent MD file paths in execution order
+        timeout: Timeout per agent in seconds
+
+    Returns:
+        List of translations (one per agent)
+
+    Raises:
+        ValueError: If inputs are invalid
+        RuntimeError: If pipeline execution fails
+    """
+    if not text or not text.strip():
+        raise ValueError("Text cannot be empty")
+
+    if not agent_files:
+        raise ValueError("Agent files list cannot be empty")
+
+    translations = []
+    current_text = text
+
+    for agent_file in agent_files:
+        runner = _get_runner(agent_file)
+        current_text = await runner.run_async(current_text, timeout=timeout)
+        translations.append(current_text)
+
+    return translations
@@ -5,9 +5,10 @@ Provides deterministic error injection with configurable rates
 and reproducible results via seeding.
 """
 
-import random
 import string
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 
 class ErrorInjector:
@@ -18,6 +19,34 @@ class ErrorInjector:
     ensuring reproducible experiments.
     """
 
+    # QWERTY keyboard layout adjacency map
+    ADJACENCY = {
+        "q": "wa", "w": "qeas", "e": "wrds", "r": "etf", "t": "ryg",
+        "y": "tuh", "u": "yij", "i": "uok", "o": "ipl", "p": "ol",
+        "a": "qwsz", "s": "awedxz", "d": "serfcx", "f": "drtgvc",
+        "g": "ftyhbv", "h": "gyujnb", "j": "huikmn", "k": "jiolm",
+        "l": "kop", "z": "asx", "x": "zsdc", "c": "xdfv", "v": "cfgb",
+        "b": "vghn", "n": "bhjm", "m": "njk",
+    }
+
+    PUNCTUATION = frozenset(string.punctuation)
+
+    # ADJACENCY flattened into ASCII lookup tables: row ord(c) holds the
+    # neighbour codes of c, and _ADJ_N[ord(c)] how many (0 if none)
+    _ADJ = np.zeros((128, max(map(len, ADJACENCY.values()))), dtype=np.uint8)
+    _ADJ_N = np.zeros(128, dtype=np.uint8)
+    for _key, _neighbours in ADJACENCY.items():
+        _ADJ[ord(_key), : len(_neighbours)] = [ord(n) for n in _neighbours]
+        _ADJ_N[ord(_key)] = len(_neighbours)
+    del _key, _neighbours
+
+    # Byte-class tables for the ASCII fast path
+    _IS_ALPHA = np.zeros(256, dtype=bool)
+    _IS_ALPHA[ord("A") : ord("Z") + 1] = True
+    _IS_ALPHA[ord("a") : ord("z") + 1] = True
+    _IS_PUNCT = np.zeros(256, dtype=bool)
+    _IS_PUNCT[np.frombuffer(string.punctuation.encode("ascii"), dtype=np.uint8)] = True
+
     def __init__(self, seed: int = None):
         """
         Initialize the error injector.
@@ -26,16 +55,21 @@ class ErrorInjector:
             seed: Random seed for reproducibility (optional)
         """
         self.seed = seed
-        if seed is not None:
-            random.seed(seed)
+        self._rng = np.random.default_rng(seed)
 
-    def inject_errors(self, text: str, error_rate: float) -> str:
+    def inject_errors(
+        self, text: str, error_rate: float, seed: Optional[int] = None
+    ) -> str:
         """
         Inject spelling errors into text at the specified rate.
 
         Args:
             text: Original text
             error_rate: Proportion of characters to corrupt (0.0 to 1.0)
+            seed: Optional seed to reset the injector's RNG for this call,
+                  so one injector can produce reproducible results per call
+                  (ignored when text is empty or error_rate is 0.0, since
+                  such calls return text unchanged without using the RNG)
 
         Returns:
             Text with injected errors
@@ -46,20 +80,132 @@ class ErrorInjector:
         if not 0.0 <= error_rate <= 1.0:
             raise ValueError(f"Error rate must be between 0.0 and 1.0, got {error_rate}")
 
-        if error_rate == 0.0:
+        # Nothing to corrupt: return before (re)seeding or drawing from the RNG
+        if not text or error_rate == 0.0:
             return text
 
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+
         words = text.split()
-        corrupted_words = []
 
-        for word in words:
-            if self._should_corrupt_word(word):
-                corrupted_word = self._corrupt_word(word, error_rate)
-                corrupted_words.append(corrupted_word)
-            else:
-                corrupted_words.append(word)
+        joined = " ".join(words)
+        if joined and joined.isascii():
+            return self._inject_errors_ascii(joined, error_rate)
+
+        # (word index, alphabetic positions, number of positions to corrupt)
+        targets = []
+        for w, word in enumerate(words):
+            if not self._should_corrupt_word(word):
+                continue
+            alpha_indices = [i for i, c in enumerate(word) if c.isalpha()]
+            if alpha_indices:
+                num_to_corrupt = min(
+                    max(1, int(len(word) * error_rate)), len(alpha_indices)
+                )
+                targets.append((w, alpha_indices, num_to_corrupt))
+
+        if not targets:
+            return " ".join(words)
+
+        # All randomness for the text is drawn up front in three vector calls:
+        # sort keys per candidate character (the smallest keys within a word
+        # give a uniform sample without replacement), then one strategy draw
+        # and one option pick per corrupted character
+        keys = self._rng.random(sum(len(alpha) for _, alpha, _ in targets))
+        num_corrupted = sum(k for _, _, k in targets)
+        strategies = self._rng.random(num_corrupted)
+        picks = self._rng.random(num_corrupted)
+
+        offset = 0
+        pos = 0
+        for w, alpha_indices, num_to_corrupt in targets:
+            n = len(alpha_indices)
+            chosen = np.argsort(keys[offset : offset + n], kind="stable")
+            chars = list(words[w])
+            for j in chosen[:num_to_corrupt]:
+                idx = alpha_indices[j]
+                chars[idx] = self._corrupt_char(chars[idx], strategies[pos], picks[pos])
+                pos += 1
+            words[w] = "".join(chars)
+            offset += n
+
+        return " ".join(words)
+
+    def _inject_errors_ascii(self, text: str, error_rate: float) -> str:
+        """
+        Inject errors into single-space-separated ASCII text as a byte array.
+
+        Same selection rules and random draws as the per-word path in
+        inject_errors (so seeded output is identical), but character
+        classes, sampling and rewriting are done with whole-text array
+        operations instead of per-character Python code.
+
+        Args:
+            text: ASCII words joined by single spaces
+            error_rate: Proportion of characters to corrupt (0.0 to 1.0)
+
+        Returns:
+            Text with injected errors
+        """
+        codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        is_space = codes == ord(" ")
+
+        # Word index of every byte, and each word's length
+        word_ids = np.cumsum(is_space)
+        num_words = int(word_ids[-1]) + 1
+        lengths = np.bincount(word_ids[~is_space], minlength=num_words)
+
+        # Same eligibility as _should_corrupt_word, plus at least one letter
+        alpha = self._IS_ALPHA[codes]
+        alpha_count = np.bincount(word_ids[alpha], minlength=num_words)
+        punct_count = np.bincount(word_ids[self._IS_PUNCT[codes]], minlength=num_words)
+        eligible = (lengths > 2) & (punct_count < lengths) & (alpha_count > 0)
+
+        candidates = np.flatnonzero(alpha & eligible[word_ids])
+        if candidates.size == 0:
+            return text
+
+        num_to_corrupt = np.minimum(
+            np.maximum(1, (lengths * error_rate).astype(np.int64)), alpha_count
+        )
+        num_to_corrupt[~eligible] = 0
+
+        keys = self._rng.random(candidates.size)
+        total = int(num_to_corrupt.sum())
+        strategies = self._rng.random(total)
+        picks = self._rng.random(total)
+
+        # Within each word keep the letters with the smallest keys; lexsort
+        # is stable, matching the per-word argsort(kind="stable")
+        order = np.lexsort((keys, word_ids[candidates]))
+        sorted_words = word_ids[candidates][order]
+        rank = np.arange(order.size) - np.searchsorted(sorted_words, sorted_words)
+        chosen = candidates[order][rank < num_to_corrupt[sorted_words]]
 
-        return " ".join(corrupted_words)
+        chars = codes[chosen]
+        lower = chars | 0x20
+        upper_shift = np.where(chars < ord("a"), 0x20, 0)
+
+        # Strategy 1: adjacent key (unchanged if the letter has no neighbours)
+        neighbour_count = self._ADJ_N[lower]
+        neighbour = self._ADJ[lower, (picks * neighbour_count).astype(np.int64)]
+        adjacent = np.where(neighbour_count > 0, neighbour - upper_shift, chars)
+
+        # Strategy 4: random letter in the same case
+        random_letter = ord("a") - upper_shift + (picks * 26).astype(np.int64)
+
+        replaced = np.where(strategies >= 0.8, random_letter, chars)
+        replaced = np.where(strategies < 0.4, adjacent, replaced)
+
+        # Strategies 2 and 3 (duplicate / delete) become output repeat counts
+        out_codes = codes.copy()
+        out_codes[chosen] = replaced
+        counts = np.ones(codes.size, dtype=np.int64)
+        counts[chosen[(strategies >= 0.4) & (strategies < 0.6)]] = 2
+        counts[chosen[(strategies >= 0.6) & (strategies < 0.8)]] = 0
+
+        return np.repeat(out_codes, counts).tobytes().decode("ascii")
 
     def _should_corrupt_word(self, word: str) -> bool:
         """
@@ -76,42 +222,12 @@ class ErrorInjector:
             return False
 
         # Skip if word is all punctuation
-        if all(c in string.punctuation for c in word):
+        if all(c in self.PUNCTUATION for c in word):
             return False
 
         return True
 
-    def _corrupt_word(self, word: str, error_rate: float) -> str:
-        """
-        Corrupt a single word by introducing errors.
-
-        Args:
-            word: Word to corrupt
-            error_rate: Proportion of characters to corrupt
-
-        Returns:
-            Corrupted word
-        """
-        chars = list(word)
-        num_chars_to_corrupt = max(1, int(len(chars) * error_rate))
-
-        # Get indices of alphabetic characters (skip punctuation)
-        alpha_indices = [i for i, c in enumerate(chars) if c.isalpha()]
-
-        if not alpha_indices:
-            return word
-
-        # Sample indices to corrupt
-        num_to_corrupt = min(num_chars_to_corrupt, len(alpha_indices))
-        indices_to_corrupt = random.sample(alpha_indices, num_to_corrupt)
-
-        # Apply random corruption to selected indices
-        for idx in indices_to_corrupt:
-            chars[idx] = self._corrupt_char(chars[idx])
-
-        return "".join(chars)
-
-    def _corrupt_char(self, char: str) -> str:
+    def _corrupt_char(self, char: str, strategy: float, pick: float) -> str:
         """
         Corrupt a single character using one of several strategies.
 
@@ -123,15 +239,15 @@ class ErrorInjector:
 
         Args:
             char: Character to corrupt
+            strategy: Uniform draw in [0, 1) selecting the strategy
+            pick: Uniform draw in [0, 1) selecting the replacement key/letter
 
         Returns:
             Corrupted character (may be empty string for deletion)
         """
-        strategy = random.random()
-
         if strategy < 0.4:
             # Adjacent keyboard key
-            return self._get_adjacent_key(char)
+            return self._get_adjacent_key(char, pick)
         elif strategy < 0.6:
             # Duplicate
             return char + char
@@ -141,33 +257,31 @@ class ErrorInjector:
         else:
             # Random replacement
             if char.isupper():
-                return random.choice(string.ascii_uppercase)
+                letters = string.ascii_uppercase
             else:
-                return random.choice(string.ascii_lowercase)
+                letters = string.ascii_lowercase
+            return letters[int(pick * len(letters))]
 
-    def _get_adjacent_key(self, char: str) -> str:
+    def _get_adjacent_key(self, char: str, pick: float) -> str:
         """
         Get an adjacent keyboard key for the given character.
 
         Args:
             char: Character to find adjacent key for
+            pick: Uniform draw in [0, 1) selecting among the adjacent keys
 
         Returns:
             Adjacent character
         """
-        # QWERTY keyboard layout adjacency map
-        adjacency = {
-            "q": "wa", "w": "qeas", "e": "wrds", "r": "etf", "t": "ryg",
-            "y": "tuh", "u": "yij", "i": "uok", "o": "ipl", "p": "ol",
-            "a": "qwsz", "s": "awedxz", "d": "serfcx", "f": "drtgvc",
-            "g": "ftyhbv", "h": "gyujnb", "j": "huikmn", "k": "jiolm",
-            "l": "kop", "z": "asx", "x": "zsdc", "c": "xdfv", "v": "cfgb",
-            "b": "vghn", "n": "bhjm", "m": "njk",
-        }
-
-        lower_char = char.lower()
-        if lower_char in adjacency:
-            adjacent = random.choice(adjacency[lower_char])
+        # Only ASCII has adjacent keys; lowercasing first could turn a
+        # non-ASCII letter into two code points (e.g. 'İ')
+        code = ord(char)
+        count = 0
+        if code < 128:
+            code = ord(chr(code).lower())
+            count = int(self._ADJ_N[code])
+        if count:
+            adjacent = chr(self._ADJ[code, int(pick * count)])
             return adjacent.upper() if char.isupper() else adjacent
         else:
             # If not in map, return original
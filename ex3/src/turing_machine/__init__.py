@@ -9,13 +9,15 @@ This module provides a classical Turing Machine implementation with:
 """
 
 from .tape import Tape
-from .tm_simulator import TuringMachine, TMResult, TMConfig
-from .config_loader import load_tm_config
+from .tm_simulator import TuringMachine, TMResult, TMConfig, TMTrace
+from .config_loader import load_tm_config, load_tm_config_dict
 
 __all__ = [
     "Tape",
     "TuringMachine",
     "TMResult",
     "TMConfig",
+    "TMTrace",
     "load_tm_config",
+    "load_tm_config_dict",
 ]
@@ -0,0 +1,85 @@
+"""
+Turing Machine Kernel
+
+Compiled version of the untraced run loop. When Numba is installed the
+step loop is JIT-compiled to machine code operating directly on the tape
+buffer; otherwise run_kernel is None and the simulator keeps its pure
+Python loop.
+"""
+
+import numpy as np
+from typing import List, Optional, Tuple
+
+# Optional JIT: the simulator falls back to its Python loop without numba
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Column layout of the dense transition table
+NEXT_STATE, WRITE, DELTA = 0, 1, 2
+
+
+def build_table(
+    rows: List[List[Optional[Tuple[int, int, int]]]], halting: List[bool]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert compiled transition rows into arrays for the kernel.
+
+    Args:
+        rows: rows[state_id][symbol_code] is (new_state_id, write_code,
+              head delta), or None when no transition is defined
+        halting: halting[state_id] is True for halting states
+
+    Returns:
+        (table, halting_mask): table has shape (states, symbols, 3) with a
+        next state of -1 marking undefined transitions
+    """
+    table = np.zeros((len(rows), len(rows[0]) if rows else 0, 3), dtype=np.int32)
+    table[:, :, NEXT_STATE] = -1
+    for state_id, row in enumerate(rows):
+        for code, transition in enumerate(row):
+            if transition is not None:
+                table[state_id, code] = transition
+    return table, np.array(halting, dtype=np.bool_)
+
+
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def run_kernel(
+        buf: np.ndarray,
+        head: int,
+        start: int,
+        end: int,
+        state: int,
+        table: np.ndarray,
+        halting: np.ndarray,
+        steps: int,
+        max_steps: int,
+    ) -> Tuple[int, int, int]:
+        """
+        Step the machine until it halts, max_steps is reached, or the head
+        leaves the visited region [start, end) and the tape must grow.
+
+        Returns:
+            (head, state, steps) after the last step taken
+        """
+        while steps < max_steps and not halting[state]:
+            symbol = buf[head]
+            next_state = table[state, symbol, NEXT_STATE]
+            if next_state < 0:
+                break
+
+            buf[head] = table[state, symbol, WRITE]
+            head += table[state, symbol, DELTA]
+            state = next_state
+            steps += 1
+
+            if head < start or head >= end:
+                break
+
+        return head, state, steps
+
+else:
+    run_kernel = None
@@ -5,15 +5,25 @@ Supports loading TM configurations from JSON and YAML files.
 """
 
 import json
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Set
 from .tm_simulator import TMConfig
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing when available
+    orjson = None
+
 
 def load_tm_config(file_path: str) -> TMConfig:
     """
     Load a Turing Machine configuration from a JSON or YAML file.
 
+    Parsed configurations are cached per file (keyed on modification time),
+    so repeated loads of the same machine skip disk I/O and validation.
+
     Args:
         file_path: Path to the configuration file
 
@@ -29,6 +39,29 @@ def load_tm_config(file_path: str) -> TMConfig:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
+    path = path.resolve()
+    return _load_tm_config_cached(path, path.stat().st_mtime_ns)
+
+
+def load_tm_config_dict(data: Dict[str, Any]) -> TMConfig:
+    """
+    Build a Turing Machine configuration from an in-memory dictionary.
+
+    Args:
+        data: Dictionary with the same layout as a JSON config file
+
+    Returns:
+        TMConfig object
+
+    Raises:
+        ValueError: If required fields are missing or invalid
+    """
+    return _parse_config(data)
+
+
+@lru_cache(maxsize=None)
+def _load_tm_config_cached(path: Path, mtime_ns: int) -> TMConfig:
+    """Load and parse a config file; mtime_ns invalidates stale entries."""
     # Load file based on extension
     if path.suffix.lower() == ".json":
         data = _load_json(path)
@@ -45,6 +78,9 @@ def load_tm_config(file_path: str) -> TMConfig:
 
 def _load_json(path: Path) -> Dict[str, Any]:
     """Load JSON configuration file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -58,8 +94,11 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
             "PyYAML is required to load YAML files. Install it with: pip install pyyaml"
         )
 
+    # Prefer the libyaml-backed C loader; same safe semantics, much faster
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
 
 
 def _parse_config(data: Dict[str, Any]) -> TMConfig:
@@ -106,42 +145,41 @@ def _parse_config(data: Dict[str, Any]) -> TMConfig:
     if blank_symbol not in alphabet:
         raise ValueError(f"Blank symbol '{blank_symbol}' not in alphabet")
 
-    # Parse transitions
-    transitions = {}
-    for transition in data["transitions"]:
-        # Validate transition fields
-        required_trans_fields = ["state", "symbol", "new_state", "write", "move"]
-        for field in required_trans_fields:
-            if field not in transition:
-                raise ValueError(f"Transition missing required field: {field}")
-
-        state = transition["state"]
-        symbol = transition["symbol"]
-        new_state = transition["new_state"]
-        write_symbol = transition["write"]
-        direction = transition["move"]
-
-        # Validate transition components
-        if state not in states:
-            raise ValueError(f"Unknown state in transition: {state}")
-        if symbol not in alphabet:
-            raise ValueError(f"Unknown symbol in transition: {symbol}")
-        if new_state not in states:
-            raise ValueError(f"Unknown new_state in transition: {new_state}")
-        if write_symbol not in alphabet:
-            raise ValueError(f"Unknown write symbol in transition: {write_symbol}")
-        if direction not in ["L", "R"]:
-            raise ValueError(
-                f"Invalid direction in transition: {direction}. Must be 'L' or 'R'"
-            )
-
-        # Add transition to table
-        key = (state, symbol)
-        if key in transitions:
-            raise ValueError(
-                f"Duplicate transition for state={state}, symbol={symbol}"
-            )
-        transitions[key] = (new_state, write_symbol, direction)
+    # Extract each transition's fields with one C-level itemgetter call
+    getter = itemgetter("state", "symbol", "new_state", "write", "move")
+    try:
+        rows = [getter(transition) for transition in data["transitions"]]
+    except KeyError as e:
+        raise ValueError(f"Transition missing required field: {e.args[0]}") from None
+
+    # Validate transition components in bulk: one set difference per column
+    # instead of per-row membership tests
+    columns = list(zip(*rows)) if rows else [()] * 5
+    used_states, used_symbols, used_new_states, used_writes, used_moves = map(
+        set, columns
+    )
+    _check_known("state", used_states, states)
+    _check_known("symbol", used_symbols, alphabet)
+    _check_known("new_state", used_new_states, states)
+    _check_known("write symbol", used_writes, alphabet)
+
+    invalid_moves = used_moves - {"L", "R"}
+    if invalid_moves:
+        raise ValueError(
+            f"Invalid direction in transition: {_format_values(invalid_moves)}. "
+            "Must be 'L' or 'R'"
+        )
+
+    # Build transition table; a shorter table means a repeated (state, symbol)
+    transitions = {(s, sym): (ns, w, mv) for s, sym, ns, w, mv in rows}
+    if len(transitions) != len(rows):
+        seen = set()
+        for state, symbol, *_ in rows:
+            if (state, symbol) in seen:
+                raise ValueError(
+                    f"Duplicate transition for state={state}, symbol={symbol}"
+                )
+            seen.add((state, symbol))
 
     return TMConfig(
         states=states,
@@ -151,3 +189,15 @@ def _parse_config(data: Dict[str, Any]) -> TMConfig:
         halting_states=halting_states,
         blank_symbol=blank_symbol,
     )
+
+
+def _check_known(kind: str, used: Set[str], known: Set[str]) -> None:
+    """Raise ValueError if any value used in transitions is not in known."""
+    unknown = used - known
+    if unknown:
+        raise ValueError(f"Unknown {kind} in transition: {_format_values(unknown)}")
+
+
+def _format_values(values: Set[str]) -> str:
+    """Format offending values deterministically for error messages."""
+    return ", ".join(sorted(map(str, values)))
@@ -5,34 +5,107 @@ The tape is unbounded in both directions and uses a blank symbol
 for uninitialized cells.
 """
 
-from typing import List
+from typing import Dict, Iterable, List, Optional
+
+# Cells are single bytes, so a tape can hold at most this many distinct symbols
+MAX_SYMBOLS = 256
+
+# Minimum number of blank cells added when the buffer runs out of slack
+MIN_GROWTH = 16
 
 
 class Tape:
     """
     Represents an infinite tape for a Turing Machine.
 
-    The tape is implemented as a dynamic list that grows as needed.
-    The head position tracks the current location on the tape.
+    The tape is stored as a bytearray of one-byte symbol codes; the blank
+    symbol is always code 0. The buffer keeps blank slack on both sides
+    and doubles when the head runs off either end, so growing the tape in
+    either direction is amortized O(1) per cell. Only the region the head
+    has visited, buf[start:end], is part of the tape's content.
 
     Attributes:
-        cells: List of symbols on the tape
-        head_position: Current position of the read/write head
+        buf: Symbol codes of the tape cells, including slack
+        head_position: Index of the read/write head in buf
+        start: Index in buf of the leftmost visited cell
+        end: Index in buf just past the rightmost visited cell
         blank_symbol: Symbol used for blank cells
     """
 
-    def __init__(self, content: str = "", blank_symbol: str = "_"):
+    def __init__(
+        self,
+        content: str = "",
+        blank_symbol: str = "_",
+        symbols: Optional[Iterable[str]] = None,
+    ):
         """
         Initialize the tape with optional content.
 
         Args:
             content: Initial content to write on the tape
             blank_symbol: Symbol to use for blank cells (default: "_")
+            symbols: Optional symbols to register up front, in code order
+                     after the blank (e.g. the machine's alphabet); other
+                     symbols are registered on first write
+
+        Raises:
+            ValueError: If more than MAX_SYMBOLS distinct symbols are used
         """
         self.blank_symbol = blank_symbol
-        self.cells: List[str] = list(content) if content else [blank_symbol]
+
+        # Code <-> symbol tables; _table translates codes to characters for
+        # get_content while every symbol is a single Latin-1 character
+        self._symbols: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._table = bytearray(MAX_SYMBOLS)
+        self._single_byte = True
+
+        self._add_symbol(blank_symbol)
+        for symbol in symbols or ():
+            self.encode(symbol)
+
+        self.buf = bytearray(map(self.encode, content)) if content else bytearray(1)
         self.head_position = 0
 
+        # Visited region of buf; cells outside it are unused slack
+        self.start = 0
+        self.end = len(self.buf)
+
+    @property
+    def cells(self) -> List[str]:
+        """List of symbols on the tape."""
+        return [self._symbols[code] for code in self.buf[self.start : self.end]]
+
+    def encode(self, symbol: str) -> int:
+        """
+        Get the one-byte code for a symbol, registering it if new.
+
+        Args:
+            symbol: Tape symbol
+
+        Returns:
+            Code stored in the tape buffer for this symbol
+
+        Raises:
+            ValueError: If more than MAX_SYMBOLS distinct symbols are used
+        """
+        code = self._codes.get(symbol)
+        if code is None:
+            code = self._add_symbol(symbol)
+        return code
+
+    def decode(self, code: int) -> str:
+        """
+        Get the symbol for a one-byte code.
+
+        Args:
+            code: Code stored in the tape buffer
+
+        Returns:
+            The corresponding tape symbol
+        """
+        return self._symbols[code]
+
     def read(self) -> str:
         """
         Read the symbol at the current head position.
@@ -41,7 +114,7 @@ class Tape:
             The symbol at the current position
         """
         self._ensure_position_exists()
-        return self.cells[self.head_position]
+        return self._symbols[self.buf[self.head_position]]
 
     def write(self, symbol: str) -> None:
         """
@@ -51,7 +124,7 @@ class Tape:
             symbol: The symbol to write
         """
         self._ensure_position_exists()
-        self.cells[self.head_position] = symbol
+        self.buf[self.head_position] = self.encode(symbol)
 
     def move(self, direction: str) -> None:
         """
@@ -75,15 +148,53 @@ class Tape:
     def _ensure_position_exists(self) -> None:
         """
         Extend the tape if the head position is outside current bounds.
+
+        Extends the visited region to include the head, doubling the buffer
+        when the head has run past its slack on either side.
         """
-        # Extend right if needed
-        while self.head_position >= len(self.cells):
-            self.cells.append(self.blank_symbol)
+        head = self.head_position
+
+        if head < self.start:
+            if head < 0:
+                # Out of left slack: prepend at least as many blanks as the
+                # buffer holds, so repeated leftward growth is amortized O(1)
+                pad = max(MIN_GROWTH, len(self.buf), -head)
+                self.buf[0:0] = bytes(pad)
+                head += pad
+                self.head_position = head
+                self.end += pad
+            self.start = head
+
+        elif head >= self.end:
+            if head >= len(self.buf):
+                size = len(self.buf)
+                self.buf.extend(bytes(max(MIN_GROWTH, size, head - size + 1)))
+            self.end = head + 1
+
+    def _add_symbol(self, symbol: str) -> int:
+        """Register a new symbol and return its code."""
+        code = len(self._symbols)
+        if code >= MAX_SYMBOLS:
+            raise ValueError(f"Tape supports at most {MAX_SYMBOLS} distinct symbols")
+
+        self._symbols.append(symbol)
+        self._codes[symbol] = code
+        if len(symbol) == 1 and ord(symbol) < 256:
+            self._table[code] = ord(symbol)
+        else:
+            self._single_byte = False
+        return code
 
-        # Extend left if needed
-        while self.head_position < 0:
-            self.cells.insert(0, self.blank_symbol)
-            self.head_position += 1
+    def _decode_all(self) -> str:
+        """Decode the whole buffer into a string of symbols."""
+        return self._decode(self.buf[self.start : self.end])
+
+    def _decode(self, codes: bytearray) -> str:
+        """Decode symbol codes into a string of symbols."""
+        if self._single_byte:
+            # One C-level pass: code -> Latin-1 byte, then bytes -> str
+            return codes.translate(self._table).decode("latin-1")
+        return "".join([self._symbols[code] for code in codes])
 
     def get_content(self, strip_blanks: bool = True) -> str:
         """
@@ -95,13 +206,18 @@ class Tape:
         Returns:
             String representation of the tape content
         """
-        content = "".join(self.cells)
-        if strip_blanks:
-            content = content.strip(self.blank_symbol)
+        if strip_blanks and self._single_byte:
+            # Every symbol is one character, so stripping blank codes before
+            # decoding is the same as stripping the decoded string
+            content = self._decode(self.buf[self.start : self.end].strip(b"\0"))
+        else:
+            content = self._decode_all()
+            if strip_blanks:
+                content = content.strip(self.blank_symbol)
         return content if content else self.blank_symbol
 
     def __str__(self) -> str:
         """String representation of the tape with head position indicator."""
-        tape_str = "".join(self.cells)
-        head_indicator = " " * self.head_position + "^"
+        tape_str = self._decode_all()
+        head_indicator = " " * (self.head_position - self.start) + "^"
         return f"{tape_str}\n{head_indicator}"
@@ -8,16 +8,41 @@ Implements a classical Turing Machine with:
 - Halting conditions
 """
 
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
-from .tape import Tape
+from types import MappingProxyType
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 
-@dataclass
+from . import _kernel
+from .tape import MAX_SYMBOLS, Tape
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TMConfig:
     """
     Configuration for a Turing Machine.
 
+    Configs are immutable: the state and symbol sets are stored as
+    frozensets and the transition table as a read-only mapping, so
+    machines built from the same config can share its compiled
+    transition table.
+
     Attributes:
         states: Set of all valid states
         alphabet: Set of valid tape symbols
@@ -27,15 +52,70 @@ class TMConfig:
         blank_symbol: Symbol used for blank cells
     """
 
-    states: Set[str]
-    alphabet: Set[str]
-    transitions: Dict[Tuple[str, str], Tuple[str, str, str]]
+    states: FrozenSet[str]
+    alphabet: FrozenSet[str]
+    transitions: Mapping[Tuple[str, str], Tuple[str, str, str]]
     initial_state: str
-    halting_states: Set[str]
+    halting_states: FrozenSet[str]
     blank_symbol: str = "_"
 
+    def __post_init__(self) -> None:
+        # Accept any iterable of states/symbols, store them as frozensets
+        for name in ("states", "alphabet", "halting_states"):
+            object.__setattr__(self, name, frozenset(getattr(self, name)))
+        # Copy, then expose read-only: a later edit would leave compiled
+        # tables shared by id(config) out of date
+        object.__setattr__(self, "transitions", MappingProxyType(dict(self.transitions)))
+
+
+# One recorded step: (step, state, read, write, move, new_state)
+TraceStep = Tuple[int, str, str, str, str, str]
+
+
+class TMTrace(Sequence[str]):
+    """
+    Execution trace of a Turing Machine run.
+
+    Steps are recorded as tuples and formatted into lines only when read,
+    so tracing a long run doesn't build a string per step up front.
+    """
 
-@dataclass
+    def __init__(self) -> None:
+        self.steps: List[TraceStep] = []
+
+    def record(self, step: TraceStep) -> None:
+        """Record one executed step."""
+        self.steps.append(step)
+
+    @staticmethod
+    def format_step(step: TraceStep) -> str:
+        """Format a recorded step as a trace line."""
+        number, state, read, write, move, new_state = step
+        return (
+            f"Step {number}: State={state}, Read={read}, Write={write}, "
+            f"Move={move}, NewState={new_state}"
+        )
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self.format_step(step) for step in self.steps[index]]
+        return self.format_step(self.steps[index])
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TMTrace):
+            return self.steps == other.steps
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TMTrace({list(self)!r})"
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TMResult:
     """
     Result of Turing Machine execution.
@@ -46,7 +126,7 @@ class TMResult:
         final_state: State when execution stopped
         steps_taken: Number of steps executed
         halted: Whether machine reached a halting state
-        trace: Optional list of execution steps
+        trace: Optional sequence of execution steps, one line per step
     """
 
     initial_tape: str
@@ -54,7 +134,47 @@ class TMResult:
     final_state: str
     steps_taken: int
     halted: bool
-    trace: Optional[List[str]] = None
+    trace: Optional[Sequence[str]] = None
+
+    def format_trace(self) -> str:
+        """
+        Format the execution trace as text.
+
+        Returns:
+            Trace lines joined by newlines (empty if no trace was recorded)
+        """
+        return "\n".join(self.trace) if self.trace else ""
+
+
+class _CompiledTransitions(NamedTuple):
+    """
+    Transition table compiled for the fast run loop.
+
+    Attributes:
+        state_names: State name for each state id
+        state_ids: State id for each state name
+        rows: rows[state_id][symbol_code] is (new_state_id, write_code,
+              head delta), or None when no transition is defined
+        halting: halting[state_id] is True for halting states
+        table: rows as a (states, symbols, 3) array for the JIT kernel,
+               or None when numba is not installed
+        halting_mask: halting as a boolean array for the JIT kernel
+    """
+
+    state_names: List[str]
+    state_ids: Dict[str, int]
+    rows: List[List[Optional[Tuple[int, int, int]]]]
+    halting: List[bool]
+    table: Optional[np.ndarray] = None
+    halting_mask: Optional[np.ndarray] = None
+
+
+# Compiled tables shared by machines running the same config object, keyed
+# on id(config); entries hold the config so its id can't be reused
+_COMPILED_CACHE_SIZE = 32
+_compiled_cache: "OrderedDict[int, Tuple[TMConfig, _CompiledTransitions]]" = (
+    OrderedDict()
+)
 
 
 class TuringMachine:
@@ -73,10 +193,29 @@ class TuringMachine:
             config: TMConfig object containing machine definition
         """
         self.config = config
+
+        # Every symbol the machine can read or write gets a fixed tape code
+        self._tape_symbols = sorted(
+            set(config.alphabet)
+            | {symbol for _, symbol in config.transitions}
+            | {write for _, write, _ in config.transitions.values()}
+        )
+
         self.current_state = config.initial_state
-        self.tape = Tape(blank_symbol=config.blank_symbol)
+        self.tape = self._new_tape()
         self.steps = 0
-        self.trace: List[str] = []
+        self.trace = TMTrace()
+
+        # Dense transition table used by step() and run(); built on first use
+        self._compiled: Optional[_CompiledTransitions] = None
+
+    def _new_tape(self, content: str = "") -> Tape:
+        """Create a tape with the machine's alphabet pre-registered."""
+        return Tape(
+            content,
+            blank_symbol=self.config.blank_symbol,
+            symbols=self._tape_symbols,
+        )
 
     def load_tape(self, content: str) -> None:
         """
@@ -85,10 +224,10 @@ class TuringMachine:
         Args:
             content: String to write on the tape
         """
-        self.tape = Tape(content, blank_symbol=self.config.blank_symbol)
+        self.tape = self._new_tape(content)
         self.current_state = self.config.initial_state
         self.steps = 0
-        self.trace = []
+        self.trace = TMTrace()
 
     def step(self, record_trace: bool = False) -> bool:
         """
@@ -101,35 +240,45 @@ class TuringMachine:
             True if the machine should continue, False if it should halt
 
         Raises:
-            RuntimeError: If an invalid transition is encountered
+            ValueError: If the transition table has an invalid direction
         """
-        # Check if in halting state
-        if self.current_state in self.config.halting_states:
-            return False
+        compiled = self._get_compiled()
 
-        # Read current symbol
-        current_symbol = self.tape.read()
+        # Check if in halting state (states outside the table have no
+        # transitions and halt implicitly)
+        state = compiled.state_ids.get(self.current_state)
+        if state is None or compiled.halting[state]:
+            return False
 
-        # Look up transition
-        transition_key = (self.current_state, current_symbol)
-        if transition_key not in self.config.transitions:
+        # Read current symbol code and look up the transition
+        tape = self.tape
+        tape._ensure_position_exists()
+        code = tape.buf[tape.head_position]
+        transition = compiled.rows[state][code]
+        if transition is None:
             # No defined transition - treat as implicit halt
             return False
 
-        new_state, write_symbol, direction = self.config.transitions[transition_key]
+        new_state, write_code, delta = transition
 
-        # Record trace if requested
+        # Record trace if requested (formatted lazily by TMTrace)
         if record_trace:
-            self.trace.append(
-                f"Step {self.steps}: State={self.current_state}, "
-                f"Read={current_symbol}, Write={write_symbol}, "
-                f"Move={direction}, NewState={new_state}"
+            self.trace.record(
+                (
+                    self.steps,
+                    self.current_state,
+                    tape.decode(code),
+                    tape.decode(write_code),
+                    "R" if delta > 0 else "L",
+                    compiled.state_names[new_state],
+                )
             )
 
         # Execute transition
-        self.tape.write(write_symbol)
-        self.tape.move(direction)
-        self.current_state = new_state
+        tape.buf[tape.head_position] = write_code
+        tape.head_position += delta
+        tape._ensure_position_exists()
+        self.current_state = compiled.state_names[new_state]
         self.steps += 1
 
         return True
@@ -148,10 +297,13 @@ class TuringMachine:
         initial_tape_content = self.tape.get_content()
 
         # Execute steps
-        while self.steps < max_steps:
-            should_continue = self.step(record_trace)
-            if not should_continue:
-                break
+        if record_trace:
+            while self.steps < max_steps:
+                should_continue = self.step(record_trace)
+                if not should_continue:
+                    break
+        else:
+            self._run_fast(max_steps)
 
         # Determine if halted normally
         halted = self.current_state in self.config.halting_states
@@ -165,12 +317,170 @@ class TuringMachine:
             trace=self.trace if record_trace else None,
         )
 
+    def _run_fast(self, max_steps: int) -> None:
+        """
+        Execute steps without tracing in a single fused loop.
+
+        Equivalent to calling step() until it returns False or max_steps is
+        reached, but reads and writes symbol codes directly in the tape
+        buffer and looks transitions up by integer state id, with all
+        lookups held in locals. With numba installed the loop runs in the
+        JIT-compiled kernel instead.
+
+        Args:
+            max_steps: Maximum number of steps (counting those already taken)
+        """
+        compiled = self._get_compiled()
+        if self.current_state not in compiled.state_ids:
+            # Unknown state: no transitions, so it halts implicitly
+            return
+
+        if compiled.table is not None:
+            self._run_kernel(max_steps)
+            return
+
+        rows = compiled.rows
+        halting = compiled.halting
+        tape = self.tape
+        buf = tape.buf
+        start = tape.start
+        end = tape.end
+        head = tape.head_position
+        state = compiled.state_ids[self.current_state]
+        steps = self.steps
+
+        while steps < max_steps and not halting[state]:
+            transition = rows[state][buf[head]]
+            if transition is None:
+                # No defined transition - treat as implicit halt
+                break
+
+            state, buf[head], delta = transition
+            head += delta
+            steps += 1
+
+            if head < start or head >= end:
+                # First visit to this cell: extend the tape (may move the
+                # origin when the buffer grows left), then reload
+                tape.head_position = head
+                tape._ensure_position_exists()
+                buf = tape.buf
+                start = tape.start
+                end = tape.end
+                head = tape.head_position
+
+        tape.head_position = head
+        self.current_state = compiled.state_names[state]
+        self.steps = steps
+
+    def _run_kernel(self, max_steps: int) -> None:
+        """
+        Execute untraced steps in the JIT-compiled kernel.
+
+        The kernel returns whenever the head reaches an unvisited cell;
+        the tape is grown here and the kernel re-entered.
+
+        Args:
+            max_steps: Maximum number of steps (counting those already taken)
+        """
+        compiled = self._compiled
+        tape = self.tape
+        state = compiled.state_ids[self.current_state]
+        steps = self.steps
+
+        while True:
+            # The view must be released before the bytearray can be resized
+            buf = np.frombuffer(tape.buf, dtype=np.uint8)
+            head, state, steps = _kernel.run_kernel(
+                buf,
+                tape.head_position,
+                tape.start,
+                tape.end,
+                state,
+                compiled.table,
+                compiled.halting_mask,
+                steps,
+                max_steps,
+            )
+            del buf
+
+            tape.head_position = head
+            if tape.start <= head < tape.end:
+                break
+            tape._ensure_position_exists()
+
+        self.current_state = compiled.state_names[state]
+        self.steps = steps
+
+    def _get_compiled(self) -> "_CompiledTransitions":
+        """Return the compiled transition table, building it on first use."""
+        if self._compiled is None:
+            key = id(self.config)
+            entry = _compiled_cache.get(key)
+            if entry is not None and entry[0] is self.config:
+                _compiled_cache.move_to_end(key)
+                self._compiled = entry[1]
+            else:
+                self._compiled = self._compile_transitions()
+                _compiled_cache[key] = (self.config, self._compiled)
+                while len(_compiled_cache) > _COMPILED_CACHE_SIZE:
+                    _compiled_cache.popitem(last=False)
+        return self._compiled
+
+    def _compile_transitions(self) -> "_CompiledTransitions":
+        """
+        Compile the transition table into dense integer-indexed rows.
+
+        States are numbered and symbols use the tape's one-byte codes, so
+        a step is rows[state_id][symbol_code] instead of hashing a tuple of
+        strings.
+
+        Returns:
+            Compiled transition table
+
+        Raises:
+            ValueError: If a transition has an invalid direction
+        """
+        config = self.config
+        state_names = sorted(
+            set(config.states)
+            | set(config.halting_states)
+            | {config.initial_state}
+            | {state for state, _ in config.transitions}
+            | {new_state for new_state, _, _ in config.transitions.values()}
+        )
+        state_ids = {name: i for i, name in enumerate(state_names)}
+
+        deltas = {"L": -1, "R": 1}
+        encode = self.tape.encode
+        rows: List[List[Optional[Tuple[int, int, int]]]] = [
+            [None] * MAX_SYMBOLS for _ in state_names
+        ]
+        for (state, symbol), target in config.transitions.items():
+            new_state, write_symbol, direction = target
+            if direction not in deltas:
+                raise ValueError(f"Invalid direction: {direction}. Must be 'L' or 'R'")
+            rows[state_ids[state]][encode(symbol)] = (
+                state_ids[new_state],
+                encode(write_symbol),
+                deltas[direction],
+            )
+
+        halting = [name in config.halting_states for name in state_names]
+        if _kernel.run_kernel is None:
+            return _CompiledTransitions(state_names, state_ids, rows, halting)
+
+        table, halting_mask = _kernel.build_table(rows, halting)
+        return _CompiledTransitions(
+            state_names, state_ids, rows, halting, table, halting_mask
+        )
+
     def reset(self) -> None:
         """Reset the machine to its initial state."""
         self.current_state = self.config.initial_state
-        self.tape = Tape(blank_symbol=self.config.blank_symbol)
+        self.tape = self._new_tape()
         self.steps = 0
-        self.trace = []
+        self.trace = TMTrace()
 
     @classmethod
     def from_config_file(cls, file_path: str) -> "TuringMachine":
@@ -187,3 +497,19 @@ class TuringMachine:
 
         config = load_tm_config(file_path)
         return cls(config)
+
+    @classmethod
+    def from_config_dict(cls, data: dict) -> "TuringMachine":
+        """
+        Create a TuringMachine from an in-memory configuration dictionary.
+
+        Args:
+            data: Dictionary with the same layout as a JSON config file
+
+        Returns:
+            Initialized TuringMachine instance
+        """
+        from .config_loader import load_tm_config_dict
+
+        config = load_tm_config_dict(data)
+        return cls(config)
@@ -102,3 +102,87 @@ class TestDistanceCalculator:
         # Verify similarity = 1 - distance
         distance = DistanceCalculator.cosine_distance(v1, v2)
         assert similarity == pytest.approx(1.0 - distance, abs=1e-6)
+
+    def test_cosine_and_euclidean_matches_separate(self):
+        """Test fused calculation matches the individual metrics."""
+        v1 = np.array([1.0, 2.0, 3.0])
+        v2 = np.array([4.0, -5.0, 6.0])
+
+        cosine, euclidean = DistanceCalculator.cosine_and_euclidean(v1, v2)
+
+        assert cosine == pytest.approx(
+            DistanceCalculator.cosine_distance(v1, v2), abs=1e-9
+        )
+        assert euclidean == pytest.approx(
+            DistanceCalculator.euclidean_distance(v1, v2), abs=1e-9
+        )
+
+    def test_cosine_and_euclidean_identical(self):
+        """Test fused calculation for identical vectors."""
+        v1 = np.array([0.3, 0.4, 0.5], dtype=np.float32)
+
+        cosine, euclidean = DistanceCalculator.cosine_and_euclidean(v1, v1.copy())
+
+        assert cosine == pytest.approx(0.0, abs=1e-6)
+        assert euclidean == pytest.approx(0.0, abs=1e-6)
+
+    def test_cosine_distance_normalized_matches_generic(self):
+        """Test dot-product cosine distance on unit vectors."""
+        rng = np.random.default_rng(0)
+        v1 = rng.normal(size=384)
+        v2 = rng.normal(size=384)
+        v1 /= np.linalg.norm(v1)
+        v2 /= np.linalg.norm(v2)
+
+        assert DistanceCalculator.cosine_distance_normalized(
+            v1, v2
+        ) == pytest.approx(DistanceCalculator.cosine_distance(v1, v2), abs=1e-9)
+        assert DistanceCalculator.cosine_distance_normalized(
+            v1, v1
+        ) == pytest.approx(0.0, abs=1e-9)
+
+    def test_batch_cosine_and_euclidean_normalized(self):
+        """Test the unit-vector batch path against the generic one."""
+        rng = np.random.default_rng(1)
+        a = rng.normal(size=(8, 64))
+        b = rng.normal(size=(8, 64))
+        a /= np.linalg.norm(a, axis=1, keepdims=True)
+        b /= np.linalg.norm(b, axis=1, keepdims=True)
+
+        cos_fast, euc_fast = DistanceCalculator.batch_cosine_and_euclidean(
+            a, b, normalized=True
+        )
+        cos_ref, euc_ref = DistanceCalculator.batch_cosine_and_euclidean(a, b)
+
+        np.testing.assert_allclose(cos_fast, cos_ref, atol=1e-9)
+        np.testing.assert_allclose(euc_fast, euc_ref, atol=1e-9)
+
+    def test_euclidean_distance_normalized(self):
+        """Test the unit-vector Euclidean shortcut."""
+        v1 = np.array([1.0, 0.0, 0.0])
+        v2 = np.array([0.0, 1.0, 0.0])
+
+        distance = DistanceCalculator.euclidean_distance(v1, v2, normalized=True)
+        assert distance == pytest.approx(np.sqrt(2.0), abs=1e-6)
+
+    def test_float16_inputs_match_float32(self):
+        """Test half-precision embeddings give near full-precision distances."""
+        rng = np.random.default_rng(2)
+        v1 = rng.normal(size=384).astype(np.float32)
+        v2 = rng.normal(size=384).astype(np.float32)
+
+        expected = DistanceCalculator.cosine_distance(v1, v2)
+        actual = DistanceCalculator.cosine_distance(
+            v1.astype(np.float16), v2.astype(np.float16)
+        )
+        assert actual == pytest.approx(expected, abs=1e-3)
+
+    def test_euclidean_distance_precomputed_norms(self):
+        """Test Euclidean distance with caller-supplied squared norms."""
+        v1 = np.array([0.0, 0.0, 0.0])
+        v2 = np.array([3.0, 4.0, 0.0])
+
+        distance = DistanceCalculator.euclidean_distance(
+            v1, v2, norm_sq1=0.0, norm_sq2=25.0
+        )
+        assert distance == pytest.approx(5.0, abs=1e-6)
@@ -78,3 +78,32 @@ class TestErrorInjector:
         injector = ErrorInjector()
         result = injector.inject_errors("", error_rate=0.25)
         assert result == ""
+
+    def test_per_call_seed(self):
+        """Test a per-call seed matches a freshly seeded injector."""
+        text = "The quick brown fox jumps over the lazy dog"
+
+        expected = ErrorInjector(seed=7).inject_errors(text, error_rate=0.3)
+
+        injector = ErrorInjector(seed=1)
+        injector.inject_errors(text, error_rate=0.3)
+        assert injector.inject_errors(text, error_rate=0.3, seed=7) == expected
+
+    def test_non_ascii_text(self):
+        """Test non-ASCII text goes through the per-word path correctly."""
+        text = "Le café était très naïve aujourd'hui"
+
+        result1 = ErrorInjector(seed=3).inject_errors(text, error_rate=0.5)
+        result2 = ErrorInjector(seed=3).inject_errors(text, error_rate=0.5)
+
+        assert result1 == result2
+        assert result1 != text
+        assert len(result1.split()) == len(text.split())
+
+    def test_multi_codepoint_lowercase(self):
+        """Test letters whose lowercase is two code points don't break injection."""
+        text = "İstanbul İzmir İnegöl Ödemiş İğdır"
+
+        for seed in range(20):
+            result = ErrorInjector(seed=seed).inject_errors(text, error_rate=0.9)
+            assert len(result.split()) <= len(text.split())
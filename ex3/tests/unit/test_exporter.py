@@ -0,0 +1,68 @@
+"""
+Unit tests for result exporter module.
+"""
+
+import pytest
+import numpy as np
+from src.analysis.exporter import ResultExporter
+
+
+class TestResultExporter:
+    """Tests for ResultExporter class."""
+
+    def test_embeddings_npz_roundtrip(self, tmp_path):
+        """Test exported embeddings can be loaded back by text hash."""
+        texts = ["first sentence", "second sentence"]
+        embeddings = np.array([[0.6, 0.8, 0.0], [0.0, 0.6, 0.8]], dtype=np.float32)
+        output_path = tmp_path / "embeddings.npz"
+
+        ResultExporter.export_embeddings_npz(texts, embeddings, str(output_path))
+        index, loaded = ResultExporter.load_embeddings_npz(str(output_path))
+
+        assert loaded.dtype == np.float16
+        row = index[ResultExporter.text_hash("second sentence")]
+        assert loaded[row] == pytest.approx(embeddings[1], abs=1e-3)
+
+    def test_embeddings_npz_roundtrip_without_suffix(self, tmp_path):
+        """Test a path without .npz round-trips through export and load."""
+        output_path = tmp_path / "out" / "emb"
+
+        ResultExporter.export_embeddings_npz(["text"], np.ones((1, 2)), str(output_path))
+        index, loaded = ResultExporter.load_embeddings_npz(str(output_path))
+
+        assert (tmp_path / "out" / "emb.npz").exists()
+        assert index == {ResultExporter.text_hash("text"): 0}
+        assert loaded.shape == (1, 2)
+
+    def test_embeddings_npz_shape_mismatch(self, tmp_path):
+        """Test error when embedding rows do not match texts."""
+        with pytest.raises(ValueError, match="Embeddings must have shape"):
+            ResultExporter.export_embeddings_npz(
+                ["only one"], np.zeros((2, 3)), str(tmp_path / "e.npz")
+            )
+
+    def test_export_csv(self, tmp_path):
+        """Test CSV export writes header and rows in field order."""
+        data = [
+            {"error_rate": 0.0, "cosine_distance": 0.1},
+            {"error_rate": 0.5, "cosine_distance": 0.4},
+        ]
+        output_path = tmp_path / "results.csv"
+
+        ResultExporter.export_csv(data, str(output_path))
+
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert lines == ["error_rate,cosine_distance", "0.0,0.1", "0.5,0.4"]
+
+    def test_export_csv_rejects_unknown_fields(self, tmp_path):
+        """Test a record with fields missing from the header is not dropped silently."""
+        data = [
+            {"error_rate": 0.0, "cosine_distance": 0.1},
+            {"error_rate": 0.5, "cosine_distance": 0.4, "euclidean_distance": 1.2},
+        ]
+        output_path = tmp_path / "results.csv"
+
+        with pytest.raises(ValueError, match="euclidean_distance"):
+            ResultExporter.export_csv(data, str(output_path))
+
+        assert not output_path.exists()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the HuggingFace embedding provider's embedding cache.
+"""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from src.evaluation.hf_embedding import HuggingFaceEmbedding
+
+
+def fake_encode(texts, **kwargs):
+    """Encode each text as [len(text), 1.0] (a matrix for a list of texts)."""
+    if isinstance(texts, str):
+        return np.array([len(texts), 1.0])
+    return np.array([[len(text), 1.0] for text in texts])
+
+
+@pytest.fixture
+def make_provider():
+    """Build providers around a stand-in SentenceTransformer model."""
+    model = Mock()
+    model.encode.side_effect = fake_encode
+    model.get_sentence_embedding_dimension.return_value = 2
+    module = SimpleNamespace(SentenceTransformer=Mock(return_value=model))
+
+    def make(cache_size=4096):
+        with patch.dict(sys.modules, {"sentence_transformers": module}):
+            provider = HuggingFaceEmbedding(cache_size=cache_size, device="cpu")
+        return provider, model
+
+    return make
+
+
+class TestEmbeddingCache:
+    """Tests for the LRU embedding cache."""
+
+    def test_repeated_text_skips_encoder(self, make_provider):
+        """Test a repeated text is served from the cache."""
+        provider, model = make_provider()
+
+        first = provider.embed("hello")
+        second = provider.embed("hello")
+
+        assert model.encode.call_count == 1
+        assert second is first
+
+    def test_batch_encodes_only_misses(self, make_provider):
+        """Test a batch only encodes texts not already cached."""
+        provider, model = make_provider()
+        provider.embed("hello")
+
+        result = provider.embed_batch(["hello", "hi", "hello"])
+
+        assert model.encode.call_args.args[0] == ["hi"]
+        np.testing.assert_array_equal(result[:, 0], [5, 2, 5])
+
+    def test_evicts_least_recently_used(self, make_provider):
+        """Test the least recently used text is evicted beyond cache_size."""
+        provider, model = make_provider(cache_size=2)
+        provider.embed("a")
+        provider.embed("bb")
+        provider.embed("a")  # "bb" is now least recently used
+        provider.embed("ccc")
+
+        model.encode.reset_mock()
+        provider.embed("a")
+        provider.embed("ccc")
+        assert model.encode.call_count == 0
+
+        provider.embed("bb")
+        assert model.encode.call_count == 1
+
+    def test_cached_arrays_read_only(self, make_provider):
+        """Test cached embeddings can't be modified by callers."""
+        provider, _ = make_provider()
+
+        embedding = provider.embed("hello")
+        row = provider.embed_batch(["hi"])[0]
+
+        with pytest.raises(ValueError):
+            embedding[0] = 0.0
+        assert provider.embed("hi").flags.writeable is False
+        assert row.flags.writeable  # The batch result itself stays writable
+
+    def test_cache_disabled(self, make_provider):
+        """Test cache_size=0 encodes every call."""
+        provider, model = make_provider(cache_size=0)
+
+        provider.embed("hello")
+        provider.embed("hello")
+
+        assert model.encode.call_count == 2
+
+    def test_clear_cache(self, make_provider):
+        """Test clear_cache forces texts to be encoded again."""
+        provider, model = make_provider()
+        provider.embed("hello")
+
+        provider.clear_cache()
+        provider.embed("hello")
+
+        assert model.encode.call_count == 2
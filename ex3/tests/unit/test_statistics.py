@@ -0,0 +1,69 @@
+"""
+Unit tests for statistics module.
+"""
+
+import pytest
+import numpy as np
+from src.analysis.statistics import StatisticsCalculator
+
+
+class TestStatisticsCalculator:
+    """Tests for StatisticsCalculator class."""
+
+    def test_trend_perfect_line(self):
+        """Test trend on exactly linear data."""
+        x = [0.0, 0.1, 0.2, 0.3, 0.4]
+        y = [0.5 + 2.0 * v for v in x]
+
+        trend = StatisticsCalculator.calculate_trend(x, y)
+
+        assert trend.slope == pytest.approx(2.0)
+        assert trend.intercept == pytest.approx(0.5)
+        assert trend.r_squared == pytest.approx(1.0)
+        assert trend.correlation == pytest.approx(1.0)
+
+    def test_trend_matches_polyfit(self):
+        """Test trend agrees with np.polyfit and np.corrcoef on noisy data."""
+        rng = np.random.default_rng(0)
+        x = rng.random(50)
+        y = -1.5 * x + rng.normal(scale=0.2, size=50)
+
+        trend = StatisticsCalculator.calculate_trend(list(x), list(y))
+        slope, intercept = np.polyfit(x, y, 1)
+        correlation = np.corrcoef(x, y)[0, 1]
+
+        assert trend.slope == pytest.approx(slope)
+        assert trend.intercept == pytest.approx(intercept)
+        assert trend.correlation == pytest.approx(correlation)
+        assert trend.r_squared == pytest.approx(correlation**2)
+
+    def test_trend_too_short(self):
+        """Test error with fewer than two points."""
+        with pytest.raises(ValueError, match="at least 2 data points"):
+            StatisticsCalculator.calculate_trend([0.1], [0.2])
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 50])
+    def test_summary_stats_match_numpy(self, size):
+        """Test summary statistics agree with the NumPy reference functions."""
+        data = list(np.random.default_rng(size).random(size))
+
+        stats = StatisticsCalculator.calculate_summary_stats(data)
+
+        assert stats["mean"] == pytest.approx(np.mean(data))
+        assert stats["median"] == pytest.approx(np.median(data))
+        assert stats["std"] == pytest.approx(np.std(data))
+        assert stats["min"] == min(data)
+        assert stats["max"] == max(data)
+        assert stats["q25"] == pytest.approx(np.percentile(data, 25))
+        assert stats["q75"] == pytest.approx(np.percentile(data, 75))
+        assert stats["count"] == size
+
+    def test_confidence_interval_large_sample(self):
+        """Test large samples use the normal approximation."""
+        data = list(np.random.default_rng(1).normal(size=100))
+
+        lower, upper = StatisticsCalculator.calculate_confidence_interval(data)
+
+        margin = 1.96 * np.std(data, ddof=1) / np.sqrt(len(data))
+        assert lower == pytest.approx(np.mean(data) - margin)
+        assert upper == pytest.approx(np.mean(data) + margin)
@@ -3,6 +3,7 @@ Unit tests for Turing Machine module.
 """
 
 import pytest
+from pathlib import Path
 from src.turing_machine import Tape, TuringMachine, TMConfig
 
 
@@ -46,6 +47,23 @@ class TestTape:
         tape.move("R")
         assert tape.read() == "_"  # Should auto-extend
 
+    def test_tape_extend_left(self):
+        """Test tape extends when moving left past boundary."""
+        tape = Tape("1")
+        tape.move("L")
+        assert tape.read() == "_"
+        tape.write("0")
+        assert tape.get_content() == "01"
+
+    def test_tape_slack_not_in_content(self):
+        """Test unvisited slack cells are not part of the tape content."""
+        tape = Tape("ab")
+        for _ in range(3):
+            tape.move("L")
+        tape.write("c")
+        assert tape.get_content(strip_blanks=False) == "c__ab"
+        assert str(tape) == "c__ab\n^"
+
     def test_tape_invalid_direction(self):
         """Test invalid direction raises error."""
         tape = Tape("1")
@@ -70,6 +88,28 @@ class TestTuringMachine:
             blank_symbol="_",
         )
 
+    def test_config_transitions_read_only(self, simple_config):
+        """Test a config's transition table can't be changed after creation."""
+        with pytest.raises(TypeError):
+            simple_config.transitions[("q0", "0")] = ("q_halt", "1", "R")
+
+        assert ("q0", "0") not in simple_config.transitions
+
+    def test_config_copies_transitions(self):
+        """Test later edits to the source dict don't reach the config."""
+        transitions = {("q0", "1"): ("q_halt", "0", "R")}
+        config = TMConfig(
+            states={"q0", "q_halt"},
+            alphabet={"0", "1", "_"},
+            transitions=transitions,
+            initial_state="q0",
+            halting_states={"q_halt"},
+        )
+
+        transitions[("q0", "0")] = ("q_halt", "1", "R")
+
+        assert len(config.transitions) == 1
+
     def test_tm_initialization(self, simple_config):
         """Test TM initialization."""
         tm = TuringMachine(simple_config)
@@ -103,6 +143,18 @@ class TestTuringMachine:
         assert result.steps_taken == 1
         assert result.halted is True
 
+    def test_tm_run_trace(self, simple_config):
+        """Test trace lines are formatted from recorded steps."""
+        tm = TuringMachine(simple_config)
+        tm.load_tape("1")
+        result = tm.run(max_steps=100, record_trace=True)
+
+        line = "Step 0: State=q0, Read=1, Write=0, Move=R, NewState=q_halt"
+        assert len(result.trace) == 1
+        assert result.trace[0] == line
+        assert result.trace[-10:] == [line]
+        assert result.format_trace() == line
+
     def test_tm_reset(self, simple_config):
         """Test resetting TM."""
         tm = TuringMachine(simple_config)
@@ -134,3 +186,30 @@ class TestTuringMachine:
 
         assert result.steps_taken == 10
         assert result.halted is False
+
+    def test_tm_from_config_dict(self):
+        """Test creating a TM from an in-memory configuration."""
+        tm = TuringMachine.from_config_dict(
+            {
+                "states": ["q0", "q_halt"],
+                "alphabet": ["1", "_"],
+                "transitions": [
+                    {"state": "q0", "symbol": "1", "new_state": "q0", "write": "1", "move": "R"},
+                    {"state": "q0", "symbol": "_", "new_state": "q_halt", "write": "1", "move": "R"},
+                ],
+                "initial_state": "q0",
+                "halting_states": ["q_halt"],
+            }
+        )
+        tm.load_tape("11")
+        result = tm.run(max_steps=100)
+
+        assert result.final_tape == "111"
+        assert result.halted is True
+
+    def test_config_file_cached(self):
+        """Test repeated loads of a config file reuse the parsed config."""
+        config_path = Path(__file__).parents[2] / "machines" / "unary_increment.json"
+        first = TuringMachine.from_config_file(str(config_path))
+        second = TuringMachine.from_config_file(str(config_path))
+        assert first.config is second.config
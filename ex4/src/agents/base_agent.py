@@ -1,16 +1,153 @@
 """Base agent class for Route Guide System."""
 
+import asyncio
+import json
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ..utils.cache import LRUCache
 from ..utils.logger import get_logger
 from ..utils.claude_client import ClaudeClient
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing when available
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Process-wide caches shared by all agents: raw Claude responses keyed on
+# (agent type, prompt digest), and parsed results keyed on (agent type,
+# normalized address) so repeated stops skip prompting and parsing too
+RESPONSE_CACHE_SIZE = 512
+RESULT_CACHE_SIZE = 512
+_response_cache: "LRUCache[str]" = LRUCache(RESPONSE_CACHE_SIZE)
+_result_cache: "LRUCache[AgentResult]" = LRUCache(RESULT_CACHE_SIZE)
+
+
+def clear_response_cache() -> None:
+    """Drop all cached Claude responses and agent results."""
+    _response_cache.clear()
+    _result_cache.clear()
+
+
+def normalize_address(address: str) -> str:
+    """Normalize an address for use in cache keys (case and spacing)."""
+    return " ".join(address.lower().split())
+
+
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+# Stateless decoder used to parse JSON embedded in prose
+_JSON_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=None)
+def load_prompt_template(filename: str) -> str:
+    """
+    Load an agent prompt template from the prompts directory.
+
+    Templates are read once per process and shared by all agent instances.
+
+    Args:
+        filename: Template file name (e.g. 'video_agent.md')
+
+    Returns:
+        Template text
+    """
+    return (PROMPTS_DIR / filename).read_text(encoding="utf-8")
+
+
+def preload_prompt_templates(wait: bool = False) -> None:
+    """
+    Read every prompt template into the template cache concurrently.
+
+    Args:
+        wait: Block until all templates are loaded; by default loading
+            continues in background threads (agents constructed meanwhile
+            simply read their template themselves)
+    """
+    filenames = [path.name for path in PROMPTS_DIR.glob("*.md")]
+    if not filenames:
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=len(filenames),
+        thread_name_prefix="PromptLoader"
+    )
+    for filename in filenames:
+        executor.submit(load_prompt_template, filename)
+    executor.shutdown(wait=wait)
+
+
+def parse_json(text: str) -> Any:
+    """
+    Parse JSON extracted from a Claude response.
+
+    Uses orjson when installed; its decode errors subclass
+    json.JSONDecodeError, so callers handle both parsers the same way.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
-@dataclass
+def extract_json(text: str, opening: str = "{") -> Any:
+    """
+    Parse the first JSON object (or array) embedded in a Claude response.
+
+    Claude may wrap the JSON in prose or a code fence, so parsing starts
+    at the first opening bracket and stops where the value ends; a stray
+    bracket in leading prose just moves the start to the next one.
+
+    Args:
+        text: Response text
+        opening: '{' for an object, '[' for an array
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        ValueError: If the text contains no valid JSON value
+    """
+    start = text.find(opening)
+    if start < 0:
+        raise ValueError("No JSON found in response")
+
+    # Common case: the JSON runs to the end of the response
+    try:
+        return parse_json(text[start:].rstrip())
+    except json.JSONDecodeError:
+        pass
+
+    while start >= 0:
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            start = text.find(opening, start + 1)
+
+    raise ValueError("No valid JSON found in response")
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AgentResult:
     """Standardized result from an agent execution."""
     agent_type: str  # 'video', 'music', 'info'
@@ -44,7 +181,8 @@ class BaseAgent(ABC):
         self,
         claude_client: ClaudeClient,
         agent_type: str,
-        timeout: int = 30
+        timeout: int = 30,
+        cache: bool = True
     ):
         """
         Initialize base agent.
@@ -53,10 +191,14 @@ class BaseAgent(ABC):
             claude_client: Claude CLI client instance
             agent_type: Type identifier ('video', 'music', 'info')
             timeout: Execution timeout in seconds
+            cache: Whether to reuse results and responses for repeated
+                   addresses and prompts
         """
         self.claude_client = claude_client
-        self.agent_type = agent_type
+        # Interned: the type is one of a few strings used as keys everywhere
+        self.agent_type = sys.intern(agent_type)
         self.timeout = timeout
+        self.cache = cache
 
     def execute(self, address: str, context: Optional[Dict] = None) -> AgentResult:
         """
@@ -78,6 +220,18 @@ class BaseAgent(ABC):
             # Validate input
             self._validate_input(address)
 
+            # Reuse an earlier result for the same stop (context-free calls
+            # only, since context may change the prompt)
+            result_key = None
+            if self.cache and not context:
+                result_key = (self.agent_type, normalize_address(address))
+                cached = _result_cache.get(result_key)
+                if cached is not None:
+                    logger.info(
+                        f"{self.agent_type.capitalize()} Agent cache hit: {cached.title}"
+                    )
+                    return cached
+
             # Create prompt for Claude
             prompt = self._create_prompt(address, context or {})
 
@@ -91,6 +245,9 @@ class BaseAgent(ABC):
                 f"{self.agent_type.capitalize()} Agent success: {result.title}"
             )
 
+            if result_key is not None and result.success:
+                _result_cache.put(result_key, result)
+
             return result
 
         except Exception as e:
@@ -99,6 +256,24 @@ class BaseAgent(ABC):
             )
             return self._create_error_result(address, str(e))
 
+    async def run(self, address: str, context: Optional[Dict] = None) -> AgentResult:
+        """
+        Execute agent logic for given address without blocking the event loop.
+
+        The blocking Claude CLI call runs in the loop's default thread pool,
+        so several agents awaited together (e.g. with asyncio.gather) wait
+        on their calls concurrently.
+
+        Args:
+            address: Location address to find content for
+            context: Optional additional context
+
+        Returns:
+            AgentResult with content recommendation
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute, address, context)
+
     def _validate_input(self, address: str) -> None:
         """
         Validate input address.
@@ -129,12 +304,16 @@ class BaseAgent(ABC):
         """
         pass
 
-    def _call_claude(self, prompt: str) -> str:
+    def _call_claude(self, prompt: str, json_opening: str = "{") -> str:
         """
         Call Claude with prompt.
 
+        Responses are cached per (agent type, prompt) when caching is
+        enabled, so repeated addresses skip the CLI round trip.
+
         Args:
             prompt: Prompt to send
+            json_opening: Bracket the expected JSON answer opens with
 
         Returns:
             Claude's response
@@ -142,7 +321,19 @@ class BaseAgent(ABC):
         Raises:
             Exception: If Claude call fails
         """
-        return self.claude_client.call(prompt)
+        # Encode once: the same bytes feed the cache digest and the CLI
+        encoded = prompt.encode("utf-8")
+
+        if not self.cache:
+            return self.claude_client.call(encoded, json_opening=json_opening)
+
+        key = (self.agent_type, blake2b(encoded, digest_size=16).digest())
+        response = _response_cache.get(key)
+        if response is None:
+            response = self.claude_client.call(encoded, json_opening=json_opening)
+            _response_cache.put(key, response)
+
+        return response
 
     @abstractmethod
     def _parse_response(self, response: str, address: str) -> AgentResult:
@@ -189,3 +380,7 @@ class BaseAgent(ABC):
             Agent type string
         """
         return self.agent_type
+
+
+# Warm the template cache while the rest of the application imports
+preload_prompt_templates()
@@ -2,25 +2,71 @@
 
 import json
 import re
-from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
-from .base_agent import AgentResult
+from .base_agent import (
+    _DATACLASS_SLOTS,
+    AgentResult,
+    extract_json,
+    load_prompt_template,
+    normalize_address,
+)
+from ..utils.cache import LRUCache
 from ..utils.logger import get_logger
 from ..utils.claude_client import ClaudeClient
 
 logger = get_logger(__name__)
 
+# Template placeholders look like {{NAME}}
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
 
-@dataclass
+# Process-wide cache of Claude selections keyed on (normalized address,
+# the three options); fallback selections are not cached
+SELECTION_CACHE_SIZE = 512
+_selection_cache: "LRUCache[ChoiceResult]" = LRUCache(SELECTION_CACHE_SIZE)
+
+
+# Default per-agent weights for heuristic scoring (agents.<type>.weight)
+DEFAULT_WEIGHTS = {"video": 1.0, "music": 1.0, "info": 1.2}
+
+# Heuristic selections at or above this confidence skip the Claude call;
+# confidence is best / (best + runner-up), so 0.5 is a tie
+DEFAULT_CONFIDENCE_THRESHOLD = 0.6
+
+# Metadata fields that show an agent found something specific
+_DETAIL_FIELDS = {
+    "video": ("description", "channel", "relevance_reason"),
+    "music": ("genre", "mood", "relevance_reason"),
+    "info": ("highlights", "category", "reference_url"),
+}
+
+# Agent defaults that carry no information
+_EMPTY_VALUES = frozenset({"", "Unknown", "General", "N/A"})
+
+# Address words worth matching against content (skips numbers, street
+# types and other filler)
+_ADDRESS_WORD_RE = re.compile(r"[a-z]{3,}")
+_ADDRESS_STOPWORDS = frozenset({
+    "the", "and", "street", "avenue", "road", "boulevard", "drive", "lane",
+    "highway", "usa", "united", "states",
+})
+
+
+def clear_selection_cache() -> None:
+    """Drop all cached Choice Agent selections."""
+    _selection_cache.clear()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ChoiceResult:
     """Result from Choice Agent selection."""
     selected_type: str  # 'video', 'music', 'info'
     title: str
     content: str  # URL or text
     reason: str  # Why this was chosen
-    metadata: Dict
+    metadata: Mapping[str, Any]  # Read-only view of the selected result's metadata
     alternatives: List[AgentResult]  # Other options (for logging/debugging)
 
     def to_dict(self) -> Dict:
@@ -41,23 +87,35 @@ class ChoiceAgent:
     Prompt is loaded from prompts/choice_agent.md
     """
 
-    def __init__(self, claude_client: ClaudeClient, timeout: int = 30):
+    def __init__(
+        self,
+        claude_client: ClaudeClient,
+        timeout: int = 30,
+        cache: bool = True,
+        weights: Optional[Dict[str, float]] = None,
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD
+    ):
         """
         Initialize Choice Agent.
 
         Args:
             claude_client: Claude CLI client
             timeout: Execution timeout
+            cache: Whether to reuse selections for identical options
+            weights: Per-agent scoring weights (defaults to DEFAULT_WEIGHTS)
+            confidence_threshold: Minimum heuristic confidence to skip Claude
+                (above 1.0 always asks Claude)
         """
         self.claude_client = claude_client
         self.timeout = timeout
+        self.cache = cache
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.confidence_threshold = confidence_threshold
         self.prompt_template = self._load_prompt_template()
 
     def _load_prompt_template(self) -> str:
-        """Load prompt template from markdown file."""
-        prompt_path = Path(__file__).parent / "prompts" / "choice_agent.md"
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            return f.read()
+        """Load prompt template from markdown file (cached per process)."""
+        return load_prompt_template("choice_agent.md")
 
     def select_best(
         self,
@@ -83,6 +141,30 @@ class ChoiceAgent:
         """
         logger.info(f"Choice Agent selecting best option for: {address}")
 
+        # Clear winners are picked locally; only close calls go to Claude
+        quick, confidence = self._heuristic_select(address, video_result, music_result, info_result)
+        if confidence >= self.confidence_threshold:
+            logger.info(
+                f"Choice Agent heuristic selected: {quick.selected_type} - {quick.title} "
+                f"(confidence {confidence:.2f})"
+            )
+            return quick
+
+        # Same stop with the same three options: reuse the earlier selection
+        cache_key = None
+        if self.cache:
+            cache_key = (
+                normalize_address(address),
+                tuple(
+                    (result.agent_type, result.success, result.title, result.content)
+                    for result in (video_result, music_result, info_result)
+                )
+            )
+            cached = _selection_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Choice Agent cache hit: {cached.selected_type} - {cached.title}")
+                return cached
+
         try:
             # Create prompt with all three options
             prompt = self._create_prompt(address, video_result, music_result, info_result)
@@ -101,6 +183,9 @@ class ChoiceAgent:
 
             logger.info(f"Choice Agent selected: {choice.selected_type} - {choice.title}")
 
+            if cache_key is not None:
+                _selection_cache.put(cache_key, choice)
+
             return choice
 
         except Exception as e:
@@ -113,6 +198,68 @@ class ChoiceAgent:
                 info_result
             )
 
+    def _heuristic_select(
+        self,
+        address: str,
+        video: AgentResult,
+        music: AgentResult,
+        info: AgentResult
+    ) -> Tuple[ChoiceResult, float]:
+        """
+        Select without Claude by scoring each successful result.
+
+        Score = agent weight * (1 + metadata completeness + 2 * share of
+        address words found in the title/content).
+
+        Args:
+            address: Location address
+            video: Video agent result
+            music: Music agent result
+            info: Info agent result
+
+        Returns:
+            Tuple of (best ChoiceResult, confidence between 0.5 and 1.0)
+        """
+        candidates = [r for r in (info, video, music) if r.success]
+        if not candidates:
+            return self._fallback_selection(address, video, music, info), 1.0
+
+        words = set(_ADDRESS_WORD_RE.findall(address.lower())) - _ADDRESS_STOPWORDS
+
+        scored = []
+        for result in candidates:
+            fields = _DETAIL_FIELDS.get(result.agent_type, ())
+            filled = sum(
+                1 for field in fields
+                if result.metadata.get(field) and not (
+                    isinstance(result.metadata[field], str)
+                    and result.metadata[field] in _EMPTY_VALUES
+                )
+            )
+            completeness = filled / len(fields) if fields else 0.0
+
+            text = f"{result.title} {result.content}".lower()
+            relevance = sum(1 for word in words if word in text) / len(words) if words else 0.0
+
+            weight = self.weights.get(result.agent_type, 1.0)
+            scored.append((weight * (1.0 + completeness + 2.0 * relevance), result))
+
+        # Stable sort keeps info > video > music on equal scores
+        scored.sort(key=lambda item: item[0], reverse=True)
+        best_score, best = scored[0]
+        runner_up = scored[1][0] if len(scored) > 1 else 0.0
+        confidence = best_score / (best_score + runner_up)
+
+        choice = ChoiceResult(
+            selected_type=best.agent_type,
+            title=best.title,
+            content=best.content,
+            reason=f"Highest heuristic score ({best_score:.2f}) for relevance and detail",
+            metadata=MappingProxyType(best.metadata),
+            alternatives=[video, music, info]
+        )
+        return choice, confidence
+
     def _create_prompt(
         self,
         address: str,
@@ -132,26 +279,34 @@ class ChoiceAgent:
         Returns:
             Prompt string
         """
-        # Substitute all placeholders in template
-        prompt = self.prompt_template.replace("{{ADDRESS}}", address)
-
-        # Video placeholders
-        prompt = prompt.replace("{{VIDEO_TITLE}}", video.title if video.success else "Not available")
-        prompt = prompt.replace("{{VIDEO_CONTENT}}", video.content if video.success else "Failed to find video")
-        prompt = prompt.replace("{{VIDEO_DESCRIPTION}}", video.metadata.get('description', 'N/A') if video.success else "N/A")
-        prompt = prompt.replace("{{VIDEO_AVAILABLE}}", str(video.success))
-
-        # Music placeholders
-        prompt = prompt.replace("{{MUSIC_TITLE}}", music.title if music.success else "Not available")
-        prompt = prompt.replace("{{MUSIC_CONTENT}}", music.content if music.success else "Failed to find music")
-        prompt = prompt.replace("{{MUSIC_RELEVANCE}}", music.metadata.get('relevance_reason', 'N/A') if music.success else "N/A")
-        prompt = prompt.replace("{{MUSIC_AVAILABLE}}", str(music.success))
-
-        # Info placeholders
-        prompt = prompt.replace("{{INFO_TITLE}}", info.title if info.success else "Not available")
-        prompt = prompt.replace("{{INFO_CONTENT}}", info.content if info.success else "Failed to find info")
-        prompt = prompt.replace("{{INFO_CATEGORY}}", info.metadata.get('category', 'N/A') if info.success else "N/A")
-        prompt = prompt.replace("{{INFO_AVAILABLE}}", str(info.success))
+        values = {
+            "ADDRESS": address,
+
+            # Video placeholders
+            "VIDEO_TITLE": video.title if video.success else "Not available",
+            "VIDEO_CONTENT": video.content if video.success else "Failed to find video",
+            "VIDEO_DESCRIPTION": video.metadata.get('description', 'N/A') if video.success else "N/A",
+            "VIDEO_AVAILABLE": str(video.success),
+
+            # Music placeholders
+            "MUSIC_TITLE": music.title if music.success else "Not available",
+            "MUSIC_CONTENT": music.content if music.success else "Failed to find music",
+            "MUSIC_RELEVANCE": music.metadata.get('relevance_reason', 'N/A') if music.success else "N/A",
+            "MUSIC_AVAILABLE": str(music.success),
+
+            # Info placeholders
+            "INFO_TITLE": info.title if info.success else "Not available",
+            "INFO_CONTENT": info.content if info.success else "Failed to find info",
+            "INFO_CATEGORY": info.metadata.get('category', 'N/A') if info.success else "N/A",
+            "INFO_AVAILABLE": str(info.success),
+        }
+
+        # Substitute all placeholders in one pass over the template; unknown
+        # placeholders are left as they are
+        prompt = _PLACEHOLDER_RE.sub(
+            lambda match: values.get(match.group(1), match.group(0)),
+            self.prompt_template
+        )
 
         return prompt
 
@@ -181,11 +336,7 @@ class ChoiceAgent:
         """
         try:
             # Extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if not json_match:
-                raise ValueError("No JSON found in response")
-
-            data = json.loads(json_match.group())
+            data = extract_json(response)
 
             # Get selection
             selected = data.get("selected", "").lower()
@@ -212,7 +363,7 @@ class ChoiceAgent:
                 title=selected_result.title,
                 content=selected_result.content,
                 reason=reason,
-                metadata=selected_result.metadata.copy(),
+                metadata=MappingProxyType(selected_result.metadata),
                 alternatives=[video, music, info]
             )
 
@@ -252,7 +403,7 @@ class ChoiceAgent:
                     title=result.title,
                     content=result.content,
                     reason="Fallback selection due to choice agent failure",
-                    metadata=result.metadata.copy(),
+                    metadata=MappingProxyType(result.metadata),
                     alternatives=[video, music, info]
                 )
 
@@ -0,0 +1,123 @@
+"""Fused agent implementation for Route Guide System."""
+
+from types import MappingProxyType
+from typing import Dict, List
+
+from .base_agent import AgentResult, extract_json, load_prompt_template
+from .choice_agent import ChoiceAgent, ChoiceResult
+from .template_agent import TemplateAgent
+from ..utils.claude_client import ClaudeClient
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FusedAgent:
+    """
+    Runs the Video, Music, Info and Choice agents as a single Claude call.
+
+    The fused prompt asks for all three recommendations plus the selection
+    in one JSON object. Each section is validated and built by the
+    corresponding content agent, so results match the per-agent path.
+    Prompt is loaded from prompts/fused_agent.md
+    """
+
+    def __init__(
+        self,
+        claude_client: ClaudeClient,
+        content_agents: List[TemplateAgent],
+        choice_agent: ChoiceAgent
+    ):
+        """
+        Initialize Fused Agent.
+
+        Args:
+            claude_client: Claude CLI client
+            content_agents: Video, Music and Info agents, in that order
+            choice_agent: Choice agent used when the fused selection is unusable
+        """
+        self.claude_client = claude_client
+        self.content_agents = content_agents
+        self.choice_agent = choice_agent
+        self.prompt_template = self._load_prompt_template()
+
+    def _load_prompt_template(self) -> str:
+        """Load prompt template from markdown file (cached per process)."""
+        return load_prompt_template("fused_agent.md")
+
+    def select_best(self, address: str) -> ChoiceResult:
+        """
+        Find recommendations and select the best one with one Claude call.
+
+        Args:
+            address: Location address
+
+        Returns:
+            ChoiceResult with selected recommendation
+
+        Raises:
+            ValueError: If the address is invalid or the response isn't JSON
+            ClaudeClientError: If the Claude call fails
+        """
+        logger.info(f"Fused Agent processing: {address}")
+
+        self.content_agents[0]._validate_input(address)
+
+        prompt = self.prompt_template.replace("{{ADDRESS}}", address)
+        response = self.claude_client.call(prompt)
+
+        data = extract_json(response)
+        if not isinstance(data, dict):
+            raise ValueError("Fused response is not a JSON object")
+
+        video_result, music_result, info_result = (
+            self._build_section(agent, data, address) for agent in self.content_agents
+        )
+
+        # Trust Claude's selection only if it names a section that parsed
+        results: Dict[str, AgentResult] = {
+            "video": video_result,
+            "music": music_result,
+            "info": info_result,
+        }
+        selected = str(data.get("selected", "")).lower()
+        selected_result = results.get(selected)
+
+        if selected_result is None or not selected_result.success:
+            logger.warning(f"Fused selection unusable ({selected!r}), using Choice Agent")
+            return self.choice_agent.select_best(address, video_result, music_result, info_result)
+
+        choice = ChoiceResult(
+            selected_type=selected,
+            title=selected_result.title,
+            content=selected_result.content,
+            reason=data.get("reason", "Selected based on relevance"),
+            metadata=MappingProxyType(selected_result.metadata),
+            alternatives=[video_result, music_result, info_result]
+        )
+
+        logger.info(f"Fused Agent selected: {choice.selected_type} - {choice.title}")
+
+        return choice
+
+    def _build_section(self, agent: TemplateAgent, data: Dict, address: str) -> AgentResult:
+        """
+        Build one agent's result from its section of the fused response.
+
+        Args:
+            agent: Content agent owning the section
+            data: Parsed fused response
+            address: Original address
+
+        Returns:
+            AgentResult (an error result if the section is missing or invalid)
+        """
+        section = data.get(agent.agent_type)
+        if not isinstance(section, dict):
+            return agent._create_error_result(address, f"Missing {agent.agent_type} section")
+
+        try:
+            return agent._build_result(section, address)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Invalid {agent.agent_type} section: {e}")
+            return agent._create_error_result(address, str(e))
@@ -0,0 +1,255 @@
+"""Table-driven agent implementation for Route Guide System."""
+
+import json
+from copy import copy
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .base_agent import (
+    BaseAgent,
+    AgentResult,
+    _result_cache,
+    extract_json,
+    load_prompt_template,
+    normalize_address,
+)
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Appended to an agent's prompt when several addresses share one call
+BATCH_INSTRUCTIONS = """
+## Multiple Locations
+
+The input above is a numbered list of {count} locations. Respond ONLY with a
+JSON array of {count} objects, one per location in the same order, each in
+the exact format described above.
+"""
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """
+    Schema of a content agent: its prompt and how a response maps to a result.
+
+    Attributes:
+        name: Agent type ('video', 'music', 'info')
+        template_path: Prompt file name in the prompts directory
+        required_fields: Fields the JSON response must contain
+        title_fmt: Format string for the result title, filled from the response
+        content_field: Response field used as the result content
+        meta_map: (field, default) pairs copied into the result metadata
+        source: Source label stored in the metadata
+        source_hosts: (substring, label) pairs overriding the source when the
+            content contains the substring
+        list_field: Optional response list appended to the content
+        list_heading: Heading written above the appended list
+    """
+    name: str
+    template_path: str
+    required_fields: FrozenSet[str]
+    title_fmt: str
+    content_field: str
+    meta_map: Tuple[Tuple[str, Any], ...]
+    source: str
+    source_hosts: Tuple[Tuple[str, str], ...] = ()
+    list_field: Optional[str] = None
+    list_heading: str = ""
+
+
+class TemplateAgent(BaseAgent):
+    """
+    Content agent driven entirely by an AgentSpec.
+
+    Prompting and response parsing are shared; the spec decides the prompt
+    template, the required fields, and how the result is assembled. Since
+    every response maps to a result the same way, several addresses can be
+    answered by one call (execute_many).
+    """
+
+    def __init__(self, claude_client, spec: AgentSpec, timeout: int = 30, cache: bool = True):
+        """
+        Initialize a template agent.
+
+        Args:
+            claude_client: Claude CLI client
+            spec: Agent schema
+            timeout: Execution timeout
+            cache: Whether to reuse results for repeated addresses
+        """
+        super().__init__(claude_client, spec.name, timeout, cache)
+        self.spec = spec
+        self.prompt_template = self._load_prompt_template()
+
+    def _load_prompt_template(self) -> str:
+        """Load prompt template from markdown file (cached per process)."""
+        return load_prompt_template(self.spec.template_path)
+
+    def _create_prompt(self, address: str, context: Dict) -> str:
+        """
+        Create prompt for the agent's recommendation.
+
+        Args:
+            address: Location address
+            context: Additional context
+
+        Returns:
+            Prompt string
+        """
+        # Substitute address in template
+        return self.prompt_template.replace("{{ADDRESS}}", address)
+
+    def execute_many(
+        self,
+        addresses: List[str],
+        context: Optional[Dict] = None
+    ) -> List[AgentResult]:
+        """
+        Execute agent logic for several addresses with a single Claude call.
+
+        Addresses not already cached are listed in one prompt and Claude
+        returns a JSON array with one recommendation per address. If the
+        batched response can't be used, each address falls back to execute().
+
+        Args:
+            addresses: Location addresses to find content for
+            context: Optional additional context
+
+        Returns:
+            One AgentResult per address, in the same order as addresses
+        """
+        results: List[Optional[AgentResult]] = [None] * len(addresses)
+        pending = []
+
+        for i, address in enumerate(addresses):
+            try:
+                self._validate_input(address)
+            except ValueError as e:
+                results[i] = self._create_error_result(address, str(e))
+                continue
+
+            if self.cache and not context:
+                results[i] = _result_cache.get((self.agent_type, normalize_address(address)))
+            if results[i] is None:
+                pending.append(i)
+
+        if len(pending) > 1:
+            batch = [addresses[i] for i in pending]
+            logger.info(
+                f"{self.agent_type.capitalize()} Agent executing batch of {len(batch)} addresses"
+            )
+            try:
+                for i, result in zip(pending, self._execute_batch(batch, context or {})):
+                    results[i] = result
+                    if self.cache and not context:
+                        _result_cache.put((self.agent_type, normalize_address(addresses[i])), result)
+                pending = []
+            except Exception as e:
+                logger.warning(
+                    f"{self.agent_type.capitalize()} Agent batch failed, "
+                    f"falling back to one call per address: {e}"
+                )
+
+        for i in pending:
+            results[i] = self.execute(addresses[i], context)
+
+        return results
+
+    def _execute_batch(self, addresses: List[str], context: Dict) -> List[AgentResult]:
+        """
+        Make one Claude call covering several addresses.
+
+        Args:
+            addresses: Validated addresses
+            context: Additional context
+
+        Returns:
+            One successful AgentResult per address
+
+        Raises:
+            ValueError: If the response isn't a matching JSON array
+        """
+        numbered = "\n".join(f"{n}. {address}" for n, address in enumerate(addresses, 1))
+        prompt = self._create_prompt("\n" + numbered, context)
+        prompt += BATCH_INSTRUCTIONS.format(count=len(addresses))
+
+        response = self._call_claude(prompt, json_opening="[")
+
+        items = extract_json(response, "[")
+        if not isinstance(items, list) or len(items) != len(addresses):
+            raise ValueError(f"Expected {len(addresses)} recommendations")
+
+        return [self._build_result(data, address) for data, address in zip(items, addresses)]
+
+    def _parse_response(self, response: str, address: str) -> AgentResult:
+        """
+        Parse Claude's response into AgentResult.
+
+        Args:
+            response: Claude's JSON response
+            address: Original address
+
+        Returns:
+            AgentResult with the recommendation
+
+        Raises:
+            ValueError: If response parsing fails
+        """
+        try:
+            # Extract JSON from response
+            data = extract_json(response)
+
+            return self._build_result(data, address)
+
+        except (json.JSONDecodeError, ValueError, KeyError) as e:
+            logger.error(f"Failed to parse {self.agent_type} agent response: {e}")
+            logger.debug(f"Response was: {response}")
+            raise ValueError(f"Invalid response format: {e}")
+
+    def _build_result(self, data: Dict, address: str) -> AgentResult:
+        """
+        Build an AgentResult from one parsed JSON recommendation.
+
+        Args:
+            data: Parsed JSON object
+            address: Original address
+
+        Returns:
+            AgentResult with the recommendation
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        spec = self.spec
+
+        # Validate required fields in one set operation
+        missing = spec.required_fields - data.keys()
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(sorted(missing))}")
+
+        content = data[spec.content_field]
+
+        source = spec.source
+        for host, label in spec.source_hosts:
+            if host in content.lower():
+                source = label
+                break
+
+        if spec.list_field and data.get(spec.list_field):
+            content += f"\n\n{spec.list_heading}:\n" + "\n".join(
+                f"• {item}" for item in data[spec.list_field]
+            )
+
+        metadata = {"address": address}
+        for field, default in spec.meta_map:
+            # Copy so results never share a mutable default (e.g. [])
+            metadata[field] = data[field] if field in data else copy(default)
+        metadata["source"] = source
+
+        return AgentResult(
+            agent_type=self.agent_type,
+            title=spec.title_fmt.format_map(data),
+            content=content,
+            metadata=metadata,
+            success=True
+        )
@@ -0,0 +1,44 @@
+"""
+Step Scoring Kernel
+
+Numeric core of RouteService waypoint selection. Each step is described
+by its distance and a bitmask of the keyword boosts that apply to it; the
+kernel adds the boosts in bit order, matching the Python scoring loop
+exactly. When Numba is installed it is JIT-compiled into a single loop,
+otherwise an equivalent NumPy expression is used.
+"""
+
+import numpy as np
+
+# Optional JIT: fall back to NumPy when numba is not installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    # No fastmath: reassociating the additions could change scores in the
+    # last bit and reorder ties relative to the Python path
+    @njit(cache=True)
+    def score_steps(distances: np.ndarray, masks: np.ndarray, boosts: np.ndarray) -> np.ndarray:
+        """Return distance plus each boost whose bit is set in the step's mask."""
+        scores = np.empty(distances.shape[0], dtype=np.float64)
+        for i in range(distances.shape[0]):
+            score = distances[i]
+            mask = masks[i]
+            for bit in range(boosts.shape[0]):
+                if mask & (1 << bit):
+                    score += boosts[bit]
+            scores[i] = score
+        return scores
+
+else:
+
+    def score_steps(distances: np.ndarray, masks: np.ndarray, boosts: np.ndarray) -> np.ndarray:
+        """Return distance plus each boost whose bit is set in the step's mask."""
+        scores = distances.astype(np.float64)
+        for bit in range(boosts.shape[0]):
+            scores += np.where(masks & (1 << bit), boosts[bit], 0.0)
+        return scores
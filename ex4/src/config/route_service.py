@@ -1,16 +1,121 @@
 """Google Maps route service for Route Guide System."""
 
+import asyncio
+import heapq
+import json
+import random
+import re
+import sys
 import time
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:  # Optional: concurrent route requests without threads
+    aiohttp = None
+
+try:
+    import diskcache
+except ImportError:  # Optional: persist Directions responses across sessions
+    diskcache = None
+
+try:
+    import numpy as np
+except ImportError:  # Optional: vectorized scoring for long routes
+    np = None
+
+from ..utils.cache import LRUCache
 from ..utils.logger import get_logger
 from ..utils.validators import validate_address, ValidationError
 
+if np is not None:
+    from ._scoring import score_steps
+
 logger = get_logger(__name__)
 
+# Process-wide cache of raw Directions API responses keyed on normalized
+# (origin, destination, mode); every step is kept (projected to the fields
+# used) so any max_waypoints can be re-parsed without refetching. Values
+# are (fetch timestamp, response).
+DIRECTIONS_CACHE_SIZE = 1024
+DIRECTIONS_CACHE_DIR = Path.home() / ".cache" / "route_guide" / "directions"
+_directions_cache: "LRUCache[Tuple[float, Dict]]" = LRUCache(DIRECTIONS_CACHE_SIZE)
+
+
+# Step scoring tables, built once rather than per step: maneuver keyword
+# boosts, and road/junction keywords in the instruction text
+_IMPORTANT_MANEUVERS = (
+    ("ramp", 5.0),
+    ("fork", 5.0),
+    ("exit", 8.0),
+    ("merge", 4.0),
+    ("roundabout", 3.0),
+    ("ferry", 10.0),
+)
+_HIGHWAY_RE = re.compile(r"highway|interstate|freeway|motorway")
+_JUNCTION_RE = re.compile(r"exit|enter|merge")
+_HIGHWAY_BOOST = 3.0
+_JUNCTION_BOOST = 2.0
+
+# Boosts in the order they are added to a step's score; bit i of a step's
+# mask (see _maneuver_mask) selects _STEP_BOOSTS[i]
+_STEP_BOOSTS = tuple(boost for _, boost in _IMPORTANT_MANEUVERS) + (_HIGHWAY_BOOST, _JUNCTION_BOOST)
+_HIGHWAY_BIT = 1 << len(_IMPORTANT_MANEUVERS)
+_JUNCTION_BIT = _HIGHWAY_BIT << 1
+
+# Directions response fields read by _parse_route and the step helpers;
+# polylines, viewports and the rest are dropped right after decoding
+_ROUTE_FIELDS = ("legs", "summary", "warnings", "waypoint_order")
+_LEG_FIELDS = (
+    "start_address", "start_location", "end_address", "end_location",
+    "distance", "duration", "steps",
+)
+_STEP_FIELDS = ("distance", "maneuver", "html_instructions", "end_location", "start_address")
+
+# Routes with at least this many steps are scored with NumPy (when
+# installed); below it, array setup costs more than the Python loop
+VECTORIZE_MIN_STEPS = 200
+
+# HTML tags in Directions step instructions
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def clear_directions_cache() -> None:
+    """Drop all in-memory cached Directions API responses."""
+    _directions_cache.clear()
+
+
+@lru_cache(maxsize=256)
+def _maneuver_mask(maneuver: str) -> int:
+    """
+    Bitmask of the _IMPORTANT_MANEUVERS keywords found in a maneuver.
+
+    Routes use a handful of distinct maneuver names, so results are cached.
+
+    Args:
+        maneuver: Directions API maneuver (e.g. "ramp-right")
+
+    Returns:
+        Mask with bit i set if keyword i occurs in the maneuver
+    """
+    maneuver = maneuver.lower()
+    mask = 0
+    for bit, (keyword, _) in enumerate(_IMPORTANT_MANEUVERS):
+        if keyword in maneuver:
+            mask |= 1 << bit
+    return mask
+
 
 @dataclass
 class Location:
@@ -57,12 +162,20 @@ class RouteService:
 
     DIRECTIONS_API_URL = "https://maps.googleapis.com/maps/api/directions/json"
 
+    # HTTP statuses worth retrying (rate limiting and server-side errors);
+    # any other 4xx fails immediately
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
     def __init__(
         self,
         api_key: str,
         timeout: int = 10,
         max_retries: int = 3,
-        retry_delay: int = 1
+        retry_delay: float = 1,
+        cache_ttl: float = 3600,
+        disk_cache: bool = False,
+        max_delay: float = 30.0,
+        jitter: float = 0.5
     ):
         """
         Initialize route service.
@@ -71,12 +184,37 @@ class RouteService:
             api_key: Google Maps API key
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay before the first retry in seconds; each
+                further retry doubles it
+            cache_ttl: Seconds a fetched route stays cached (0 disables caching)
+            disk_cache: Also persist responses under DIRECTIONS_CACHE_DIR
+                (requires the optional diskcache package)
+            max_delay: Upper bound on the retry delay in seconds
+            jitter: Random +/- fraction applied to each delay so concurrent
+                clients don't retry in lockstep
         """
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.cache_ttl = cache_ttl
+
+        self._disk_cache = None
+        if disk_cache and cache_ttl > 0:
+            if diskcache is not None:
+                self._disk_cache = diskcache.Cache(str(DIRECTIONS_CACHE_DIR))
+            else:
+                logger.warning("diskcache not installed; caching routes in memory only")
+
+        # Keep-alive connection pool reused across calls; retries are
+        # handled by the loops below, so the adapter never retries
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
+
+        # Shared aiohttp session (created lazily, closed by aclose())
+        self._async_session = None
 
     def get_route(
         self,
@@ -105,8 +243,11 @@ class RouteService:
 
         logger.info(f"Retrieving route from '{source}' to '{destination}'")
 
-        # Call Directions API
-        directions = self._call_directions_api(source, destination)
+        # Call Directions API (unless recently fetched)
+        directions = self._load_cached_directions(source, destination)
+        if directions is None:
+            directions = self._call_directions_api(source, destination)
+            self._store_directions(source, destination, directions)
 
         # Extract route information
         route = self._parse_route(directions, max_waypoints)
@@ -119,6 +260,209 @@ class RouteService:
 
         return route
 
+    async def get_route_async(
+        self,
+        source: str,
+        destination: str,
+        max_waypoints: int = 20
+    ) -> Route:
+        """
+        Get route with waypoints without blocking the event loop.
+
+        Args:
+            source: Source address
+            destination: Destination address
+            max_waypoints: Maximum number of waypoints to extract
+
+        Returns:
+            Route object with waypoints
+
+        Raises:
+            RouteServiceError: If route retrieval fails
+            ValidationError: If addresses are invalid
+        """
+        source = validate_address(source)
+        destination = validate_address(destination)
+
+        logger.info(f"Retrieving route from '{source}' to '{destination}'")
+
+        directions = self._load_cached_directions(source, destination)
+        if directions is None:
+            directions = await self._acall_directions_api(source, destination)
+            self._store_directions(source, destination, directions)
+
+        return self._parse_route(directions, max_waypoints)
+
+    async def get_routes(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        max_waypoints: int = 20
+    ) -> List[Route]:
+        """
+        Get several routes concurrently.
+
+        Args:
+            pairs: (source, destination) address pairs
+            max_waypoints: Maximum number of waypoints per route
+
+        Returns:
+            One Route per pair, in the same order
+
+        Raises:
+            RouteServiceError: If any route retrieval fails
+            ValidationError: If any address is invalid
+        """
+        return list(await asyncio.gather(*(
+            self.get_route_async(source, destination, max_waypoints)
+            for source, destination in pairs
+        )))
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """Close the shared async HTTP session, if one was opened."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    def _directions_cache_key(self, origin: str, destination: str) -> Tuple[str, str, str]:
+        """Cache key for a route: addresses normalized for case and spacing."""
+        return (
+            " ".join(origin.lower().split()),
+            " ".join(destination.lower().split()),
+            "driving"
+        )
+
+    def _load_cached_directions(self, origin: str, destination: str) -> Optional[Dict]:
+        """
+        Look up a fresh cached Directions API response.
+
+        Args:
+            origin: Origin address
+            destination: Destination address
+
+        Returns:
+            Cached API response, or None if absent or older than cache_ttl
+        """
+        if self.cache_ttl <= 0:
+            return None
+
+        key = self._directions_cache_key(origin, destination)
+        entry = _directions_cache.get(key)
+        if entry is None and self._disk_cache is not None:
+            entry = self._disk_cache.get(key)
+            if entry is not None:
+                _directions_cache.put(key, entry)
+
+        if entry is None:
+            return None
+
+        fetched_at, directions = entry
+        if time.time() - fetched_at > self.cache_ttl:
+            return None
+
+        logger.info(f"Using cached route from '{origin}' to '{destination}'")
+        return directions
+
+    def _store_directions(self, origin: str, destination: str, directions: Dict) -> None:
+        """
+        Cache a Directions API response.
+
+        Args:
+            origin: Origin address
+            destination: Destination address
+            directions: API response
+        """
+        if self.cache_ttl <= 0:
+            return
+
+        key = self._directions_cache_key(origin, destination)
+        entry = (time.time(), directions)
+        _directions_cache.put(key, entry)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, entry, expire=self.cache_ttl)
+
+    def _directions_params(self, origin: str, destination: str) -> Dict:
+        """
+        Build Directions API query parameters.
+
+        Args:
+            origin: Origin address
+            destination: Destination address
+
+        Returns:
+            Query parameters
+        """
+        return {
+            "origin": origin,
+            "destination": destination,
+            "mode": "driving",
+            "key": self.api_key
+        }
+
+    def _decode_directions(self, body: bytes) -> Dict:
+        """
+        Decode a Directions API response body.
+
+        Uses orjson when installed. Only the first route and leg are kept,
+        each projected to the fields the parser reads, so the bulk of the
+        payload (polylines, viewports) can be freed straight away.
+
+        Args:
+            body: Raw response body
+
+        Returns:
+            Projected API response
+
+        Raises:
+            RouteServiceError: If the body is not valid JSON or the
+                response status is not OK
+        """
+        try:
+            data = orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError as e:
+            raise RouteServiceError(f"Invalid API response: {str(e)}")
+
+        self._check_directions_status(data)
+
+        routes = data.get("routes")
+        if routes:
+            route = {k: routes[0][k] for k in _ROUTE_FIELDS if k in routes[0]}
+            legs = route.get("legs")
+            if legs:
+                leg = {k: legs[0][k] for k in _LEG_FIELDS if k in legs[0]}
+                leg["steps"] = [
+                    {k: step[k] for k in _STEP_FIELDS if k in step}
+                    for step in leg.get("steps", ())
+                ]
+                route["legs"] = [leg]
+            data["routes"] = [route]
+
+        return data
+
+    def _check_directions_status(self, data: Dict) -> Dict:
+        """
+        Raise if a Directions API response reports an error.
+
+        Args:
+            data: Parsed API response
+
+        Returns:
+            The same response
+
+        Raises:
+            RouteServiceError: If the response status is not OK
+        """
+        if data.get("status") != "OK":
+            error_message = data.get("error_message", data.get("status"))
+            raise RouteServiceError(
+                f"Google Maps API error: {error_message}"
+            )
+
+        return data
+
     def _call_directions_api(
         self,
         origin: str,
@@ -137,55 +481,147 @@ class RouteService:
         Raises:
             RouteServiceError: If API call fails
         """
-        params = {
-            "origin": origin,
-            "destination": destination,
-            "mode": "driving",
-            "key": self.api_key
-        }
+        params = self._directions_params(origin, destination)
 
         for attempt in range(self.max_retries + 1):
             try:
-                response = requests.get(
+                response = self._session.get(
                     self.DIRECTIONS_API_URL,
                     params=params,
                     timeout=self.timeout
                 )
                 response.raise_for_status()
 
-                data = response.json()
-
                 # Check API response status
-                if data.get("status") != "OK":
-                    error_message = data.get("error_message", data.get("status"))
+                return self._decode_directions(response.content)
+
+            except requests.Timeout:
+                if attempt < self.max_retries:
+                    logger.warning(
+                        f"API timeout (attempt {attempt + 1}/{self.max_retries + 1}), retrying..."
+                    )
+                    time.sleep(self._backoff_delay(attempt))
+                else:
                     raise RouteServiceError(
-                        f"Google Maps API error: {error_message}"
+                        f"API timeout after {self.max_retries + 1} attempts"
                     )
 
-                return data
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if attempt < self.max_retries and status in self.RETRYABLE_STATUS_CODES:
+                    logger.warning(
+                        f"API HTTP {status} (attempt {attempt + 1}/{self.max_retries + 1}), retrying..."
+                    )
+                    time.sleep(self._backoff_delay(attempt))
+                else:
+                    raise RouteServiceError(f"API request failed: {str(e)}")
 
-            except requests.Timeout:
+            except requests.RequestException as e:
+                if attempt < self.max_retries:
+                    logger.warning(
+                        f"API request error (attempt {attempt + 1}/{self.max_retries + 1}), retrying..."
+                    )
+                    time.sleep(self._backoff_delay(attempt))
+                else:
+                    raise RouteServiceError(f"API request failed: {str(e)}")
+
+        raise RouteServiceError("Failed to retrieve route after all attempts")
+
+    async def _acall_directions_api(
+        self,
+        origin: str,
+        destination: str
+    ) -> Dict:
+        """
+        Call Google Maps Directions API asynchronously.
+
+        Uses a shared aiohttp session when aiohttp is installed; otherwise
+        runs the blocking call in the default thread pool.
+
+        Args:
+            origin: Origin address
+            destination: Destination address
+
+        Returns:
+            API response dictionary
+
+        Raises:
+            RouteServiceError: If API call fails
+        """
+        if aiohttp is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._call_directions_api, origin, destination
+            )
+
+        params = self._directions_params(origin, destination)
+        session = self._get_async_session()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.get(
+                    self.DIRECTIONS_API_URL,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                ) as response:
+                    response.raise_for_status()
+
+                    # Check API response status
+                    return self._decode_directions(await response.read())
+
+            except asyncio.TimeoutError:
                 if attempt < self.max_retries:
                     logger.warning(
                         f"API timeout (attempt {attempt + 1}/{self.max_retries + 1}), retrying..."
                     )
-                    time.sleep(self.retry_delay)
+                    await asyncio.sleep(self._backoff_delay(attempt))
                 else:
                     raise RouteServiceError(
                         f"API timeout after {self.max_retries + 1} attempts"
                     )
 
-            except requests.RequestException as e:
+            except aiohttp.ClientResponseError as e:
+                if attempt < self.max_retries and e.status in self.RETRYABLE_STATUS_CODES:
+                    logger.warning(
+                        f"API HTTP {e.status} (attempt {attempt + 1}/{self.max_retries + 1}), retrying..."
+                    )
+                    await asyncio.sleep(self._backoff_delay(attempt))
+                else:
+                    raise RouteServiceError(f"API request failed: {str(e)}")
+
+            except aiohttp.ClientError as e:
                 if attempt < self.max_retries:
                     logger.warning(
                         f"API request error (attempt {attempt + 1}/{self.max_retries + 1}), retrying..."
                     )
-                    time.sleep(self.retry_delay)
+                    await asyncio.sleep(self._backoff_delay(attempt))
                 else:
                     raise RouteServiceError(f"API request failed: {str(e)}")
 
         raise RouteServiceError("Failed to retrieve route after all attempts")
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Delay before retrying after a failed attempt.
+
+        Truncated exponential backoff with jitter:
+        min(max_delay, retry_delay * 2**attempt) scaled by 1 +/- jitter.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_delay, self.retry_delay * (2 ** attempt))
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _get_async_session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session, creating it on first use."""
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession()
+        return self._async_session
+
     def _parse_route(self, directions: Dict, max_waypoints: int) -> Route:
         """
         Parse route from Directions API response.
@@ -263,7 +699,53 @@ class RouteService:
         if not steps:
             return []
 
+        if np is not None and len(steps) >= VECTORIZE_MIN_STEPS:
+            selected = self._select_steps_vectorized(steps, max_waypoints)
+        else:
+            selected = self._select_steps(steps, max_waypoints)
+
+        # Waypoints at the same spot with the same address share one
+        # Location; addresses are interned so repeated names share one str
+        locations: Dict[Tuple[str, float, float], Location] = {}
+
         waypoints = []
+        for idx, dist in selected:
+            step = steps[idx]
+            address = sys.intern(self._extract_address_from_step(step))
+            lat = step["end_location"]["lat"]
+            lng = step["end_location"]["lng"]
+
+            key = (address, round(lat, 5), round(lng, 5))
+            location = locations.get(key)
+            if location is None:
+                location = locations[key] = Location(address=address, lat=lat, lng=lng)
+
+            waypoint = Waypoint(
+                location=location,
+                index=len(waypoints),
+                distance_from_start=dist,
+                instruction=step.get("html_instructions")
+            )
+            waypoints.append(waypoint)
+
+        return waypoints
+
+    def _select_steps(
+        self,
+        steps: List[Dict],
+        max_waypoints: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Pick the most important steps.
+
+        Args:
+            steps: Route steps from API
+            max_waypoints: Maximum steps to pick
+
+        Returns:
+            (step index, distance from start in km) pairs in route order;
+            equal scores favor the earlier step
+        """
         total_distance = 0  # Running total in km
 
         # Calculate step importance scores
@@ -278,31 +760,65 @@ class RouteService:
             # 3. Road type changes
             score = self._calculate_step_importance(step, distance, instruction)
 
-            scored_steps.append((score, i, step, total_distance))
+            scored_steps.append((score, i, total_distance))
             total_distance += distance
 
-        # Sort by score (descending) and select top waypoints
-        scored_steps.sort(key=lambda x: x[0], reverse=True)
+        # Select top waypoints (O(N log k); ties keep route order, as a
+        # stable descending sort would), but maintain route order
+        top = heapq.nlargest(max_waypoints, scored_steps, key=lambda x: x[0])
+        selected = sorted(top, key=lambda x: x[1])
 
-        # Select top waypoints, but maintain route order
-        selected_indices = sorted([x[1] for x in scored_steps[:max_waypoints]])
+        return [(idx, dist) for score, idx, dist in selected]
 
-        for i in selected_indices:
-            score, idx, step, dist = next(x for x in scored_steps if x[1] == i)
+    def _select_steps_vectorized(
+        self,
+        steps: List[Dict],
+        max_waypoints: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Pick the most important steps, scoring all steps with NumPy.
 
-            waypoint = Waypoint(
-                location=Location(
-                    address=self._extract_address_from_step(step),
-                    lat=step["end_location"]["lat"],
-                    lng=step["end_location"]["lng"]
-                ),
-                index=len(waypoints),
-                distance_from_start=dist,
-                instruction=step.get("html_instructions")
-            )
-            waypoints.append(waypoint)
+        Computes the same scores as _calculate_step_importance: each step's
+        applicable boosts are encoded as a bitmask and summed in the same
+        order by the score_steps kernel (JIT-compiled when numba is
+        installed), so results match the Python path exactly.
 
-        return waypoints
+        Args:
+            steps: Route steps from API
+            max_waypoints: Maximum steps to pick
+
+        Returns:
+            (step index, distance from start in km) pairs in route order;
+            equal scores favor the earlier step
+        """
+        distances = np.fromiter(
+            (step["distance"]["value"] for step in steps), dtype=np.float64, count=len(steps)
+        ) / 1000  # meters to km
+        masks = np.fromiter(
+            (_maneuver_mask(step.get("maneuver", "")) for step in steps), dtype=np.uint8, count=len(steps)
+        )
+        instructions = np.array([step.get("html_instructions", "").lower() for step in steps])
+
+        def contains(texts: "np.ndarray", pattern: "re.Pattern") -> "np.ndarray":
+            """Element-wise: does any alternative of the pattern occur in the text."""
+            found = np.zeros(len(texts), dtype=bool)
+            for keyword in pattern.pattern.split("|"):
+                found |= np.char.find(texts, keyword) >= 0
+            return found
+
+        masks[contains(instructions, _HIGHWAY_RE)] |= _HIGHWAY_BIT
+        masks[contains(instructions, _JUNCTION_RE)] |= _JUNCTION_BIT
+
+        scores = score_steps(distances, masks, np.array(_STEP_BOOSTS))
+
+        # Stable sort keeps route order among equal scores
+        top = np.sort(np.argsort(-scores, kind="stable")[:max_waypoints])
+
+        # Distance from start is the running total before each step, summed
+        # in the same order as the Python loop so the floats match exactly
+        starts = np.concatenate(([0.0], np.cumsum(distances[:-1])))
+
+        return [(int(i), float(starts[i])) for i in top]
 
     def _calculate_step_importance(
         self,
@@ -328,27 +844,19 @@ class RouteService:
 
         # Boost for maneuver types
         maneuver = step.get("maneuver", "").lower()
-        important_maneuvers = {
-            "ramp": 5.0,
-            "fork": 5.0,
-            "exit": 8.0,
-            "merge": 4.0,
-            "roundabout": 3.0,
-            "ferry": 10.0
-        }
-
-        for keyword, boost in important_maneuvers.items():
-            if keyword in maneuver:
-                score += boost
+        if maneuver:
+            for keyword, boost in _IMPORTANT_MANEUVERS:
+                if keyword in maneuver:
+                    score += boost
 
         # Boost for highway/major road mentions in instructions
         instruction_lower = instruction.lower()
-        if any(keyword in instruction_lower for keyword in ["highway", "interstate", "freeway", "motorway"]):
-            score += 3.0
+        if _HIGHWAY_RE.search(instruction_lower):
+            score += _HIGHWAY_BOOST
 
         # Boost for exits and entrances
-        if any(keyword in instruction_lower for keyword in ["exit", "enter", "merge"]):
-            score += 2.0
+        if _JUNCTION_RE.search(instruction_lower):
+            score += _JUNCTION_BOOST
 
         return score
 
@@ -371,9 +879,8 @@ class RouteService:
         lng = step["end_location"]["lng"]
         instruction = step.get("html_instructions", "").strip()
 
-        # Remove HTML tags from instruction
-        import re
-        clean_instruction = re.sub(r'<[^>]+>', '', instruction)
+        # Remove HTML tags from instruction (skip the regex if there are none)
+        clean_instruction = _HTML_TAG_RE.sub("", instruction) if "<" in instruction else instruction
 
         # Use instruction or coordinates
         if clean_instruction and len(clean_instruction) > 10:
@@ -2,7 +2,7 @@
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import threading
+import asyncio
 import json
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +23,10 @@ class RouteGuideGUI:
     - Viewing and saving results
     """
 
+    # Interval between asyncio loop iterations run from the Tk event loop
+    # while a route is being processed
+    ASYNCIO_PUMP_MS = 50
+
     def __init__(self, root):
         """
         Initialize the GUI application.
@@ -51,8 +55,14 @@ class RouteGuideGUI:
 
         # State variables
         self.orchestrator = None
+        self._orchestrator_fingerprint = None
         self.current_result = None
         self.is_running = False
+        self._task = None
+
+        # asyncio loop driven from the Tk event loop while a run is in
+        # progress (see _pump_asyncio)
+        self.loop = asyncio.new_event_loop()
 
         # Create UI
         self._create_widgets()
@@ -262,8 +272,15 @@ class RouteGuideGUI:
         style.configure('TLabelframe', padding=10)
         style.configure('TLabelframe.Label', font=("Helvetica", 11, "bold"))
 
+    def _pump_asyncio(self):
+        """Run one iteration of the asyncio loop; reschedule while a run is pending."""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        if self._task is not None and not self._task.done():
+            self.root.after(self.ASYNCIO_PUMP_MS, self._pump_asyncio)
+
     def _run_route_guide(self):
-        """Run the route guide system in a separate thread."""
+        """Run the route guide system without blocking the GUI."""
         # Validate inputs
         source = self.source_var.get().strip()
         dest = self.dest_var.get().strip()
@@ -288,12 +305,22 @@ class RouteGuideGUI:
         # Clear previous results
         self.results_text.delete(1.0, tk.END)
 
-        # Run in separate thread to keep GUI responsive
-        thread = threading.Thread(target=self._execute_route_guide, daemon=True)
-        thread.start()
+        # Run as a task on the GUI's asyncio loop to keep the GUI responsive
+        self._task = self.loop.create_task(self._aexecute_route_guide(source, dest))
+        self.root.after(self.ASYNCIO_PUMP_MS, self._pump_asyncio)
+
+    async def _aexecute_route_guide(self, source, dest):
+        """
+        Execute route guide on the GUI thread's asyncio loop.
+
+        The orchestrator awaits each waypoint's agents (their blocking CLI
+        calls run in the loop's default executor); settings, results and
+        errors are handled directly on the GUI thread.
 
-    def _execute_route_guide(self):
-        """Execute route guide in background thread."""
+        Args:
+            source: Source address
+            dest: Destination address
+        """
         try:
             # Update config with GUI settings
             self.config.config["route"]["max_waypoints"] = self.max_waypoints_var.get()
@@ -304,74 +331,106 @@ class RouteGuideGUI:
             os.environ["LOG_LEVEL"] = self.log_level_var.get()
             setup_logger(level=self.log_level_var.get())
 
-            # Create orchestrator
-            self.orchestrator = RouteGuideOrchestrator(config=self.config)
-
-            # Get inputs
-            source = self.source_var.get().strip()
-            dest = self.dest_var.get().strip()
+            # Reuse orchestrator unless its settings changed
+            orchestrator = await self._get_orchestrator()
 
             # Process route
             self.logger.info(f"Processing route: {source} -> {dest}")
-            result = self.orchestrator.process_route(source, dest)
+            result = await orchestrator.process_route_async(source, dest)
 
-            # Store result
+            # Store and display result
             self.current_result = result
+            self._display_results(result)
+            self._execution_complete(True)
 
-            # Display results in GUI
-            self.root.after(0, self._display_results, result)
-
-            # Update UI
-            self.root.after(0, self._execution_complete, True)
+        except asyncio.CancelledError:
+            self.logger.info("Route guide stopped by user")
+            self._execution_complete(False)
+            self.progress_label.config(text="⏹ Route processing stopped")
+            self.status_var.set("Stopped")
+            raise
 
         except Exception as e:
             self.logger.error(f"Route guide failed: {e}", exc_info=True)
-            error_msg = f"Error: {str(e)}"
-            self.root.after(0, self._display_error, error_msg)
-            self.root.after(0, self._execution_complete, False)
+            self._display_error(f"Error: {str(e)}")
+            self._execution_complete(False)
+
+    async def _get_orchestrator(self):
+        """
+        Return the orchestrator, creating it on first use or when the
+        GUI settings it was built with have changed.
+
+        Returns:
+            RouteGuideOrchestrator for the current settings
+        """
+        fingerprint = (
+            self.max_waypoints_var.get(),
+            self.parallel_var.get(),
+            self.log_level_var.get(),
+        )
+
+        if self.orchestrator is None or fingerprint != self._orchestrator_fingerprint:
+            if self.orchestrator is not None:
+                await self.orchestrator.aclose()
+            self.orchestrator = RouteGuideOrchestrator(config=self.config)
+            self._orchestrator_fingerprint = fingerprint
+
+        return self.orchestrator
 
     def _display_results(self, result):
         """Display results in the text area."""
         self.results_text.delete(1.0, tk.END)
 
+        # Collect (text, tag) segments and insert them with a single call
+        segments = []
+
+        def add(text, tag):
+            if segments and segments[-1][1] == tag:
+                segments[-1] = (segments[-1][0] + text, tag)
+            else:
+                segments.append((text, tag))
+
         # Header
-        self.results_text.insert(tk.END, "=" * 80 + "\n", "header")
-        self.results_text.insert(tk.END, "ROUTE GUIDE RESULTS\n", "header")
-        self.results_text.insert(tk.END, "=" * 80 + "\n\n", "header")
+        add("=" * 80 + "\n", "header")
+        add("ROUTE GUIDE RESULTS\n", "header")
+        add("=" * 80 + "\n\n", "header")
 
         # Route info
-        self.results_text.insert(tk.END, f"📍 From: {result.source}\n", "content")
-        self.results_text.insert(tk.END, f"📍 To: {result.destination}\n\n", "content")
+        add(f"📍 From: {result.source}\n", "content")
+        add(f"📍 To: {result.destination}\n\n", "content")
 
         # Metadata
         metadata = result.metadata
-        self.results_text.insert(tk.END, f"Distance: {metadata['total_distance_km']} km\n", "metadata")
-        self.results_text.insert(tk.END, f"Duration: {metadata['estimated_duration_minutes']} minutes\n", "metadata")
-        self.results_text.insert(tk.END, f"Stops: {metadata['processed_stops']}\n", "metadata")
-        self.results_text.insert(tk.END, f"Processing Time: {metadata['processing_time_seconds']} seconds\n\n", "metadata")
+        add(f"Distance: {metadata['total_distance_km']} km\n", "metadata")
+        add(f"Duration: {metadata['estimated_duration_minutes']} minutes\n", "metadata")
+        add(f"Stops: {metadata['processed_stops']}\n", "metadata")
+        add(f"Processing Time: {metadata['processing_time_seconds']} seconds\n\n", "metadata")
 
-        self.results_text.insert(tk.END, "=" * 80 + "\n\n", "header")
+        add("=" * 80 + "\n\n", "header")
 
         # Stops
         for i, stop in enumerate(result.stops, 1):
             choice = stop.choice
 
             # Stop header
-            self.results_text.insert(tk.END, f"Stop {i}: {stop.address}\n", "stop")
-            self.results_text.insert(tk.END, "-" * 80 + "\n", "content")
+            add(f"Stop {i}: {stop.address}\n", "stop")
+            add("-" * 80 + "\n", "content")
 
             # Content type icon
             icon = {"video": "🎥", "music": "🎵", "info": "ℹ️"}.get(choice['type'], "📌")
-            self.results_text.insert(tk.END, f"{icon} Type: {choice['type'].upper()}\n", "content")
-            self.results_text.insert(tk.END, f"📝 Title: {choice['title']}\n", "content")
+            add(f"{icon} Type: {choice['type'].upper()}\n", "content")
+            add(f"📝 Title: {choice['title']}\n", "content")
 
             # Content (truncate if too long)
             content = choice['content']
             if len(content) > 200:
                 content = content[:200] + "..."
-            self.results_text.insert(tk.END, f"📄 Content: {content}\n", "content")
+            add(f"📄 Content: {content}\n", "content")
 
-            self.results_text.insert(tk.END, f"💡 Reason: {choice['reason']}\n\n", "content")
+            add(f"💡 Reason: {choice['reason']}\n\n", "content")
+
+        # Text.insert takes alternating text/tag arguments: one Tk round trip
+        self.results_text.insert(tk.END, *(item for segment in segments for item in segment))
 
         # Scroll to top
         self.results_text.see(1.0)
@@ -401,9 +460,14 @@ class RouteGuideGUI:
 
     def _stop_execution(self):
         """Stop the current execution."""
-        # Note: Can't easily stop thread, but we can update UI
+        if self._task is None or self._task.done():
+            return
+
+        # Cancels at the next await; a Claude call already in flight finishes
+        # in the background and its result is discarded
+        self._task.cancel()
         self.progress_label.config(text="Stopping...")
-        self.status_var.set("Stop requested (processing will complete current waypoint)")
+        self.status_var.set("Stop requested")
 
     def _clear_results(self):
         """Clear the results display."""
@@ -444,7 +508,13 @@ def main():
     """Run the GUI application."""
     root = tk.Tk()
     app = RouteGuideGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        if hasattr(app, "loop"):
+            if getattr(app, "orchestrator", None) is not None:
+                app.loop.run_until_complete(app.orchestrator.aclose())
+            app.loop.close()
 
 
 if __name__ == "__main__":
@@ -152,7 +152,10 @@ def main():
 
         # Process route
         logger.info("Processing route...")
-        output = orchestrator.process_route(args.source, args.destination)
+        try:
+            output = orchestrator.process_route(args.source, args.destination)
+        finally:
+            orchestrator.close()
 
         # Print output
         print("\n" + "=" * 60)
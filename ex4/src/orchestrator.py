@@ -1,8 +1,9 @@
 """Main orchestrator for Route Guide System."""
 
+import asyncio
 import json
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
@@ -12,9 +13,17 @@ from .config.route_service import RouteService, Route, RouteServiceError
 from .agents.video_agent import VideoAgent
 from .agents.music_agent import MusicAgent
 from .agents.info_agent import InfoAgent
-from .agents.choice_agent import ChoiceAgent, ChoiceResult
-from .agents.base_agent import AgentResult
+from .agents.choice_agent import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_WEIGHTS,
+    ChoiceAgent,
+    ChoiceResult,
+)
+from .agents.base_agent import AgentResult, BaseAgent
+from .agents.fused_agent import FusedAgent
+from .agents.template_agent import TemplateAgent
 from .utils.config_loader import ConfigLoader
+from .utils.semantic_cache import SemanticCache
 from .utils.claude_client import ClaudeClient
 from .utils.logger import get_logger, setup_logger
 
@@ -59,6 +68,19 @@ class RouteGuideOutput:
         return json.dumps(self.to_dict(), ensure_ascii=False)
 
 
+# Process-wide cache of waypoint selections looked up by address
+# similarity, so near-duplicate stops skip every agent; shared by all
+# orchestrators, so entries survive when the GUI rebuilds its orchestrator
+# after a settings change
+SEMANTIC_CACHE_SIZE = 256
+_semantic_cache: "SemanticCache[ChoiceResult]" = SemanticCache(SEMANTIC_CACHE_SIZE)
+
+
+def clear_semantic_cache() -> None:
+    """Drop all cached waypoint selections."""
+    _semantic_cache.clear()
+
+
 class RouteGuideOrchestrator:
     """
     Main orchestrator for Route Guide System.
@@ -95,6 +117,11 @@ class RouteGuideOrchestrator:
         self.parallel_execution = self.config.get("system.parallel_execution", True)
         self.max_workers = self.config.get("system.max_agent_threads", 3)
 
+        # Reuse selections for similar addresses
+        self.cache_enabled = self.config.get("system.cache_enabled", False)
+        self.cache_ttl = self.config.get("system.cache_ttl", 3600)
+        self.cache_similarity = self.config.get("system.cache_similarity", 0.9)
+
         logger.info(
             f"Route Guide Orchestrator initialized "
             f"(parallel_execution={self.parallel_execution})"
@@ -106,12 +133,18 @@ class RouteGuideOrchestrator:
         timeout = self.config.get("api.google_maps.timeout", 10)
         max_retries = self.config.get("api.google_maps.max_retries", 3)
         retry_delay = self.config.get("api.google_maps.retry_delay", 1)
+        cache_ttl = self.config.get("api.google_maps.cache_ttl", 3600)
+        disk_cache = self.config.get("api.google_maps.disk_cache", False)
+        max_delay = self.config.get("api.google_maps.max_retry_delay", 30)
 
         self.route_service = RouteService(
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
-            retry_delay=retry_delay
+            retry_delay=retry_delay,
+            cache_ttl=cache_ttl,
+            disk_cache=disk_cache,
+            max_delay=max_delay
         )
 
     def _init_agents(self) -> None:
@@ -121,12 +154,14 @@ class RouteGuideOrchestrator:
         claude_max_retries = self.config.get("api.claude.max_retries", 2)
         claude_retry_delay = self.config.get("api.claude.retry_delay", 2)
         claude_command = self.config.get("api.claude.cli_command", "claude")
+        claude_stream = self.config.get("api.claude.stream", False)
 
         self.claude_client = ClaudeClient(
             cli_command=claude_command,
             timeout=claude_timeout,
             max_retries=claude_max_retries,
-            retry_delay=claude_retry_delay
+            retry_delay=claude_retry_delay,
+            stream=claude_stream
         )
 
         # Create agents
@@ -138,7 +173,39 @@ class RouteGuideOrchestrator:
         self.video_agent = VideoAgent(self.claude_client, timeout=video_timeout)
         self.music_agent = MusicAgent(self.claude_client, timeout=music_timeout)
         self.info_agent = InfoAgent(self.claude_client, timeout=info_timeout)
-        self.choice_agent = ChoiceAgent(self.claude_client, timeout=choice_timeout)
+        self.choice_agent = ChoiceAgent(
+            self.claude_client,
+            timeout=choice_timeout,
+            weights={
+                agent_type: self.config.get(f"agents.{agent_type}.weight", weight)
+                for agent_type, weight in DEFAULT_WEIGHTS.items()
+            },
+            confidence_threshold=self.config.get(
+                "agents.choice.confidence_threshold", DEFAULT_CONFIDENCE_THRESHOLD
+            )
+        )
+
+        # Prefetch content agent results for several waypoints per call
+        self.batch_enabled = self.config.get("agents.batch.enabled", True)
+        self.batch_size = self.config.get("agents.batch.size", 10)
+
+        # Optionally answer all four agents with one Claude call per waypoint
+        self.fused_agent = None
+        if self.config.get("agents.fused.enabled", False):
+            self.fused_agent = FusedAgent(
+                self.claude_client,
+                [self.video_agent, self.music_agent, self.info_agent],
+                self.choice_agent
+            )
+
+    def close(self) -> None:
+        """Release network resources held by the route service."""
+        self.route_service.close()
+
+    async def aclose(self) -> None:
+        """Release network resources, including the route service's async session."""
+        await self.route_service.aclose()
+        self.route_service.close()
 
     def process_route(
         self,
@@ -168,6 +235,10 @@ class RouteGuideOrchestrator:
 
         logger.info(f"Processing {len(route.waypoints)} waypoints")
 
+        # Answer the content agents for many waypoints per Claude call; the
+        # per-waypoint agents below then reuse the cached results
+        self._prefetch_agent_results([w.location.address for w in route.waypoints])
+
         # Process each waypoint
         stops = []
         consecutive_failures = 0
@@ -182,15 +253,9 @@ class RouteGuideOrchestrator:
             try:
                 choice_result = self._process_waypoint(waypoint.location.address)
 
-                if choice_result.selected_type != "none":
-                    stop = Stop(
-                        address=waypoint.location.address,
-                        choice=choice_result.to_dict()
-                    )
-                    stops.append(stop)
+                if self._add_stop(stops, waypoint.location.address, choice_result):
                     consecutive_failures = 0  # Reset on success
                 else:
-                    logger.warning(f"No content found for waypoint: {waypoint.location.address}")
                     consecutive_failures += 1
 
             except Exception as e:
@@ -208,6 +273,119 @@ class RouteGuideOrchestrator:
                 )
                 break
 
+        return self._finish_route(route, stops, start_time)
+
+    async def process_route_async(
+        self,
+        source: str,
+        destination: str
+    ) -> RouteGuideOutput:
+        """
+        Process complete route from an event loop.
+
+        Same as process_route, but each waypoint's agents are awaited
+        together (process_waypoint_async), so the loop stays free while the
+        Claude CLI calls run and the task can be cancelled between calls.
+
+        Args:
+            source: Source address
+            destination: Destination address
+
+        Returns:
+            RouteGuideOutput with all stops and recommendations
+
+        Raises:
+            RouteServiceError: If route retrieval fails
+            Exception: If processing fails critically
+        """
+        start_time = datetime.now()
+        logger.info(f"Processing route: {source} → {destination}")
+        loop = asyncio.get_running_loop()
+
+        # Get route
+        max_waypoints = self.config.get("route.max_waypoints", 20)
+        route = await self.route_service.get_route_async(source, destination, max_waypoints)
+
+        logger.info(f"Processing {len(route.waypoints)} waypoints")
+
+        await loop.run_in_executor(
+            None,
+            self._prefetch_agent_results,
+            [w.location.address for w in route.waypoints]
+        )
+
+        # Process each waypoint
+        stops = []
+        consecutive_failures = 0
+        max_failures = self.config.get("error_handling.max_consecutive_failures", 3)
+
+        for i, waypoint in enumerate(route.waypoints):
+            logger.info(
+                f"Processing waypoint {i + 1}/{len(route.waypoints)}: "
+                f"{waypoint.location.address}"
+            )
+
+            try:
+                choice_result = await self.process_waypoint_async(waypoint.location.address)
+
+                if self._add_stop(stops, waypoint.location.address, choice_result):
+                    consecutive_failures = 0  # Reset on success
+                else:
+                    consecutive_failures += 1
+
+            except Exception as e:
+                logger.error(f"Failed to process waypoint {waypoint.location.address}: {e}")
+                consecutive_failures += 1
+
+                # Check if we should continue
+                if not self.config.get("error_handling.continue_on_agent_failure", True):
+                    raise
+
+            # Check consecutive failures
+            if consecutive_failures >= max_failures:
+                logger.error(
+                    f"Too many consecutive failures ({consecutive_failures}), aborting"
+                )
+                break
+
+        return await loop.run_in_executor(None, self._finish_route, route, stops, start_time)
+
+    def _add_stop(self, stops: List[Stop], address: str, choice_result: ChoiceResult) -> bool:
+        """
+        Append a waypoint's selection to the stops, if it has one.
+
+        Args:
+            stops: Stops collected so far
+            address: Waypoint address
+            choice_result: Selection for the waypoint
+
+        Returns:
+            True if a stop was added
+        """
+        if choice_result.selected_type == "none":
+            logger.warning(f"No content found for waypoint: {address}")
+            return False
+
+        stops.append(Stop(address=address, choice=choice_result.to_dict()))
+        return True
+
+    def _finish_route(
+        self,
+        route: Route,
+        stops: List[Stop],
+        start_time: datetime
+    ) -> RouteGuideOutput:
+        """
+        Assemble the route output and save it if configured.
+
+        Args:
+            route: Processed route
+            stops: Stops with selected content
+            start_time: When processing started
+
+        Returns:
+            RouteGuideOutput with all stops and recommendations
+        """
         # Create output
         end_time = datetime.now()
         processing_time = (end_time - start_time).total_seconds()
@@ -237,12 +415,66 @@ class RouteGuideOrchestrator:
 
         return output
 
+    def _prefetch_agent_results(self, addresses: List[str]) -> None:
+        """
+        Warm the content agents' result caches with batched Claude calls.
+
+        Each content agent answers up to batch_size waypoints per call
+        (TemplateAgent.execute_many), so a route needs a few calls per agent
+        instead of one per waypoint. Skipped when batching is disabled, the
+        fused agent handles waypoints, or there is nothing to batch.
+
+        Args:
+            addresses: Waypoint addresses in route order
+        """
+        if not self.batch_enabled or self.fused_agent is not None:
+            return
+
+        if self.cache_enabled:
+            # Waypoints answered by a similar earlier stop need no agents
+            addresses = [
+                address for address in addresses
+                if _semantic_cache.get(address, self.cache_similarity) is None
+            ]
+        if len(addresses) < 2:
+            return
+
+        batch_size = max(1, self.batch_size)
+        batches = [
+            addresses[i:i + batch_size]
+            for i in range(0, len(addresses), batch_size)
+        ]
+
+        def prefetch(agent: TemplateAgent) -> None:
+            """Run one agent's batches, logging rather than raising failures."""
+            for batch in batches:
+                try:
+                    agent.execute_many(batch)
+                except Exception as e:
+                    logger.warning(f"{agent.agent_type} agent prefetch failed: {e}")
+
+        agents = [self.video_agent, self.music_agent, self.info_agent]
+        logger.info(
+            f"Prefetching {len(addresses)} waypoints in {len(batches)} batch(es) per agent"
+        )
+
+        if self.parallel_execution:
+            max_workers = max(1, min(self.max_workers, len(agents)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="AgentThread") as executor:
+                list(executor.map(prefetch, agents))
+        else:
+            for agent in agents:
+                prefetch(agent)
+
     def _process_waypoint(self, address: str) -> ChoiceResult:
         """
         Process single waypoint through all agents.
 
-        If parallel_execution is enabled, runs Video, Music, and Info agents
-        concurrently in separate threads. Otherwise, runs sequentially.
+        With caching enabled, a selection made for a sufficiently similar
+        address is reused. If the fused agent is enabled, one Claude call
+        answers all agents (falling back to separate agents if it fails).
+        Otherwise, if parallel_execution is enabled, runs Video, Music, and
+        Info agents concurrently in separate threads, or else sequentially.
 
         Args:
             address: Waypoint address
@@ -253,10 +485,55 @@ class RouteGuideOrchestrator:
         Raises:
             Exception: If all agents fail
         """
-        if self.parallel_execution:
-            return self._process_waypoint_parallel(address)
-        else:
-            return self._process_waypoint_sequential(address)
+        cached = self._cached_choice(address)
+        if cached is not None:
+            return cached
+
+        choice_result = None
+        if self.fused_agent is not None:
+            try:
+                choice_result = self.fused_agent.select_best(address)
+            except Exception as e:
+                logger.warning(f"Fused agent failed, running agents separately: {e}")
+
+        if choice_result is None:
+            if self.parallel_execution:
+                choice_result = self._process_waypoint_parallel(address)
+            else:
+                choice_result = self._process_waypoint_sequential(address)
+
+        self._remember_choice(address, choice_result)
+
+        return choice_result
+
+    def _cached_choice(self, address: str) -> Optional[ChoiceResult]:
+        """
+        Look up a selection made for a similar address.
+
+        Args:
+            address: Waypoint address
+
+        Returns:
+            Cached ChoiceResult, or None (always None with caching disabled)
+        """
+        if not self.cache_enabled:
+            return None
+
+        cached = _semantic_cache.get(address, self.cache_similarity)
+        if cached is not None:
+            logger.info(f"Reusing selection from a similar address for: {address}")
+        return cached
+
+    def _remember_choice(self, address: str, choice_result: ChoiceResult) -> None:
+        """
+        Cache a waypoint's selection for similar addresses.
+
+        Args:
+            address: Waypoint address
+            choice_result: Selection made for it
+        """
+        if self.cache_enabled and choice_result.selected_type != "none":
+            _semantic_cache.put(address, choice_result, self.cache_ttl)
 
     def _process_waypoint_sequential(self, address: str) -> ChoiceResult:
         """
@@ -296,106 +573,135 @@ class RouteGuideOrchestrator:
 
         Returns:
             ChoiceResult with selected content
-
-        Raises:
-            Exception: If thread execution fails
         """
         logger.debug(f"Processing waypoint in parallel: {address}")
 
-        # Dictionary to store results from each agent thread
-        results = {
-            'video': None,
-            'music': None,
-            'info': None
-        }
+        video_result, music_result, info_result = self.run_agents(
+            address,
+            [self.video_agent, self.music_agent, self.info_agent]
+        )
 
-        # Define agent execution functions
-        def run_video_agent():
-            """Execute video agent in thread."""
-            try:
-                logger.debug(f"[Thread-Video] Starting for {address}")
-                result = self.video_agent.execute(address)
-                logger.debug(f"[Thread-Video] Completed for {address}")
-                return ('video', result)
-            except Exception as e:
-                logger.error(f"[Thread-Video] Failed: {e}")
-                return ('video', self.video_agent._create_error_result(address, str(e)))
+        logger.info(f"All agents completed in parallel for {address}")
 
-        def run_music_agent():
-            """Execute music agent in thread."""
+        # Let choice agent select best option
+        choice_result = self.choice_agent.select_best(
+            address,
+            video_result,
+            music_result,
+            info_result
+        )
+
+        return choice_result
+
+    def run_agents(self, address: str, agents: List[BaseAgent]) -> List[AgentResult]:
+        """
+        Execute several agents for one address concurrently.
+
+        Agent calls block on the Claude CLI subprocess, so running them in
+        threads makes the wall-clock time that of the slowest agent rather
+        than the sum of all of them.
+
+        Args:
+            address: Location address
+            agents: Agents to execute
+
+        Returns:
+            One AgentResult per agent, in the same order as agents; an agent
+            that raises yields its error result
+        """
+        def run_agent(agent: BaseAgent) -> AgentResult:
+            """Execute one agent in a worker thread."""
             try:
-                logger.debug(f"[Thread-Music] Starting for {address}")
-                result = self.music_agent.execute(address)
-                logger.debug(f"[Thread-Music] Completed for {address}")
-                return ('music', result)
+                return agent.execute(address)
             except Exception as e:
-                logger.error(f"[Thread-Music] Failed: {e}")
-                return ('music', self.music_agent._create_error_result(address, str(e)))
+                logger.error(f"[Parallel] {agent.agent_type} agent thread failed: {e}")
+                return agent._create_error_result(address, str(e))
+
+        max_workers = max(1, min(self.max_workers, len(agents)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="AgentThread") as executor:
+            return list(executor.map(run_agent, agents))
+
+    async def process_waypoint_async(self, address: str) -> ChoiceResult:
+        """
+        Process single waypoint through all agents from an event loop.
+
+        Mirrors _process_waypoint: a cached selection for a similar address
+        is reused, then the fused agent is tried if enabled; otherwise the
+        Video, Music, and Info agents are awaited together (or one after
+        another without parallel_execution). Blocking calls run in the
+        loop's default executor.
+
+        Args:
+            address: Waypoint address
+
+        Returns:
+            ChoiceResult with selected content
+        """
+        logger.debug(f"Processing waypoint asynchronously: {address}")
 
-        def run_info_agent():
-            """Execute info agent in thread."""
+        cached = self._cached_choice(address)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+
+        choice_result = None
+        if self.fused_agent is not None:
             try:
-                logger.debug(f"[Thread-Info] Starting for {address}")
-                result = self.info_agent.execute(address)
-                logger.debug(f"[Thread-Info] Completed for {address}")
-                return ('info', result)
+                choice_result = await loop.run_in_executor(
+                    None, self.fused_agent.select_best, address
+                )
             except Exception as e:
-                logger.error(f"[Thread-Info] Failed: {e}")
-                return ('info', self.info_agent._create_error_result(address, str(e)))
-
-        # Execute agents in parallel using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="AgentThread") as executor:
-            # Submit all three agents to thread pool
-            future_to_agent = {
-                executor.submit(run_video_agent): 'video',
-                executor.submit(run_music_agent): 'music',
-                executor.submit(run_info_agent): 'info'
-            }
+                logger.warning(f"Fused agent failed, running agents separately: {e}")
+
+        if choice_result is None:
+            agents = [self.video_agent, self.music_agent, self.info_agent]
+            if self.parallel_execution:
+                results = await self.run_agents_async(address, agents)
+            else:
+                results = [await agent.run(address) for agent in agents]
+
+            video_result, music_result, info_result = results
+            choice_result = await loop.run_in_executor(
+                None,
+                self.choice_agent.select_best,
+                address,
+                video_result,
+                music_result,
+                info_result
+            )
 
-            # Collect results as threads complete
-            for future in as_completed(future_to_agent):
-                agent_name = future_to_agent[future]
-                try:
-                    agent_type, result = future.result()
-                    results[agent_type] = result
-                    logger.debug(f"[Parallel] {agent_name} agent completed")
-                except Exception as e:
-                    logger.error(f"[Parallel] {agent_name} agent thread failed: {e}")
-                    # Create error result as fallback
-                    results[agent_name] = AgentResult(
-                        agent_type=agent_name,
-                        title=f"No {agent_name} found",
-                        content="",
-                        metadata={"address": address, "error": str(e)},
-                        success=False,
-                        error_message=str(e)
-                    )
+        self._remember_choice(address, choice_result)
 
-        logger.info(f"All agents completed in parallel for {address}")
+        return choice_result
 
-        # Ensure all results are present
-        if None in results.values():
-            logger.error("Some agents did not return results")
-            for agent_type, result in results.items():
-                if result is None:
-                    results[agent_type] = AgentResult(
-                        agent_type=agent_type,
-                        title=f"No {agent_type} found",
-                        content="",
-                        metadata={"address": address, "error": "Agent did not complete"},
-                        success=False,
-                        error_message="Agent did not complete"
-                    )
+    async def run_agents_async(
+        self,
+        address: str,
+        agents: List[BaseAgent]
+    ) -> List[AgentResult]:
+        """
+        Await several agents for one address concurrently.
 
-        # Let choice agent select best option
-        choice_result = self.choice_agent.select_best(
-            address,
-            results['video'],
-            results['music'],
-            results['info']
+        Args:
+            address: Location address
+            agents: Agents to execute
+
+        Returns:
+            One AgentResult per agent, in the same order as agents; an agent
+            that raises yields its error result
+        """
+        results = await asyncio.gather(
+            *(agent.run(address) for agent in agents),
+            return_exceptions=True
         )
 
-        return choice_result
+        for i, (agent, result) in enumerate(zip(agents, results)):
+            if isinstance(result, Exception):
+                logger.error(f"[Async] {agent.agent_type} agent failed: {result}")
+                results[i] = agent._create_error_result(address, str(result))
+
+        return results
 
     def _save_output(self, output: RouteGuideOutput) -> None:
         """
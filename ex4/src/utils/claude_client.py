@@ -1,20 +1,83 @@
 """Claude CLI client wrapper for Route Guide System."""
 
+import codecs
 import json
+import os
+import selectors
+import signal
 import subprocess
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Union
 
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bytes read from the CLI's stdout per streamed chunk
+STREAM_CHUNK_SIZE = 4096
+
 
 class ClaudeClientError(Exception):
     """Exception raised for Claude CLI errors."""
     pass
 
 
+class JSONCompletionScanner:
+    """
+    Incremental brace/bracket counter for streamed JSON.
+
+    Fed text chunks as they arrive, it reports where the first top-level
+    JSON value of the expected kind closes, ignoring brackets inside string
+    literals. Any prose before the expected opening bracket is skipped,
+    including brackets of the other kind.
+    """
+
+    def __init__(self, opening: str = "{"):
+        """
+        Initialize the scanner.
+
+        Args:
+            opening: '{' to find an object, '[' to find an array
+        """
+        self.opening = opening
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk: str) -> Optional[int]:
+        """
+        Scan the next chunk of text.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            Index just past the closing bracket within this chunk, or None
+            if the JSON value has not closed yet
+        """
+        for i, char in enumerate(chunk):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif self.depth == 0:
+                if char == self.opening:
+                    self.depth = 1
+            elif char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.depth += 1
+            elif char in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return None
+
+
 class ClaudeClient:
     """
     Wrapper for calling Claude via CLI.
@@ -27,7 +90,8 @@ class ClaudeClient:
         cli_command: str = "claude",
         timeout: int = 30,
         max_retries: int = 2,
-        retry_delay: int = 2
+        retry_delay: int = 2,
+        stream: bool = False
     ):
         """
         Initialize Claude CLI client.
@@ -37,19 +101,30 @@ class ClaudeClient:
             timeout: Timeout for Claude invocation (seconds)
             max_retries: Maximum retry attempts for transient errors
             retry_delay: Delay between retries (seconds)
+            stream: Stream responses and stop the CLI as soon as the
+                JSON answer is complete (trailing commentary is dropped)
         """
         self.cli_command = cli_command
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.stream = stream
 
-    def call(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def call(
+        self,
+        prompt: Union[str, bytes],
+        system_prompt: Optional[str] = None,
+        json_opening: str = "{"
+    ) -> str:
         """
         Call Claude with a prompt via CLI.
 
         Args:
-            prompt: User prompt to send to Claude
+            prompt: User prompt to send to Claude (str, or UTF-8 bytes
+                from callers that already encoded it)
             system_prompt: Optional system prompt
+            json_opening: Bracket the expected JSON answer opens with
+                ('{' or '['); streaming stops once that value closes
 
         Returns:
             Claude's response text
@@ -57,8 +132,14 @@ class ClaudeClient:
         Raises:
             ClaudeClientError: If Claude invocation fails
         """
+        # Encode once; retries reuse the same bytes
+        if isinstance(prompt, str):
+            prompt = prompt.encode("utf-8")
+
         for attempt in range(self.max_retries + 1):
             try:
+                if self.stream:
+                    return self._invoke_claude_streaming(prompt, system_prompt, json_opening)
                 return self._invoke_claude(prompt, system_prompt)
             except subprocess.TimeoutExpired:
                 if attempt < self.max_retries:
@@ -85,12 +166,12 @@ class ClaudeClient:
 
         raise ClaudeClientError("Failed to invoke Claude after all retry attempts")
 
-    def _invoke_claude(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def _invoke_claude(self, prompt: bytes, system_prompt: Optional[str] = None) -> str:
         """
         Invoke Claude CLI subprocess.
 
         Args:
-            prompt: User prompt
+            prompt: UTF-8 encoded user prompt
             system_prompt: Optional system prompt
 
         Returns:
@@ -100,27 +181,27 @@ class ClaudeClient:
             subprocess.TimeoutExpired: If call times out
             subprocess.CalledProcessError: If call fails
         """
-        # Construct command
-        # Using echo to pipe prompt to claude
-        cmd = f'echo {self._escape_prompt(prompt)} | {self.cli_command}'
-
-        if system_prompt:
-            # Note: Claude CLI syntax may vary - adjust as needed
-            cmd = f'echo {self._escape_prompt(prompt)} | {self.cli_command} --system {self._escape_prompt(system_prompt)}'
+        cmd = self._build_command(system_prompt)
 
         logger.debug(f"Invoking Claude CLI: {self.cli_command}")
 
-        # Execute command
+        # Execute command, writing the prompt bytes straight to stdin
         result = subprocess.run(
             cmd,
             shell=True,
+            input=prompt,
             capture_output=True,
-            text=True,
-            timeout=self.timeout,
-            check=True
+            timeout=self.timeout
         )
 
-        response = result.stdout.strip()
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode,
+                cmd,
+                stderr=result.stderr.decode("utf-8", errors="replace")
+            )
+
+        response = result.stdout.decode("utf-8", errors="replace").strip()
 
         if not response:
             raise ClaudeClientError("Claude returned empty response")
@@ -129,6 +210,201 @@ class ClaudeClient:
 
         return response
 
+    def call_stream(
+        self,
+        prompt: Union[str, bytes],
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Call Claude via CLI, yielding response text as it is produced.
+
+        Closing the iterator early (e.g. breaking out of a for loop)
+        terminates the CLI process, so no further tokens are generated.
+
+        Args:
+            prompt: User prompt to send to Claude (str or UTF-8 bytes)
+            system_prompt: Optional system prompt
+
+        Yields:
+            Chunks of Claude's response text
+
+        Raises:
+            subprocess.TimeoutExpired: If the response takes longer than the timeout
+            subprocess.CalledProcessError: If the CLI exits with an error
+        """
+        if isinstance(prompt, str):
+            prompt = prompt.encode("utf-8")
+
+        cmd = self._build_command(system_prompt)
+
+        logger.debug(f"Streaming Claude CLI: {self.cli_command}")
+
+        # Own process group so the CLI and anything it spawns can be stopped
+        process = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True
+        )
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        deadline = time.monotonic() + self.timeout
+
+        # Drain stderr concurrently so a chatty CLI never blocks on a full pipe
+        stderr_chunks = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()),
+            daemon=True
+        )
+        stderr_reader.start()
+
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ)
+
+        try:
+            process.stdin.write(prompt)
+            process.stdin.close()
+
+            while True:
+                # Wait for output no longer than the time left, so a silent
+                # CLI still times out
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    raise subprocess.TimeoutExpired(cmd, self.timeout)
+
+                data = os.read(process.stdout.fileno(), STREAM_CHUNK_SIZE)
+                if not data:
+                    break
+                text = decoder.decode(data)
+                if text:
+                    yield text
+
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+
+            returncode = process.wait(timeout=max(deadline - time.monotonic(), 0))
+            stderr_reader.join()
+            if returncode != 0:
+                stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+                raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+        finally:
+            if process.poll() is None:
+                self._terminate(process)
+            stderr_reader.join(timeout=1)
+            selector.close()
+            process.stdout.close()
+            process.stderr.close()
+
+    def _invoke_claude_streaming(
+        self,
+        prompt: bytes,
+        system_prompt: Optional[str] = None,
+        json_opening: str = "{"
+    ) -> str:
+        """
+        Stream Claude's response, stopping once the JSON answer closes.
+
+        Args:
+            prompt: UTF-8 encoded user prompt
+            system_prompt: Optional system prompt
+            json_opening: Bracket the expected JSON answer opens with
+
+        Returns:
+            Response text up to the end of the first JSON value opening
+            with json_opening; the full text if there is none or that
+            value doesn't parse
+
+        Raises:
+            subprocess.TimeoutExpired: If call times out
+            subprocess.CalledProcessError: If call fails
+        """
+        scanner = JSONCompletionScanner(json_opening)
+        scanning = True
+        parts = []
+
+        stream = self.call_stream(prompt, system_prompt)
+        try:
+            for chunk in stream:
+                if scanning:
+                    end = scanner.feed(chunk)
+                    if end is not None:
+                        parts.append(chunk[:end])
+                        if self._is_json_value("".join(parts), json_opening):
+                            break
+                        # Not the answer (e.g. braces in prose): read it all
+                        parts[-1] = chunk
+                        scanning = False
+                        continue
+                parts.append(chunk)
+        finally:
+            stream.close()
+
+        response = "".join(parts).strip()
+
+        if not response:
+            raise ClaudeClientError("Claude returned empty response")
+
+        logger.debug(f"Claude response length: {len(response)} characters")
+
+        return response
+
+    def _is_json_value(self, text: str, json_opening: str) -> bool:
+        """
+        Check whether text ends with a JSON value starting at the first
+        json_opening bracket.
+
+        Args:
+            text: Response text ending where the scanner found the value closing
+            json_opening: Bracket the value opens with
+
+        Returns:
+            True if that slice parses as JSON
+        """
+        try:
+            json.loads(text[text.find(json_opening):])
+        except ValueError:
+            return False
+        return True
+
+    def _terminate(self, process: subprocess.Popen) -> None:
+        """
+        Stop a streaming CLI process and its pipeline.
+
+        Args:
+            process: Running CLI process
+        """
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            pass  # Already exited
+        process.wait()
+
+    def _build_command(self, system_prompt: Optional[str] = None) -> str:
+        """
+        Construct the shell command that runs the Claude CLI.
+
+        The prompt itself is written to the command's stdin, so it is
+        neither shell-escaped nor limited by the command-line length.
+
+        Args:
+            system_prompt: Optional system prompt
+
+        Returns:
+            Shell command string
+        """
+        cmd = self.cli_command
+
+        if system_prompt:
+            # Note: Claude CLI syntax may vary - adjust as needed
+            cmd += f' --system {self._escape_prompt(system_prompt)}'
+
+        return cmd
+
     def _escape_prompt(self, prompt: str) -> str:
         """
         Escape prompt for shell command.
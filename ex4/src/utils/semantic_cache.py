@@ -0,0 +1,174 @@
+"""Similarity-keyed cache for Route Guide System."""
+
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+# Sparse unit vector: trigram -> weight
+Embedding = Dict[str, float]
+
+_WORD_RE = re.compile(r"\w+")
+
+# Words a trigram match can't tell apart: compass directions ("North" vs
+# "South Main Street") and US state / territory codes ("NY" vs "NJ")
+_DIRECTIONS = frozenset({
+    "n", "s", "e", "w", "ne", "nw", "se", "sw",
+    "north", "south", "east", "west",
+    "northeast", "northwest", "southeast", "southwest",
+})
+_STATE_CODES = frozenset("""
+    al ak az ar ca co ct de dc fl ga hi id il in ia ks ky la me md ma mi mn
+    ms mo mt ne nv nh nj nm ny nc nd oh ok or pa ri sc sd tn tx ut vt va wa
+    wv wi wy as gu mp pr vi
+""".split())
+_EXACT_WORDS = _DIRECTIONS | _STATE_CODES
+
+
+def embed_text(text: str) -> Embedding:
+    """
+    Embed text as a normalized character-trigram vector.
+
+    A hashing-style embedder with no model or dependency: texts that share
+    most of their trigrams ("Main St, Springfield, IL" vs "Main Street,
+    Springfield IL") score close to 1.0 under cosine similarity.
+
+    Args:
+        text: Text to embed
+
+    Returns:
+        Sparse embedding with unit L2 norm (empty for blank text)
+    """
+    normalized = " " + " ".join(text.lower().replace(",", " ").split()) + " "
+    counts = Counter(normalized[i:i + 3] for i in range(len(normalized) - 2))
+    norm = math.sqrt(sum(count * count for count in counts.values()))
+    if not norm:
+        return {}
+    return {gram: count / norm for gram, count in counts.items()}
+
+
+def exact_tokens(text: str) -> Tuple[str, ...]:
+    """
+    Tokens of text that must match exactly for a cache hit.
+
+    Trigram similarity barely changes when one short token does, so "Exit
+    12" and "Exit 17", "NY" and "NJ" or "North" and "South" look alike.
+    These are numbers (house, exit and zip), state codes and directions.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Lowercased tokens in order, leading zeros kept
+    """
+    return tuple(
+        token for token in _WORD_RE.findall(text.lower())
+        if token in _EXACT_WORDS or any(char.isdigit() for char in token)
+    )
+
+
+def cosine_similarity(a: Embedding, b: Embedding) -> float:
+    """
+    Cosine similarity of two unit embeddings.
+
+    Args:
+        a: First embedding
+        b: Second embedding
+
+    Returns:
+        Similarity between 0.0 and 1.0
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(gram, 0.0) for gram, weight in a.items())
+
+
+class SemanticCache(Generic[V]):
+    """
+    Bounded cache looked up by text similarity rather than exact key.
+
+    Lookups embed the query and scan the (small) cache for the most
+    similar entry with exactly the same numbers, state codes and
+    directions (see exact_tokens); entries expire after their TTL and the
+    least recently used are evicted beyond capacity. Thread-safe.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[Embedding, Tuple[str, ...], V, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str, min_similarity: float) -> Optional[V]:
+        """
+        Find the cached value whose text is most similar to the query.
+
+        Args:
+            text: Query text
+            min_similarity: Minimum cosine similarity for a hit
+
+        Returns:
+            Cached value, or None if no live entry with the same exact
+            tokens is similar enough
+        """
+        query = embed_text(text)
+        if not query:
+            return None
+        tokens = exact_tokens(text)
+
+        now = time.monotonic()
+        with self._lock:
+            best_key, best_value, best_score = None, None, min_similarity
+            for key, (embedding, entry_tokens, value, expires) in list(self._entries.items()):
+                if expires <= now:
+                    del self._entries[key]
+                    continue
+                if entry_tokens != tokens:
+                    continue
+                score = cosine_similarity(query, embedding)
+                if score >= best_score:
+                    best_key, best_value, best_score = key, value, score
+
+            if best_key is not None:
+                self._entries.move_to_end(best_key)
+            return best_value
+
+    def put(self, text: str, value: V, ttl: float = math.inf) -> None:
+        """
+        Store a value under a text key.
+
+        Args:
+            text: Key text
+            value: Value to cache
+            ttl: Seconds until the entry expires
+        """
+        if self.max_size <= 0:
+            return
+
+        embedding = embed_text(text)
+        if not embedding:
+            return
+
+        key = " ".join(text.lower().split())
+        with self._lock:
+            self._entries[key] = (embedding, exact_tokens(text), value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,6 +5,25 @@ from unittest.mock import Mock
 from src.utils.claude_client import ClaudeClient
 
 
+@pytest.fixture(autouse=True)
+def clear_agent_caches():
+    """Keep process-wide caches from leaking between tests."""
+    from src.agents.base_agent import clear_response_cache
+    from src.agents.choice_agent import clear_selection_cache
+    from src.config.route_service import clear_directions_cache
+    from src.orchestrator import clear_semantic_cache
+
+    clear_response_cache()
+    clear_selection_cache()
+    clear_semantic_cache()
+    clear_directions_cache()
+    yield
+    clear_response_cache()
+    clear_selection_cache()
+    clear_semantic_cache()
+    clear_directions_cache()
+
+
 @pytest.fixture
 def mock_claude_client():
     """Create a mock Claude client for testing."""
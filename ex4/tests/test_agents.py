@@ -7,6 +7,7 @@ from src.agents.video_agent import VideoAgent
 from src.agents.music_agent import MusicAgent
 from src.agents.info_agent import InfoAgent
 from src.agents.choice_agent import ChoiceAgent, ChoiceResult
+from src.agents.fused_agent import FusedAgent
 
 
 class TestBaseAgent:
@@ -39,6 +40,51 @@ class TestBaseAgent:
         assert result_dict["type"] == "test"
         assert result_dict["title"] == "Test"
 
+    def test_repeated_prompt_uses_cache(self):
+        """Test repeated prompts reuse the cached Claude response."""
+        claude_mock = Mock()
+        claude_mock.call.return_value = "response"
+        agent = VideoAgent(claude_mock)
+
+        assert agent._call_claude("prompt") == "response"
+        assert agent._call_claude("prompt") == "response"
+        assert claude_mock.call.call_count == 1
+
+        uncached = VideoAgent(claude_mock, cache=False)
+        uncached._call_claude("prompt")
+        assert claude_mock.call.call_count == 2
+
+    def test_repeated_address_uses_result_cache(self):
+        """Test the same address (up to case/spacing) reuses the parsed result."""
+        claude_mock = Mock()
+        claude_mock.call.return_value = (
+            '{"title": "Tour", "url": "https://youtube.com/x", "description": "d"}'
+        )
+        agent = VideoAgent(claude_mock)
+
+        first = agent.execute("Times Square, New York")
+        second = agent.execute("times square,  New York ")
+
+        assert first.success is True
+        assert second is first
+        assert claude_mock.call.call_count == 1
+
+    def test_execute_many_single_call(self):
+        """Test several addresses are answered by one batched call."""
+        claude_mock = Mock()
+        claude_mock.call.return_value = """[
+            {"title": "Historic Boston", "summary": "Old city."},
+            {"title": "Historic Salem", "summary": "Witch trials."}
+        ]"""
+        agent = InfoAgent(claude_mock)
+
+        results = agent.execute_many(["Boston, MA", "Salem, MA"])
+
+        assert claude_mock.call.call_count == 1
+        assert [r.title for r in results] == ["Historic Boston", "Historic Salem"]
+        assert results[1].metadata["address"] == "Salem, MA"
+        assert b"1. Boston, MA" in claude_mock.call.call_args[0][0]
+
 
 class TestVideoAgent:
     """Tests for VideoAgent."""
@@ -85,6 +131,29 @@ class TestVideoAgent:
         with pytest.raises(ValueError):
             agent._parse_response(response, "Test Location")
 
+    def test_parse_response_with_braces_in_prose(self):
+        """Test JSON is found between prose that itself contains braces."""
+        claude_mock = Mock()
+        agent = VideoAgent(claude_mock)
+
+        response = (
+            'Sure {here it is}:\n'
+            '{"title": "Tour", "url": "https://youtube.com/x", "description": "d"}\n'
+            'Hope this helps {:}'
+        )
+
+        result = agent._parse_response(response, "Test Location")
+
+        assert result.title == "Tour"
+
+    def test_parse_missing_fields(self):
+        """Test every missing required field is reported."""
+        claude_mock = Mock()
+        agent = VideoAgent(claude_mock)
+
+        with pytest.raises(ValueError, match="description, url"):
+            agent._parse_response('{"title": "Tour"}', "Test Location")
+
 
 class TestMusicAgent:
     """Tests for MusicAgent."""
@@ -121,6 +190,24 @@ class TestMusicAgent:
         assert "Sweet Home Alabama" in result.title
         assert "Lynyrd Skynyrd" in result.title
 
+    def test_parse_spotify_source(self):
+        """Test non-YouTube music links are labelled as Spotify."""
+        claude_mock = Mock()
+        agent = MusicAgent(claude_mock)
+
+        response = """
+        {
+            "title": "Boston",
+            "artist": "Augustana",
+            "url": "https://open.spotify.com/track/abc"
+        }
+        """
+
+        result = agent._parse_response(response, "Boston")
+
+        assert result.metadata["source"] == "spotify"
+        assert result.metadata["genre"] == "Unknown"
+
 
 class TestInfoAgent:
     """Tests for InfoAgent."""
@@ -178,6 +265,21 @@ class TestChoiceAgent:
 
         assert choice.selected_type == "info"
 
+    def test_selection_metadata_is_read_only_view(self):
+        """Test the selected metadata is shared, not copied, and read-only."""
+        claude_mock = Mock()
+        agent = ChoiceAgent(claude_mock)
+
+        info_result = AgentResult("info", "Info", "text", {"category": "History"}, success=True)
+        video_result = AgentResult("video", "Video", "url", {}, success=False)
+        music_result = AgentResult("music", "Music", "url", {}, success=False)
+
+        choice = agent._fallback_selection("Test Address", video_result, music_result, info_result)
+
+        assert choice.metadata["category"] == "History"
+        with pytest.raises(TypeError):
+            choice.metadata["category"] = "Other"
+
     def test_fallback_selection_video_when_info_fails(self):
         """Test fallback selects video when info fails."""
         claude_mock = Mock()
@@ -230,3 +332,84 @@ class TestChoiceAgent:
         assert choice_dict["type"] == "video"
         assert choice_dict["title"] == "Test Video"
         assert choice_dict["reason"] == "Most relevant"
+
+    def test_heuristic_clear_winner_skips_claude(self):
+        """Test a clearly better option is selected without calling Claude."""
+        claude_mock = Mock()
+        agent = ChoiceAgent(claude_mock)
+
+        video_result = AgentResult("video", "Drone footage", "url", {}, success=True)
+        music_result = AgentResult("music", "Song", "url", {}, success=True)
+        info_result = AgentResult(
+            "info", "Historic Boston", "Boston was founded in 1630.",
+            {"highlights": ["Tea Party"], "category": "History"}, success=True
+        )
+
+        choice = agent.select_best("Boston, MA", video_result, music_result, info_result)
+
+        assert choice.selected_type == "info"
+        claude_mock.call.assert_not_called()
+
+    def test_heuristic_tie_asks_claude(self):
+        """Test evenly matched options escalate to Claude."""
+        claude_mock = Mock()
+        claude_mock.call.return_value = '{"selected": "music", "reason": "Fits"}'
+        agent = ChoiceAgent(claude_mock)
+
+        video_result = AgentResult("video", "Video", "url", {}, success=True)
+        music_result = AgentResult("music", "Music", "url", {}, success=True)
+        info_result = AgentResult("info", "Info", "text", {}, success=True)
+
+        choice = agent.select_best("Test Address", video_result, music_result, info_result)
+
+        assert choice.selected_type == "music"
+        claude_mock.call.assert_called_once()
+
+
+class TestFusedAgent:
+    """Tests for FusedAgent."""
+
+    @staticmethod
+    def make_agent(claude_mock):
+        """Create a fused agent over fresh content and choice agents."""
+        return FusedAgent(
+            claude_mock,
+            [VideoAgent(claude_mock), MusicAgent(claude_mock), InfoAgent(claude_mock)],
+            ChoiceAgent(claude_mock)
+        )
+
+    def test_single_call_selection(self):
+        """Test one Claude call yields all sections and the selection."""
+        claude_mock = Mock()
+        claude_mock.call.return_value = """{
+            "video": {"title": "Tour", "url": "https://youtube.com/x", "description": "d"},
+            "music": {"title": "Song", "artist": "Band", "url": "https://youtube.com/y"},
+            "info": {"title": "Historic Boston", "summary": "Old city."},
+            "selected": "music",
+            "reason": "Great song"
+        }"""
+        agent = self.make_agent(claude_mock)
+
+        choice = agent.select_best("Boston, MA")
+
+        assert claude_mock.call.call_count == 1
+        assert choice.selected_type == "music"
+        assert choice.title == "Song - Band"
+        assert choice.reason == "Great song"
+        assert [r.success for r in choice.alternatives] == [True, True, True]
+
+    def test_invalid_selection_uses_choice_agent(self):
+        """Test a selection naming a broken section falls back to the Choice Agent."""
+        claude_mock = Mock()
+        claude_mock.call.return_value = """{
+            "video": {"title": "Tour"},
+            "music": {"title": "Song", "artist": "Band", "url": "https://youtube.com/y"},
+            "info": {"title": "Historic Boston", "summary": "Old city."},
+            "selected": "video"
+        }"""
+        agent = self.make_agent(claude_mock)
+
+        choice = agent.select_best("Boston, MA")
+
+        assert choice.selected_type == "info"
+        assert choice.alternatives[0].success is False
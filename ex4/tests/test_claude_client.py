@@ -0,0 +1,94 @@
+"""Unit tests for Claude CLI client."""
+
+import time
+
+import pytest
+
+from src.agents.base_agent import extract_json
+from src.utils.claude_client import ClaudeClient, ClaudeClientError, JSONCompletionScanner
+
+
+class TestJSONCompletionScanner:
+    """Tests for streamed JSON completion detection."""
+
+    def test_object_split_across_chunks(self):
+        """Test the end of an object is found in the chunk that closes it."""
+        scanner = JSONCompletionScanner()
+
+        assert scanner.feed('Here you go: {"title": "A"') is None
+        assert scanner.feed(', "tags": ["x"]}') == 16
+
+    def test_brackets_inside_strings_ignored(self):
+        """Test braces and escaped quotes inside strings do not end the scan."""
+        scanner = JSONCompletionScanner()
+
+        text = '{"title": "a}b \\" ]", "n": 1} trailing'
+        assert scanner.feed(text) == text.index("} trailing") + 1
+
+    def test_array_response(self):
+        """Test a batched array response ends after its closing bracket."""
+        scanner = JSONCompletionScanner("[")
+
+        text = '[{"a": 1}, {"b": 2}] done'
+        assert scanner.feed(text) == len('[{"a": 1}, {"b": 2}]')
+
+    def test_other_brackets_in_prose_skipped(self):
+        """Test brackets of the other kind before the answer don't start the scan."""
+        scanner = JSONCompletionScanner("{")
+
+        text = 'Here are the picks [ranked]: {"title": "x"} trailing'
+        assert scanner.feed(text) == text.index(" trailing")
+
+
+class TestClaudeClientStreaming:
+    """Tests for streamed CLI calls against a stand-in shell command."""
+
+    @staticmethod
+    def streaming_client(script, timeout=5):
+        """Create a streaming client whose CLI consumes the prompt, then runs script."""
+        return ClaudeClient(
+            cli_command=f"cat >/dev/null; {script}",
+            timeout=timeout,
+            max_retries=0,
+            stream=True
+        )
+
+    def test_prose_with_brackets_before_json(self):
+        """Test a reply with bracketed prose before the JSON still parses."""
+        client = self.streaming_client(
+            """printf '%s' 'Here are the picks [ranked]: {"title": "x"} Enjoy!'"""
+        )
+
+        response = client.call("hi")
+
+        assert response == 'Here are the picks [ranked]: {"title": "x"}'
+        assert extract_json(response) == {"title": "x"}
+
+    def test_unparseable_braces_read_full_response(self):
+        """Test braces in prose that aren't JSON fall back to the full response."""
+        client = self.streaming_client(
+            """printf '%s' 'Use {braces} here: {"title": "x"}'"""
+        )
+
+        response = client.call("hi")
+
+        assert response == 'Use {braces} here: {"title": "x"}'
+        assert extract_json(response) == {"title": "x"}
+
+    def test_silent_cli_times_out(self):
+        """Test a CLI that produces no output is stopped at the timeout."""
+        client = self.streaming_client('sleep 6; echo "{}"', timeout=1)
+
+        started = time.monotonic()
+        with pytest.raises(ClaudeClientError, match="timed out"):
+            client.call("hi")
+
+        assert time.monotonic() - started < 3
+
+    def test_large_stderr_does_not_block(self):
+        """Test heavy stderr output is drained while stdout is read."""
+        client = self.streaming_client(
+            """head -c 200000 /dev/zero | tr '\\0' x >&2; echo '{"title": "x"}'"""
+        )
+
+        assert client.call("hi") == '{"title": "x"}'
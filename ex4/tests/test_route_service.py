@@ -0,0 +1,228 @@
+"""Unit tests for the Google Maps route service."""
+
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.config import route_service
+from src.config.route_service import RouteService, RouteServiceError
+
+
+class TestRouteService:
+    """Tests for RouteService."""
+
+    def test_get_routes_concurrently(self, sample_route_data):
+        """Test get_routes returns one route per pair, in order."""
+        service = RouteService(api_key="test_key")
+
+        with patch.object(RouteService, "_acall_directions_api") as mock_call:
+            async def fake_call(origin, destination):
+                return sample_route_data
+            mock_call.side_effect = fake_call
+
+            routes = asyncio.run(service.get_routes([
+                ("New York, NY", "Boston, MA"),
+                ("Boston, MA", "New York, NY"),
+            ]))
+
+        assert len(routes) == 2
+        assert mock_call.call_count == 2
+        assert routes[0].destination.address == "Boston, MA, USA"
+        assert len(routes[0].waypoints) == 2
+
+    def test_get_route_async_without_aiohttp(self, sample_route_data):
+        """Test the async path falls back to the blocking call in a thread."""
+        service = RouteService(api_key="test_key")
+
+        with patch("src.config.route_service.aiohttp", None), \
+                patch.object(service, "_call_directions_api", return_value=sample_route_data) as mock_call:
+            route = asyncio.run(service.get_route_async("New York, NY", "Boston, MA"))
+
+        mock_call.assert_called_once_with("New York, NY", "Boston, MA")
+        assert route.total_distance == 346.0
+
+    def test_repeated_route_uses_cache(self, sample_route_data):
+        """Test the same route (up to case/spacing) is fetched only once."""
+        service = RouteService(api_key="test_key")
+
+        with patch.object(service, "_call_directions_api", return_value=sample_route_data) as mock_call:
+            first = service.get_route("New York, NY", "Boston, MA", max_waypoints=2)
+            second = service.get_route("new york,  NY", "BOSTON, MA", max_waypoints=1)
+
+        assert mock_call.call_count == 1
+        assert len(first.waypoints) == 2
+        assert len(second.waypoints) == 1
+
+    def test_route_cache_disabled(self, sample_route_data):
+        """Test cache_ttl=0 always calls the API."""
+        service = RouteService(api_key="test_key", cache_ttl=0)
+
+        with patch.object(service, "_call_directions_api", return_value=sample_route_data) as mock_call:
+            service.get_route("New York, NY", "Boston, MA")
+            service.get_route("New York, NY", "Boston, MA")
+
+        assert mock_call.call_count == 2
+
+    @staticmethod
+    def http_response(status_code, payload=None):
+        """Create a mock requests response with the given status."""
+        response = Mock()
+        response.status_code = status_code
+        response.content = json.dumps(payload).encode()
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.HTTPError(
+                f"{status_code} Error", response=response
+            )
+        return response
+
+    def test_backoff_delay_grows_and_caps(self):
+        """Test retry delays double per attempt, capped at max_delay."""
+        service = RouteService(api_key="test_key", retry_delay=1, max_delay=5, jitter=0)
+
+        assert [service._backoff_delay(n) for n in range(4)] == [1, 2, 4, 5]
+
+    def test_retries_rate_limited_request(self, sample_route_data):
+        """Test HTTP 429 is retried with backoff."""
+        service = RouteService(api_key="test_key", cache_ttl=0)
+
+        responses = [self.http_response(429), self.http_response(200, sample_route_data)]
+        with patch.object(service._session, "get", side_effect=responses) as mock_get, \
+                patch("src.config.route_service.time.sleep") as mock_sleep:
+            route = service.get_route("New York, NY", "Boston, MA")
+
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once()
+        assert route.total_distance == 346.0
+
+    def test_client_error_not_retried(self):
+        """Test a non-retryable 4xx fails without retrying."""
+        service = RouteService(api_key="test_key", cache_ttl=0)
+
+        with patch.object(service._session, "get", return_value=self.http_response(403)) as mock_get, \
+                patch("src.config.route_service.time.sleep") as mock_sleep:
+            with pytest.raises(RouteServiceError):
+                service.get_route("New York, NY", "Boston, MA")
+
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_decode_projects_directions(self, sample_route_data):
+        """Test decoding keeps only the fields the parser reads."""
+        service = RouteService(api_key="test_key")
+        leg = sample_route_data["routes"][0]["legs"][0]
+        sample_route_data["routes"][0]["overview_polyline"] = {"points": "abc"}
+        leg["steps"][0]["polyline"] = {"points": "def"}
+
+        data = service._decode_directions(json.dumps(sample_route_data).encode())
+
+        route = data["routes"][0]
+        assert "overview_polyline" not in route
+        assert route["summary"] == "I-95 N"
+        assert data["routes"][0]["legs"][0]["steps"][0] == {
+            "distance": {"value": 1000, "text": "1 km"},
+            "end_location": {"lat": 40.7138, "lng": -74.0050},
+            "html_instructions": "Head north on Broadway",
+            "maneuver": "straight",
+        }
+        assert service._parse_route(data, 20).total_distance == 346.0
+
+    def test_decode_rejects_invalid_json(self):
+        """Test a malformed body raises RouteServiceError."""
+        service = RouteService(api_key="test_key")
+
+        with pytest.raises(RouteServiceError):
+            service._decode_directions(b"<html>")
+
+    def test_waypoints_keep_route_order(self, sample_route_data):
+        """Test the highest-scoring steps are returned in route order."""
+        service = RouteService(api_key="test_key")
+        steps = sample_route_data["routes"][0]["legs"][0]["steps"]
+        steps.append({
+            "distance": {"value": 2000, "text": "2 km"},
+            "end_location": {"lat": 42.0, "lng": -71.5},
+            "html_instructions": "Continue straight ahead",
+        })
+
+        waypoints = service._extract_waypoints(steps, max_waypoints=2)
+
+        assert [w.location.lat for w in waypoints] == [41.0, 42.0]
+        assert [w.distance_from_start for w in waypoints] == [1.0, 51.0]
+
+    def test_waypoints_share_duplicate_locations(self):
+        """Test waypoints at the same spot and address share one Location."""
+        service = RouteService(api_key="test_key")
+        step = {
+            "distance": {"value": 5000},
+            "end_location": {"lat": 41.0, "lng": -73.5},
+            "html_instructions": "Continue on Interstate 95",
+        }
+        other = dict(step, end_location={"lat": 41.5, "lng": -73.0})
+
+        waypoints = service._extract_waypoints([step, dict(step), other], max_waypoints=3)
+
+        assert waypoints[0].location is waypoints[1].location
+        assert waypoints[2].location is not waypoints[0].location
+        assert waypoints[2].location.address is waypoints[0].location.address
+
+    def test_step_importance(self):
+        """Test maneuver and instruction keywords boost a step's score."""
+        service = RouteService(api_key="test_key")
+        step = {"maneuver": "ramp-right"}
+
+        score = service._calculate_step_importance(step, 1.5, "Take the <b>exit</b> onto Interstate 90")
+
+        assert score == 1.5 + 5.0 + 3.0 + 2.0
+
+    def test_address_from_instruction(self):
+        """Test addresses fall back to the instruction text without HTML tags."""
+        service = RouteService(api_key="test_key")
+        location = {"lat": 41.0, "lng": -73.5}
+
+        tagged = {"end_location": location, "html_instructions": "Take <b>exit 15</b> toward I-95 N"}
+        plain = {"end_location": location, "html_instructions": "Continue onto Main Street"}
+        short = {"end_location": location, "html_instructions": "<b>Go</b>"}
+
+        assert service._extract_address_from_step(tagged) == "Take exit 15 toward I-95 N"
+        assert service._extract_address_from_step(plain) == "Continue onto Main Street"
+        assert service._extract_address_from_step(short) == "41.000000, -73.500000"
+
+    def test_maneuver_mask(self):
+        """Test maneuver masks flag every matching keyword, case-insensitively."""
+        assert route_service._maneuver_mask("") == 0
+        assert route_service._maneuver_mask("straight") == 0
+        assert route_service._maneuver_mask("RAMP-right") == 0b1
+        # "roundabout-exit" matches both "exit" (bit 2) and "roundabout" (bit 4)
+        assert route_service._maneuver_mask("roundabout-exit") == 0b10100
+
+    @pytest.mark.skipif(route_service.np is None, reason="numpy not installed")
+    def test_vectorized_selection_matches_python(self):
+        """Test NumPy scoring picks the same steps as the Python loop."""
+        service = RouteService(api_key="test_key")
+        maneuvers = ["", "straight", "ramp-left", "merge", "turn-right", "fork-left", "exit"]
+        instructions = [
+            "Continue on Main St",
+            "Take <b>I-95</b> N",
+            "Keep left at the junction",
+            "Merge onto Highway 1 via the interchange",
+        ]
+        steps = [
+            {
+                "distance": {"value": (i * 7919) % 4973 + 101},  # Non-round km
+                "end_location": {"lat": float(i), "lng": 0.0},
+                "html_instructions": instructions[i % len(instructions)],
+                "maneuver": maneuvers[i % len(maneuvers)],
+            }
+            for i in range(route_service.VECTORIZE_MIN_STEPS + 50)
+        ]
+
+        expected = service._select_steps(steps, max_waypoints=12)
+
+        assert service._select_steps_vectorized(steps, max_waypoints=12) == expected
+        # Every step's distance from start matches to the last bit
+        assert service._select_steps_vectorized(steps, len(steps)) == \
+            service._select_steps(steps, len(steps))
+        assert [w.location.lat for w in service._extract_waypoints(steps, 12)] == \
+            [float(i) for i, _ in expected]
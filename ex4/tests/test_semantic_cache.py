@@ -0,0 +1,79 @@
+"""Unit tests for the similarity-keyed cache."""
+
+from src.utils.semantic_cache import SemanticCache, cosine_similarity, embed_text
+
+
+class TestEmbedding:
+    """Tests for the trigram embedder."""
+
+    def test_identical_text_similarity(self):
+        """Test text is maximally similar to itself regardless of case/spacing."""
+        a = embed_text("Times Square, New York")
+        b = embed_text("times square  new york")
+        assert abs(cosine_similarity(a, b) - 1.0) < 1e-9
+
+    def test_unrelated_text_dissimilar(self):
+        """Test unrelated addresses score low."""
+        a = embed_text("Times Square, New York")
+        b = embed_text("Golden Gate Bridge, San Francisco")
+        assert cosine_similarity(a, b) < 0.3
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache."""
+
+    def test_similar_address_hit(self):
+        """Test a near-duplicate address returns the cached value."""
+        cache = SemanticCache(max_size=8)
+        cache.put("Main Street, Springfield, IL", "choice")
+
+        assert cache.get("Main Street, Springfield IL, USA", 0.8) == "choice"
+        assert cache.get("Golden Gate Bridge, San Francisco", 0.8) is None
+
+    def test_expired_entry_missed(self):
+        """Test entries past their TTL are not returned."""
+        cache = SemanticCache(max_size=8)
+        cache.put("Boston, MA", "choice", ttl=0)
+
+        assert cache.get("Boston, MA", 0.9) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test capacity is enforced by evicting the oldest entry."""
+        cache = SemanticCache(max_size=1)
+        cache.put("Boston, MA", "boston")
+        cache.put("Chicago, IL", "chicago")
+
+        assert cache.get("Boston, MA", 0.9) is None
+        assert cache.get("Chicago, IL", 0.9) == "chicago"
+
+    def test_different_numbers_missed(self):
+        """Test addresses differing only by a number never hit."""
+        cached = "Interstate 95 North, Exit 12, New Haven, CT 06511, USA"
+        query = "Interstate 95 North, Exit 17, New Haven, CT 06511, USA"
+        cache = SemanticCache(max_size=8)
+        cache.put(cached, "exit 12")
+
+        assert cosine_similarity(embed_text(query), embed_text(cached)) > 0.9
+        assert cache.get(query, 0.9) is None
+        assert cache.get("Interstate 95 North, Exit 12, New Haven CT 06511 USA", 0.9) == "exit 12"
+
+    def test_different_state_missed(self):
+        """Test addresses differing only by state code never hit."""
+        cached = "Broadway, New York, NY"
+        query = "Broadway, New York, NJ"
+        cache = SemanticCache(max_size=8)
+        cache.put(cached, "new york")
+
+        assert cosine_similarity(embed_text(query), embed_text(cached)) >= 0.9
+        assert cache.get(query, 0.9) is None
+        assert cache.get("Broadway, New York NY", 0.9) == "new york"
+
+    def test_different_direction_missed(self):
+        """Test addresses differing only by direction never hit."""
+        cache = SemanticCache(max_size=8)
+        cache.put("North Main Street, Austin, TX", "north")
+
+        assert cache.get("South Main Street, Austin, TX", 0.8) is None
+        assert cache.get("N Main Street, Austin, TX", 0.5) is None
+        assert cache.get("north main street austin tx", 0.8) == "north"
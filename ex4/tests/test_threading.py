@@ -1,8 +1,9 @@
 """Unit tests for parallel threading functionality."""
 
+import asyncio
 import time
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from concurrent.futures import ThreadPoolExecutor
 
 from src.orchestrator import RouteGuideOrchestrator
@@ -210,6 +211,98 @@ class TestParallelExecution:
         # Verify error result was created for video
         mock_video_agent._create_error_result.assert_called_once()
 
+    def test_run_agents_preserves_order(self, mock_config, sample_agent_results):
+        """Test run_agents returns one result per agent, in agent order."""
+        orchestrator = RouteGuideOrchestrator(config=mock_config)
+
+        agents = []
+        for agent_type in ["info", "video", "music"]:
+            agent = Mock()
+            agent.execute.return_value = sample_agent_results[agent_type]
+            agents.append(agent)
+
+        results = orchestrator.run_agents("Test Address", agents)
+
+        assert [r.agent_type for r in results] == ["info", "video", "music"]
+
+    def test_run_agents_async_converts_exceptions(self, mock_config, sample_agent_results):
+        """Test run_agents_async turns a raising agent into its error result."""
+        orchestrator = RouteGuideOrchestrator(config=mock_config)
+
+        failing = Mock()
+        failing.run = AsyncMock(side_effect=Exception("Video agent failed"))
+        failing._create_error_result.return_value = AgentResult(
+            "video", "No video found", "", {}, False, "Video agent failed"
+        )
+        working = Mock()
+        working.run = AsyncMock(return_value=sample_agent_results["info"])
+
+        results = asyncio.run(
+            orchestrator.run_agents_async("Test Address", [failing, working])
+        )
+
+        assert results[0].success is False
+        assert results[1] is sample_agent_results["info"]
+        failing._create_error_result.assert_called_once_with(
+            "Test Address", "Video agent failed"
+        )
+
+    def test_prefetch_batches_waypoints(self, mock_config):
+        """Test prefetching splits waypoints into batches for every content agent."""
+        orchestrator = RouteGuideOrchestrator(config=mock_config)
+        orchestrator.batch_size = 2
+        agents = [Mock(), Mock(), Mock()]
+        orchestrator.video_agent, orchestrator.music_agent, orchestrator.info_agent = agents
+
+        orchestrator._prefetch_agent_results(["Boston, MA", "Salem, MA", "Lowell, MA"])
+
+        for agent in agents:
+            assert [c.args[0] for c in agent.execute_many.call_args_list] == [
+                ["Boston, MA", "Salem, MA"],
+                ["Lowell, MA"],
+            ]
+
+    def test_prefetch_feeds_per_waypoint_agents(self, mock_config):
+        """Test prefetched results are reused instead of calling Claude per waypoint."""
+        orchestrator = RouteGuideOrchestrator(config=mock_config)
+        claude_mock = Mock()
+        claude_mock.call.return_value = """[
+            {"title": "Historic Boston", "summary": "Old city."},
+            {"title": "Historic Salem", "summary": "Witch trials."}
+        ]"""
+        orchestrator.info_agent.claude_client = claude_mock
+        orchestrator.video_agent = Mock()
+        orchestrator.music_agent = Mock()
+
+        orchestrator._prefetch_agent_results(["Boston, MA", "Salem, MA"])
+        result = orchestrator.info_agent.execute("Salem, MA")
+
+        assert claude_mock.call.call_count == 1
+        assert result.title == "Historic Salem"
+
+    def test_process_route_async(self, mock_config, sample_route_data, sample_agent_results):
+        """Test an async route run awaits every waypoint's agents and builds stops."""
+        orchestrator = RouteGuideOrchestrator(config=mock_config)
+        orchestrator.batch_enabled = False
+        for name in ("video", "music", "info"):
+            agent = Mock()
+            agent.agent_type = name
+            agent.run = AsyncMock(return_value=sample_agent_results[name])
+            setattr(orchestrator, f"{name}_agent", agent)
+        orchestrator.choice_agent = Mock()
+        orchestrator.choice_agent.select_best.return_value = ChoiceResult(
+            "info", "Test Info", "content", "reason", {}, []
+        )
+
+        with patch.object(
+            orchestrator.route_service, "_call_directions_api", return_value=sample_route_data
+        ):
+            output = asyncio.run(orchestrator.process_route_async("New York, NY", "Boston, MA"))
+
+        assert len(output.stops) == 2
+        assert orchestrator.info_agent.run.await_count == 2
+        assert output.stops[0].choice["type"] == "info"
+
     @patch('src.orchestrator.VideoAgent')
     @patch('src.orchestrator.MusicAgent')
     @patch('src.orchestrator.InfoAgent')